@@ -0,0 +1,70 @@
+"""capture season fixtures for the benchmarks, so they can be replayed without network access
+
+python benchmarks/capture_fixtures.py --seasons 2000 2024
+python benchmarks/capture_fixtures.py --seasons all --from-cache
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+BENCHMARKS_DIR: Path = Path(__file__).parent
+FIXTURES_DIR: Path = BENCHMARKS_DIR / "fixtures"
+sys.path.insert(0, str(BENCHMARKS_DIR.parent / "src"))
+
+from api.squiggle_api import SquiggleAPI, APICacheMissError  # noqa: E402
+
+
+def fixture_path(season: int) -> Path:
+    return FIXTURES_DIR / f"{season}.json"
+
+
+async def capture_season(season: int, from_cache: bool) -> bool:
+    squiggle_api = SquiggleAPI(season)
+    if from_cache:
+        try:
+            squiggle_api.populate_results_from_cache()
+        except APICacheMissError as e:
+            print(f"{season}: skipped, {e}")
+            return False
+    else:
+        await squiggle_api.populate_results()
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    fixture_path(season).write_text(
+        squiggle_api.season_results.model_dump_json(indent=1)
+    )
+    print(f"{season}: captured to {fixture_path(season)}")
+    return True
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Capture benchmark season fixtures")
+    parser.add_argument(
+        "--seasons",
+        nargs="+",
+        required=True,
+        help="Seasons to capture, or 'all' for 1897 to today",
+    )
+    parser.add_argument(
+        "--from-cache",
+        action="store_true",
+        help="Only use previously cached API responses (.api_cache/), no network access",
+    )
+    args = parser.parse_args()
+
+    seasons: List[int]
+    if args.seasons == ["all"]:
+        seasons = list(range(1897, datetime.now().year + 1))
+    else:
+        seasons = [int(season) for season in args.seasons]
+
+    for season in seasons:
+        await capture_season(season, args.from_cache)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
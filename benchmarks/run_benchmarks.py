@@ -0,0 +1,248 @@
+"""replay season fixtures through the solver and record how it went, optionally comparing against
+a saved baseline so regressions get caught (and optimisations can be proven)
+
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BENCHMARKS_DIR: Path = Path(__file__).parent
+FIXTURES_DIR: Path = BENCHMARKS_DIR / "fixtures"
+sys.path.insert(0, str(BENCHMARKS_DIR.parent / "src"))
+# generated seasons benchmarked when there are no captured fixtures (and no --synthetic), so the
+# harness still runs from a fresh clone
+FALLBACK_SYNTHETIC_NTEAMS: List[int] = [12, 16]
+FALLBACK_SYNTHETIC_MODELS: List[str] = ["uniform", "strength", "split"]
+
+from algo import DFS, SOLVERS  # noqa: E402
+from models import SeasonResults, SyntheticSeason  # noqa: E402
+
+
+def load_fixtures(
+    fixtures_dir: Path = FIXTURES_DIR, seasons: Optional[List[int]] = None
+) -> Dict[str, SeasonResults]:
+    """fixtures are keyed by name (the file stem), normally just the season"""
+    fixtures: Dict[str, SeasonResults] = {}
+    for fixture_file in sorted(fixtures_dir.glob("*.json")):
+        season_results = SeasonResults.model_validate_json(fixture_file.read_text())
+        if seasons and season_results.season not in seasons:
+            continue
+        fixtures[fixture_file.stem] = season_results
+    return fixtures
+
+
+def synthetic_fixtures(
+    nteams_list: List[int],
+    win_models: List[str],
+    fixture: str = "round_robin",
+    nrounds: Optional[int] = None,
+    seed: int = 0,
+) -> Dict[str, SeasonResults]:
+    """generated seasons, for team counts real seasons never reach"""
+    fixtures: Dict[str, SeasonResults] = {}
+    for nteams in nteams_list:
+        for win_model in win_models:
+            synthetic_season = SyntheticSeason(
+                nteams=nteams,
+                nrounds=nrounds,
+                fixture=fixture,  # type: ignore[arg-type]
+                win_model=win_model,  # type: ignore[arg-type]
+                seed=seed,
+            )
+            fixtures[synthetic_season.name] = synthetic_season.generate()
+    return fixtures
+
+
+def _solve(season_results: SeasonResults, solver: str = "dfs") -> DFS:
+    # a fresh copy each time, nothing carried over between runs
+    dfs = SOLVERS[solver](season_results.model_copy(deep=True), resume=False)
+    dfs.process_season(save_output=False)
+    return dfs
+
+
+def benchmark_season(
+    season_results: SeasonResults, repeat: int = 3, solver: str = "dfs"
+) -> Dict[str, Any]:
+    """best wall time of the repeats, with the peak memory measured in a separate run as
+    tracemalloc slows everything down"""
+    wall_times: List[float] = []
+    dfs: Optional[DFS] = None
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        dfs = _solve(season_results, solver)
+        wall_times.append(time.perf_counter() - start)
+    assert dfs is not None
+
+    tracemalloc.start()
+    _solve(season_results, solver)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    first_hamiltonian_cycle = dfs.traversal_output.first_hamiltonian_cycle
+    return {
+        "season": season_results.season,
+        "nteams": season_results.nteams,
+        "wall_time": min(wall_times),
+        "dfs_steps": dfs.dfs_steps,
+        "skipped_steps": dfs.skipped_steps,
+        "full_paths_not_hamiltonian": dfs.full_paths_not_hamiltonian,
+        "peak_memory_bytes": peak_memory,
+        "cycle_date": str(first_hamiltonian_cycle.max_date)
+        if first_hamiltonian_cycle
+        else None,
+    }
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    time_tolerance: float = 0.25,
+) -> List[str]:
+    """list of regressions: a different answer, more dfs steps, or slower beyond tolerance.
+    Wall time is noisy so only flagged past the tolerance, dfs steps are deterministic"""
+    regressions: List[str] = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        if result["cycle_date"] != base["cycle_date"]:
+            regressions.append(
+                f"{name}: cycle date {result['cycle_date']} != baseline {base['cycle_date']}"
+            )
+        if result["dfs_steps"] > base["dfs_steps"]:
+            regressions.append(
+                f"{name}: dfs steps {result['dfs_steps']} > baseline {base['dfs_steps']}"
+            )
+        if result["wall_time"] > base["wall_time"] * (1 + time_tolerance):
+            regressions.append(
+                f"{name}: wall time {result['wall_time']:.3f}s > baseline {base['wall_time']:.3f}s"
+            )
+    return regressions
+
+
+def _print_results(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> None:
+    print(
+        f"{'fixture':<36} {'teams':>5} {'wall (s)':>10} {'vs base':>8} {'dfs steps':>12} "
+        f"{'skipped':>10} {'peak mem':>10}  cycle date"
+    )
+    for name, result in results.items():
+        vs_base: str = ""
+        if name in baseline and baseline[name]["wall_time"]:
+            vs_base = f"{result['wall_time'] / baseline[name]['wall_time']:.2f}x"
+        print(
+            f"{name:<36} {result['nteams']:>5} {result['wall_time']:>10.3f} {vs_base:>8} "
+            f"{result['dfs_steps']:>12} {result['skipped_steps']:>10} "
+            f"{result['peak_memory_bytes'] / 1024**2:>8.1f}MB  {result['cycle_date']}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Solver benchmarks")
+    parser.add_argument("--seasons", nargs="+", type=int, help="Only these seasons")
+    parser.add_argument(
+        "--fixtures-dir",
+        type=Path,
+        default=FIXTURES_DIR,
+        help="Directory of season fixtures (see capture_fixtures.py)",
+    )
+    parser.add_argument(
+        "--synthetic",
+        nargs="+",
+        type=int,
+        metavar="NTEAMS",
+        help="Also benchmark generated seasons with these numbers of teams",
+    )
+    parser.add_argument(
+        "--synthetic-model",
+        nargs="+",
+        default=["uniform"],
+        choices=["uniform", "strength", "ladder", "split"],
+        help="Win-probability model(s) for the generated seasons",
+    )
+    parser.add_argument(
+        "--synthetic-fixture",
+        default="round_robin",
+        choices=["round_robin", "random"],
+        help="Fixture pattern for the generated seasons",
+    )
+    parser.add_argument(
+        "--synthetic-rounds",
+        type=int,
+        help="Rounds in the generated seasons (default a single round robin)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Generated season seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per fixture")
+    parser.add_argument(
+        "--solver", default="dfs", choices=sorted(SOLVERS), help="Solver to benchmark"
+    )
+    parser.add_argument(
+        "--save-baseline", type=Path, help="Write results as a baseline"
+    )
+    parser.add_argument("--compare", type=Path, help="Compare results to a baseline")
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.25,
+        help="Fraction slower than baseline before flagged as a regression",
+    )
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures_dir, args.seasons)
+    if args.synthetic:
+        fixtures.update(
+            synthetic_fixtures(
+                args.synthetic,
+                args.synthetic_model,
+                args.synthetic_fixture,
+                args.synthetic_rounds,
+                args.seed,
+            )
+        )
+    if not fixtures:
+        print(
+            f"No fixtures found in {args.fixtures_dir} (see capture_fixtures.py), "
+            f"benchmarking generated seasons instead"
+        )
+        fixtures = synthetic_fixtures(
+            FALLBACK_SYNTHETIC_NTEAMS, FALLBACK_SYNTHETIC_MODELS, seed=args.seed
+        )
+
+    results: Dict[str, Dict[str, Any]] = {
+        name: benchmark_season(season_results, args.repeat, args.solver)
+        for name, season_results in fixtures.items()
+    }
+
+    baseline: Dict[str, Dict[str, Any]] = {}
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+
+    _print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.compare:
+        regressions = compare_to_baseline(results, baseline, args.time_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,12 +7,14 @@ SCRIPT_DIR="$(dirname "$(realpath "$0")")"
 CURRENT_YEAR=$(date +"%Y")
 SEASON=$CURRENT_YEAR
 DEBUG=""
+WATCH=""
 
 # parse bash arguments if provided
 while [ "$#" -gt 0 ]; do
     case $1 in
         -s|--season) SEASON="$2"; shift ;;
         -d|--debug) DEBUG="--DEBUG" ;;
+        -w|--watch) WATCH="--watch" ;;
         *) echo "Unknown parameter passed: $1"; exit 1 ;;
     esac
     shift
@@ -20,7 +22,7 @@ done
 
 # run
 cd "$SCRIPT_DIR/../src"
-uv run --no-dev -q main.py --season "$SEASON" $DEBUG
+uv run --no-dev -q main.py --season "$SEASON" $DEBUG $WATCH
 
 # universal read/write perms on output
 chmod -R ugo+rw /afl-parity/output
@@ -1,4 +1,30 @@
+from .cancellation import CancellationToken, SearchCancelledError
+from .chronological_sweep import ChronologicalSweep
+from .cycle_counter import CycleCounter
 from .dfs import DFS
+from .meet_in_the_middle import MeetInTheMiddle
+from .parity_projection import ParityProjection
+from .top_cycles import TopCycles
+from .what_if_engine import WhatIfEngine
+from typing import Dict, Type
 
+# --solver choices, all giving the same output
+SOLVERS: Dict[str, Type[DFS]] = {
+    "dfs": DFS,
+    "mitm": MeetInTheMiddle,
+    "sweep": ChronologicalSweep,
+}
 
-__all__ = ["DFS"]
+
+__all__ = [
+    "CancellationToken",
+    "ChronologicalSweep",
+    "CycleCounter",
+    "DFS",
+    "MeetInTheMiddle",
+    "ParityProjection",
+    "SOLVERS",
+    "SearchCancelledError",
+    "TopCycles",
+    "WhatIfEngine",
+]
@@ -0,0 +1,22 @@
+import threading
+
+
+class SearchCancelledError(Exception):
+    """the search was cancelled before it could finish, what was left to search has been
+    checkpointed so the next run carries on from there"""
+
+
+class CancellationToken:
+    """thread safe flag for asking a running search to stop. The search only looks at it every
+    so many steps (same as the time budget), so stopping is quick but not instant. Once
+    cancelled it stays cancelled"""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
@@ -0,0 +1,83 @@
+from algo.dfs import DFS
+from algo.cancellation import SearchCancelledError
+from algo.data_structures import AdjacencyGraph, EdgeDateIndex, GameTimeline
+from models import GameResult
+from datetime import datetime
+from typing import List, Optional
+
+
+class ChronologicalSweep(DFS):
+    """adds the season's games one at a time in date order rather than a round at a time.
+
+    Before a game is added the graph has already been proven to have no hamiltonian cycle, so
+    any cycle after it must go through the new game's edge, and can't finish any earlier than
+    its date. Only cycles through that edge are searched, and the first one found is the first
+    hamiltonian cycle of the season, exactly, without the early exit guesswork or searching the
+    whole round's graph. The graph before every team has won and lost is taken from the
+    timeline's snapshot as it stood then, in one go.
+
+    Same output as DFS, but there are no round checkpoints so there is no time budget either.
+    A cancelled sweep starts over
+    """
+
+    SOLVER_VERSION: str = f"{DFS.SOLVER_VERSION}-sweep"
+
+    def process_season(self, save_output: bool = True) -> None:
+        if self.time_budget:
+            raise ValueError("chronological sweep can't be given a time budget")
+
+        timeline: GameTimeline = GameTimeline.from_season(self.season_results)
+        earliest_cycle_date: Optional[datetime] = EdgeDateIndex.from_season(
+            self.season_results
+        ).earliest_cycle_date(self.season_results.team_ids)
+        if earliest_cycle_date:
+            self.logger.info(
+                f"No Hamiltonian Cycle possible before {earliest_cycle_date}"
+            )
+        self.adjacency_graph = AdjacencyGraph()
+        self.edge_dates = EdgeDateIndex()
+        games: List[GameResult] = list(timeline)
+        if earliest_cycle_date:
+            # the games before then can't make a cycle, the graph as it stood is built in one go
+            with self.metrics.stage("graph_build"):
+                self.adjacency_graph = timeline.adjacency_graph_at(earliest_cycle_date)
+                self.edge_dates = timeline.edge_dates_at(earliest_cycle_date)
+            games = timeline.games_from(earliest_cycle_date)
+
+        for game in games:
+            with self.metrics.stage("graph_build", round=game.round):
+                new_edges = self._add_games_to_adjacency_graph([game])
+            if not new_edges or not earliest_cycle_date:
+                # (without an earliest date the games are only added, for new games later)
+                continue
+            if self._stop_requested():
+                break
+            if not self._propagate_forced_edges():
+                continue
+            winner, loser = new_edges[0]
+            if loser not in self.search_successors.get(winner, set()):
+                # propagation has already ruled the new game out of any cycle
+                continue
+
+            # every edge is on or before this game, so any cycle found is the first
+            self.early_exit = False
+            self.early_exit_date = game.date
+            self.thread_pairs = [[winner, loser]]
+            with self.metrics.stage("solve", round=game.round):
+                self._find_hamiltonian_cycles(
+                    cur_round=game.round, expand_thread_pairs=False
+                )
+            if self.early_exit or self.stopping:
+                break
+
+        self._record_round_outcome()
+        if self.cancelled and not self.early_exit:
+            self.logger.info(f"Season {self.season_results.season} sweep cancelled")
+            raise SearchCancelledError(
+                f"Season {self.season_results.season} sweep cancelled"
+            )
+        self.traversal_output.proven_optimal = True
+        self._record_top_cycles()
+
+        if save_output:
+            self._save_output_to_file()
@@ -0,0 +1,145 @@
+from typing import Dict, List, Optional, Sequence, Set
+
+
+class ConstraintPropagation:
+    """shrinks a graph down to the edges a hamiltonian cycle could actually use, before (and
+    during) the search.
+
+    A team with a single win left has to use it in any cycle, so nobody else's win over that
+    loser can be used - and the same the other way for a team with a single loss. Edges forced
+    like this link up into chains, and the end of a chain can't go straight back to its start
+    unless the chain is every team. Applied over and over until nothing changes, and if a team
+    runs out of wins or losses, or forced edges close off a cycle short of every team, there is
+    no cycle at all
+    """
+
+    @staticmethod
+    def _remove_edge(
+        successors: Dict[int, Set[int]],
+        predecessors: Dict[int, Set[int]],
+        winner: int,
+        loser: int,
+    ) -> None:
+        successors[winner].discard(loser)
+        predecessors[loser].discard(winner)
+
+    @staticmethod
+    def _forced_chains_ok(
+        team_ids: List[int],
+        successors: Dict[int, Set[int]],
+        predecessors: Dict[int, Set[int]],
+    ) -> Optional[bool]:
+        """walk the chains of forced edges, removing the edge that would close each one early.
+        Returns True if anything was removed, None if the forced edges already close a cycle
+        short of every team (or make a path of every team that can't be closed)"""
+        forced_next: Dict[int, int] = {
+            team: next(iter(successors[team]))
+            for team in team_ids
+            if len(successors[team]) == 1
+        }
+        forced_targets: Set[int] = set(forced_next.values())
+        if len(forced_targets) < len(forced_next):
+            # two teams both forced into the same loser, it can't be entered twice
+            return None
+        nteams: int = len(team_ids)
+        removed: bool = False
+        walked: Set[int] = set()
+
+        for head in forced_next:
+            if head in forced_targets:
+                continue
+            tail: int = head
+            chain_length: int = 1
+            chain: Set[int] = {head}
+            while tail in forced_next:
+                walked.add(tail)
+                tail = forced_next[tail]
+                if tail in chain:
+                    # the chain runs into a loop of forced edges that leaves out its head
+                    return None
+                chain.add(tail)
+                chain_length += 1
+            if chain_length == nteams:
+                if head not in successors[tail]:
+                    return None
+            elif head in successors[tail]:
+                ConstraintPropagation._remove_edge(successors, predecessors, tail, head)
+                removed = True
+
+        # anything not reached from a chain head is on a loop of forced edges
+        for team in forced_next:
+            if team in walked:
+                continue
+            loop_length: int = 0
+            cur_team: int = team
+            while cur_team not in walked:
+                walked.add(cur_team)
+                cur_team = forced_next[cur_team]
+                loop_length += 1
+            if loop_length < nteams:
+                return None
+        return removed
+
+    @staticmethod
+    def propagate(
+        team_ids: List[int],
+        successors: Dict[int, Set[int]],
+        path: Sequence[int] = (),
+    ) -> Optional[Dict[int, Set[int]]]:
+        """the edges (winner -> losers) left once everything forced has been followed through,
+        None if no hamiltonian cycle is possible. The edges along path (a search's path so far)
+        are forced to start with. successors is left as is"""
+        reduced: Dict[int, Set[int]] = {
+            team: set(successors.get(team, ())) for team in team_ids
+        }
+        predecessors: Dict[int, Set[int]] = {team: set() for team in team_ids}
+        for winner, losers in reduced.items():
+            for loser in losers:
+                predecessors[loser].add(winner)
+
+        for winner, loser in zip(path, path[1:]):
+            if loser not in reduced[winner]:
+                return None
+            for other_loser in list(reduced[winner]):
+                if other_loser != loser:
+                    ConstraintPropagation._remove_edge(
+                        reduced, predecessors, winner, other_loser
+                    )
+
+        changed: bool = True
+        while changed:
+            changed = False
+            for team in team_ids:
+                if not reduced[team] or not predecessors[team]:
+                    return None
+
+            for winner in team_ids:
+                if len(reduced[winner]) == 1:
+                    # the only win left, the loser cant be beaten by anyone else
+                    forced_loser: int = next(iter(reduced[winner]))
+                    for other_winner in list(predecessors[forced_loser]):
+                        if other_winner != winner:
+                            ConstraintPropagation._remove_edge(
+                                reduced, predecessors, other_winner, forced_loser
+                            )
+                            changed = True
+
+            for loser in team_ids:
+                if len(predecessors[loser]) == 1:
+                    # the only loss left, the winner cant beat anyone else
+                    winner = next(iter(predecessors[loser]))
+                    for other_loser in list(reduced[winner]):
+                        if other_loser != loser:
+                            ConstraintPropagation._remove_edge(
+                                reduced, predecessors, winner, other_loser
+                            )
+                            changed = True
+
+            chains = ConstraintPropagation._forced_chains_ok(
+                team_ids, reduced, predecessors
+            )
+            if chains is None:
+                return None
+            changed = changed or chains
+
+        return reduced
@@ -0,0 +1,109 @@
+from algo.constraint_propagation import ConstraintPropagation
+from algo.data_structures import HamiltonianCycleCounts
+from models import SeasonResults
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+
+class CycleCounter:
+    """counts the distinct hamiltonian cycles of a graph exactly, without ever building one.
+
+    Every cycle goes through the start team, so counting cycles is counting the paths out of
+    it that visit every team and can get back. Paths are only counted, by (teams visited, team
+    at the end) - a layer per path length - so however many millions of cycles there are it's
+    at most 2^(n-1) * n counts. The graph is shrunk by constraint propagation first, which
+    only removes edges no cycle can use. Counts are python ints so always exact, or kept modulo
+    modulus if given
+    """
+
+    @staticmethod
+    def count(
+        team_ids: List[int],
+        successors: Dict[int, Set[int]],
+        modulus: Optional[int] = None,
+    ) -> int:
+        """number of distinct directed hamiltonian cycles (rotations of a cycle are the same
+        cycle)"""
+        if len(team_ids) < 2:
+            return 0
+        reduced = ConstraintPropagation.propagate(team_ids, successors)
+        if reduced is None:
+            return 0
+
+        team_index: Dict[int, int] = {teamid: i for i, teamid in enumerate(team_ids)}
+        nteams: int = len(team_ids)
+        successor_masks: List[int] = [0] * nteams
+        for winner, losers in reduced.items():
+            for loser in losers:
+                successor_masks[team_index[winner]] |= 1 << team_index[loser]
+        # start from the team with the fewest wins left, so the first layers are small
+        start: int = min(range(nteams), key=lambda i: successor_masks[i].bit_count())
+
+        # (teams visited) -> {team at the end: paths}
+        layer: Dict[int, Dict[int, int]] = {1 << start: {start: 1}}
+        for _ in range(nteams - 1):
+            next_layer: Dict[int, Dict[int, int]] = {}
+            for visited, ends in layer.items():
+                for end, paths in ends.items():
+                    following: int = successor_masks[end] & ~visited
+                    while following:
+                        low_bit: int = following & -following
+                        following ^= low_bit
+                        next_ends = next_layer.setdefault(visited | low_bit, {})
+                        team: int = low_bit.bit_length() - 1
+                        next_paths: int = next_ends.get(team, 0) + paths
+                        next_ends[team] = (
+                            next_paths % modulus if modulus else next_paths
+                        )
+            layer = next_layer
+
+        cycles: int = 0
+        for ends in layer.values():
+            for end, paths in ends.items():
+                if successor_masks[end] >> start & 1:
+                    cycles += paths
+        return cycles % modulus if modulus else cycles
+
+    @staticmethod
+    def count_season(
+        season_results: SeasonResults, modulus: Optional[int] = None
+    ) -> HamiltonianCycleCounts:
+        """the count after every round, a round adding no new edges has the same count as the
+        one before it"""
+        team_ids: List[int] = season_results.team_ids
+        successors: Dict[int, Set[int]] = {team: set() for team in team_ids}
+        counts = HamiltonianCycleCounts(season=season_results.season, modulus=modulus)
+        count: int = 0
+        for round_results in season_results:
+            new_edges: bool = False
+            for game in round_results:
+                if (
+                    game.winnerteamid
+                    and game.loserteamid
+                    and game.loserteamid not in successors[game.winnerteamid]
+                ):
+                    successors[game.winnerteamid].add(game.loserteamid)
+                    new_edges = True
+            if new_edges and all(successors.values()):
+                count = CycleCounter.count(team_ids, successors, modulus)
+            counts.round_counts[round_results.round] = count
+        counts.season_end = count
+        return counts
+
+    @staticmethod
+    def output_file(season: int) -> Path:
+        project_root: Path = Path(__file__).parents[2]  # yueck
+        return (
+            project_root
+            / "output"
+            / str(season)
+            / f"{season}_hamiltonian_cycle_counts.json"
+        )
+
+    @staticmethod
+    def save_counts(counts: HamiltonianCycleCounts) -> Path:
+        output_file: Path = CycleCounter.output_file(counts.season)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            f.write(counts.model_dump_json(indent=2))
+        return output_file
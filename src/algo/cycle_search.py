@@ -0,0 +1,168 @@
+from algo.constraint_propagation import ConstraintPropagation
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+# (games added to a sweep's starting graph) -> the hamiltonian cycle they make, if any
+CycleCache = Dict[FrozenSet[Tuple[int, int]], Optional[List[int]]]
+
+
+class CycleSearch:
+    """finds a hamiltonian cycle that has to use one particular game (edge).
+
+    Once the graph without that edge has been proven to have no hamiltonian cycle, a cycle
+    through the edge is the only kind that can be new, so adding a game only needs this much
+    smaller search rather than the whole graph again. Teams are bitmasks of their indexes, a
+    path is only extended while every team left can still be both entered and left, and dead
+    ends (teams visited, team at) are remembered so they are never walked twice
+    """
+
+    @staticmethod
+    def through_edge(
+        team_ids: List[int],
+        successors: Dict[int, Set[int]],
+        winner: int,
+        loser: int,
+    ) -> Optional[List[int]]:
+        """a hamiltonian cycle (starting at winner) that uses winner -> loser, None if there
+        isn't one. successors is left as is"""
+        cycles = CycleSearch.cycles_through_edge(team_ids, successors, winner, loser, 1)
+        return cycles[0] if cycles else None
+
+    @staticmethod
+    def cycles_through_edge(
+        team_ids: List[int],
+        successors: Dict[int, Set[int]],
+        winner: int,
+        loser: int,
+        limit: int,
+    ) -> List[List[int]]:
+        """up to limit distinct hamiltonian cycles (each starting at winner) that use
+        winner -> loser. Every cycle through the edge can only be walked the one way from it,
+        so none is found twice"""
+        reduced = ConstraintPropagation.propagate(team_ids, successors, (winner, loser))
+        if reduced is None or limit <= 0:
+            return []
+
+        team_index: Dict[int, int] = {teamid: i for i, teamid in enumerate(team_ids)}
+        nteams: int = len(team_ids)
+        successor_lists: List[List[int]] = [[] for _ in team_ids]
+        successor_masks: List[int] = [0] * nteams
+        predecessor_masks: List[int] = [0] * nteams
+        for team_winner, team_losers in reduced.items():
+            w: int = team_index[team_winner]
+            for team_loser in sorted(team_losers):
+                lo: int = team_index[team_loser]
+                successor_lists[w].append(lo)
+                successor_masks[w] |= 1 << lo
+                predecessor_masks[lo] |= 1 << w
+
+        start: int = team_index[winner]
+        all_teams: int = (1 << nteams) - 1
+        path: List[int] = [start, team_index[loser]]
+        cycles: List[List[int]] = []
+        # (teams visited, team at) with no way of finishing a cycle from there
+        dead_ends: Set[Tuple[int, int]] = set()
+
+        def extend(cur: int, visited: int) -> bool:
+            """True if any cycle was finished from here"""
+            if visited == all_teams:
+                if successor_masks[cur] >> start & 1:
+                    cycles.append([team_ids[i] for i in path])
+                    return True
+                return False
+            if (visited, cur) in dead_ends:
+                return False
+            unvisited: int = all_teams & ~visited
+            # every team still to come has to be entered from one still to come (or here),
+            # and leave to one still to come (or back to the start)
+            entries: int = unvisited | 1 << cur
+            exits: int = unvisited | 1 << start
+            team: int = unvisited
+            while team:
+                low_bit: int = team & -team
+                i: int = low_bit.bit_length() - 1
+                if not (predecessor_masks[i] & entries and successor_masks[i] & exits):
+                    dead_ends.add((visited, cur))
+                    return False
+                team ^= low_bit
+            finished: bool = False
+            for following in successor_lists[cur]:
+                if visited >> following & 1:
+                    continue
+                path.append(following)
+                finished = extend(following, visited | 1 << following) or finished
+                path.pop()
+                if len(cycles) >= limit:
+                    return True
+            if not finished:
+                dead_ends.add((visited, cur))
+            return finished
+
+        extend(path[1], 1 << start | 1 << path[1])
+        return cycles
+
+
+class CycleSweep:
+    """a graph built up a game at a time, starting from one already proven to have no
+    hamiltonian cycle. Each game adding a new edge only needs a search for cycles through that
+    edge. Graphs already searched are looked up in the cache instead, which can be shared by
+    every sweep from the same starting graph (ie. the samples of a projection)"""
+
+    MAX_CACHE_SIZE: int = 200_000
+
+    def __init__(
+        self,
+        team_ids: List[int],
+        successors: Optional[Dict[int, Set[int]]] = None,
+        cache: Optional[CycleCache] = None,
+    ) -> None:
+        self.team_ids = team_ids
+        self.successors: Dict[int, Set[int]] = {
+            team: set((successors or {}).get(team, ())) for team in team_ids
+        }
+        self.cache: CycleCache = cache if cache is not None else {}
+        self.added: Set[Tuple[int, int]] = set()
+        self.without_win: Set[int] = {
+            team for team in team_ids if not self.successors[team]
+        }
+        self.without_loss: Set[int] = set(team_ids).difference(
+            *self.successors.values()
+        )
+        self.cache_hits: int = 0
+        self.searches: int = 0
+
+    def cycle_with(self, winner: int, loser: int) -> Optional[List[int]]:
+        """the hamiltonian cycle winner beating loser would make, without adding the game"""
+        if loser in self.successors[winner]:
+            # nothing new, and the graph as it is has no cycle
+            return None
+        if self.without_win - {winner} or self.without_loss - {loser}:
+            return None
+
+        key: FrozenSet[Tuple[int, int]] = frozenset(self.added | {(winner, loser)})
+        if key in self.cache:
+            self.cache_hits += 1
+            return self.cache[key]
+        self.searches += 1
+        self.successors[winner].add(loser)
+        try:
+            cycle = CycleSearch.through_edge(
+                self.team_ids, self.successors, winner, loser
+            )
+        finally:
+            self.successors[winner].discard(loser)
+        if len(self.cache) >= self.MAX_CACHE_SIZE:
+            self.cache.clear()
+        self.cache[key] = cycle
+        return cycle
+
+    def add_game(self, winner: int, loser: int) -> Optional[List[int]]:
+        """add the game, returning the hamiltonian cycle it makes (if any). Once there is one
+        the sweep is done, nothing more can be added"""
+        if loser in self.successors[winner]:
+            return None
+        cycle: Optional[List[int]] = self.cycle_with(winner, loser)
+        self.successors[winner].add(loser)
+        self.added.add((winner, loser))
+        self.without_win.discard(winner)
+        self.without_loss.discard(loser)
+        return cycle
@@ -1,6 +1,25 @@
 from .adjacency_graph import AdjacencyGraph, AdjacencyList
 from .hamiltonian_cycle import HamiltonianCycle
+from .hamiltonian_cycle_counts import HamiltonianCycleCounts
 from .dfs_traversal_output import DFSTraversalOutput
+from .progress_snapshot import ProgressSnapshot
+from .dfs_checkpoint import DFSCheckpoint
+from .edge_date_index import EdgeDateIndex
+from .game_timeline import GameTimeline
+from .parity_projection_output import ParityProjectionOutput
+from .what_if_result import WhatIfResult
 
 
-__all__ = ["AdjacencyGraph", "AdjacencyList", "HamiltonianCycle", "DFSTraversalOutput"]
+__all__ = [
+    "AdjacencyGraph",
+    "AdjacencyList",
+    "HamiltonianCycle",
+    "HamiltonianCycleCounts",
+    "DFSTraversalOutput",
+    "DFSCheckpoint",
+    "EdgeDateIndex",
+    "GameTimeline",
+    "ParityProjectionOutput",
+    "ProgressSnapshot",
+    "WhatIfResult",
+]
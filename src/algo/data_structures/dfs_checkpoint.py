@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+
+class DFSCheckpoint(BaseModel):
+    """where a search was up to when its time budget ran out, enough to pick it back up.
+    frontier holds the path prefixes still to be searched in that round (None if the round
+    was never started), input_hash covers the games up to that round so any change to those
+    invalidates the checkpoint, later rounds being added doesnt"""
+
+    season: int
+    solver_version: str
+    round: int
+    input_hash: str
+    early_exit_date: Optional[datetime] = None
+    frontier: Optional[List[List[int]]] = None
+    best_cycle: Optional[List[int]] = None
+    dfs_steps: int = 0
+    skipped_steps: int = 0
+    full_paths_not_hamiltonian: int = 0
+    hamiltonian_cycles_found: int = 0
@@ -1,6 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
-import json
+from pydantic import BaseModel, SerializerFunctionWrapHandler, model_serializer
+from typing import Any, Dict, List, Optional
 from algo.data_structures import HamiltonianCycle
 
 
@@ -8,9 +7,14 @@ class DFSTraversalOutput(BaseModel):
     total_dfs_steps: int = 0
     total_skipped_steps: int = 0
     early_exit: bool = False
+    # False when the time budget ran out, the cycle (if any) is the best found so far
+    proven_optimal: bool = True
     total_full_paths_not_hamiltonian: int = 0
     total_hamiltonian_cycles: int = 0
     first_hamiltonian_cycle: Optional[HamiltonianCycle] = None
+    # the k earliest distinct cycles (first_hamiltonian_cycle's date first) with --top-cycles,
+    # only when proven_optimal, left out of the output otherwise
+    top_hamiltonian_cycles: List[HamiltonianCycle] = []
 
     def update_first_hamiltonian_cycle(self, new_cycle: HamiltonianCycle) -> None:
         """update the hamiltonian cycle object only if its newer"""
@@ -23,10 +27,12 @@ class DFSTraversalOutput(BaseModel):
     def __str__(self) -> str:
         return f"total_dfs_steps={self.total_dfs_steps} total_full_paths_not_hamiltonian={self.total_full_paths_not_hamiltonian}"
 
-    def model_dump_json(self) -> str:  # type: ignore[override]
-        data = self.model_dump()
-        if self.first_hamiltonian_cycle:
-            data["first_hamiltonian_cycle"] = json.loads(
-                self.first_hamiltonian_cycle.model_dump_json()
-            )
-        return json.dumps(data, default=str)
+    @model_serializer(mode="wrap")
+    def _without_empty_top_cycles(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> Dict[str, Any]:
+        """outputs without --top-cycles stay as they always were"""
+        data: Dict[str, Any] = handler(self)
+        if not data.get("top_hamiltonian_cycles"):
+            data.pop("top_hamiltonian_cycles", None)
+        return data
@@ -0,0 +1,81 @@
+from bisect import insort
+from datetime import datetime
+from typing import Container, Dict, Iterable, List, Optional, Tuple
+from models import GameResult, SeasonResults
+
+
+class EdgeDateIndex:
+    """the first game for every winner-loser pair, along with each team's wins and losses in
+    date order. Lets the search look up an edge's game without scanning the season, and find a
+    team's earliest win (or loss) against a set of teams by walking from the front of a list.
+    Plain class rather than a model as it is read on every dfs step"""
+
+    def __init__(self, games: Iterable[GameResult] = ()) -> None:
+        self.first_games: Dict[Tuple[int, int], GameResult] = {}
+        # (date, opponent) sorted by date, only the first game against each opponent
+        self.wins: Dict[int, List[Tuple[datetime, int]]] = {}
+        self.losses: Dict[int, List[Tuple[datetime, int]]] = {}
+        for game in games:
+            self.add_game(game)
+
+    @classmethod
+    def from_season(
+        cls, season_results: SeasonResults, upto_round: Optional[int] = None
+    ) -> "EdgeDateIndex":
+        """every game of the season, or only up to (and incl.) a round"""
+        return cls(
+            game
+            for round_results in season_results
+            for game in round_results
+            if upto_round is None or game.round <= upto_round
+        )
+
+    def add_game(self, game: GameResult) -> None:
+        """only the earliest game between a winner and loser is kept, draws are ignored"""
+        if not (game.winnerteamid and game.loserteamid):
+            return
+        edge: Tuple[int, int] = (game.winnerteamid, game.loserteamid)
+        first_game: Optional[GameResult] = self.first_games.get(edge)
+        if first_game:
+            if game.date >= first_game.date:
+                return
+            # a late arriving result from earlier on, takes the place of the one kept
+            self.wins[game.winnerteamid].remove((first_game.date, game.loserteamid))
+            self.losses[game.loserteamid].remove((first_game.date, game.winnerteamid))
+        self.first_games[edge] = game
+        insort(
+            self.wins.setdefault(game.winnerteamid, []), (game.date, game.loserteamid)
+        )
+        insort(
+            self.losses.setdefault(game.loserteamid, []),
+            (game.date, game.winnerteamid),
+        )
+
+    def first_game(self, winner: int, loser: int) -> Optional[GameResult]:
+        return self.first_games.get((winner, loser))
+
+    def earliest_win(self, team: int, against: Container[int]) -> Optional[datetime]:
+        """date of the team's first win over any of the teams, None if there is none"""
+        for date, loser in self.wins.get(team, []):
+            if loser in against:
+                return date
+        return None
+
+    def earliest_loss(self, team: int, against: Container[int]) -> Optional[datetime]:
+        """date of the team's first loss to any of the teams, None if there is none"""
+        for date, winner in self.losses.get(team, []):
+            if winner in against:
+                return date
+        return None
+
+    def earliest_cycle_date(self, team_ids: Iterable[int]) -> Optional[datetime]:
+        """no hamiltonian cycle can finish before every team has both won and lost a game, None
+        if some team never does"""
+        cycle_date: Optional[datetime] = None
+        for team in team_ids:
+            if not self.wins.get(team) or not self.losses.get(team):
+                return None
+            team_date: datetime = max(self.wins[team][0][0], self.losses[team][0][0])
+            if cycle_date is None or team_date > cycle_date:
+                cycle_date = team_date
+        return cycle_date
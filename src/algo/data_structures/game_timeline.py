@@ -0,0 +1,59 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterable, Iterator, List
+from algo.data_structures import AdjacencyGraph, EdgeDateIndex
+from models import GameResult, SeasonResults
+
+
+class GameTimeline:
+    """every decided game of a season in date order (draws are never an edge, so are left
+    out). The dates are kept in their own sorted list so the games up to any moment are found
+    by bisecting, and the graph as it stood then built from just those. Plain class, same as
+    EdgeDateIndex"""
+
+    def __init__(self, games: Iterable[GameResult] = ()) -> None:
+        self.games: List[GameResult] = []
+        self.dates: List[datetime] = []
+        for game in games:
+            self.add_game(game)
+
+    @classmethod
+    def from_season(cls, season_results: SeasonResults) -> "GameTimeline":
+        return cls(game for round_results in season_results for game in round_results)
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def __iter__(self) -> Iterator[GameResult]:
+        return iter(self.games)
+
+    def add_game(self, game: GameResult) -> None:
+        """games on the same date stay in the order they were added"""
+        if not (game.winnerteamid and game.loserteamid):
+            return
+        index: int = bisect_right(self.dates, game.date)
+        self.dates.insert(index, game.date)
+        self.games.insert(index, game)
+
+    def index_at(self, timestamp: datetime) -> int:
+        """how many games there are before the timestamp"""
+        return bisect_left(self.dates, timestamp)
+
+    def games_before(self, timestamp: datetime) -> List[GameResult]:
+        return self.games[: self.index_at(timestamp)]
+
+    def games_from(self, timestamp: datetime) -> List[GameResult]:
+        """every game on or after the timestamp"""
+        return self.games[self.index_at(timestamp) :]
+
+    def adjacency_graph_at(self, timestamp: datetime) -> AdjacencyGraph:
+        """the graph as it stood at the timestamp, before any game on it"""
+        adjacency_graph = AdjacencyGraph()
+        for game in self.games_before(timestamp):
+            # (draws were never added)
+            adjacency_graph.add_child_to_parent(game.winnerteamid, game.loserteamid)  # type: ignore[arg-type]
+        return adjacency_graph
+
+    def edge_dates_at(self, timestamp: datetime) -> EdgeDateIndex:
+        """the edge dates as they stood at the timestamp, before any game on it"""
+        return EdgeDateIndex(self.games_before(timestamp))
@@ -1,8 +1,14 @@
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    computed_field,
+    field_serializer,
+    model_serializer,
+)
 from models import GameResult
 from datetime import datetime
 from typing import List, Dict, Any
-import json
 
 
 class HamiltonianCycle(BaseModel):
@@ -20,6 +26,7 @@ class HamiltonianCycle(BaseModel):
     def max_round(self) -> int:
         return max(game.round for game in self.games)
 
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
     @property
     def cycle_names(self) -> List[str]:
         """apply team names to the hamiltonian cycle"""
@@ -36,11 +43,29 @@ class HamiltonianCycle(BaseModel):
                     result += formatted_string
         return result
 
-    def model_dump_json(self) -> str:  # type: ignore[override]
-        data: Dict[str, Any] = {}
-        data["cycle"] = self.cycle
-        data["cycle_names"] = self.cycle_names
-        data["date"] = self.max_date
-        data["round"] = self.max_round
-        data["games"] = [json.loads(game.model_dump_json()) for game in self.games]
-        return json.dumps(data, default=str)
+    # the output has the cycle's date and round (and names) in with the cycle itself
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
+    @property
+    def date(self) -> datetime:
+        return self.max_date
+
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
+    @property
+    def round(self) -> int:
+        return self.max_round
+
+    @field_serializer("date", when_used="json")
+    def _date_as_str(self, date: datetime) -> str:
+        return str(date)
+
+    @model_serializer(mode="wrap")
+    def _in_output_order(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Dict[str, Any]:
+        """games last, after the summary of the cycle"""
+        data: Dict[str, Any] = handler(self)
+        return {
+            key: data[key]
+            for key in ("cycle", "cycle_names", "date", "round", "games")
+            if key in data
+        }
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+
+class HamiltonianCycleCounts(BaseModel):
+    """exactly how many distinct hamiltonian cycles the season's graph has, after each round"""
+
+    season: int
+    # counts are modulo this, if given
+    modulus: Optional[int] = None
+    # round -> cycles in the graph of every game up to (and incl.) the round
+    round_counts: Dict[int, int] = {}
+    season_end: int = 0
+
+    @property
+    def first_round(self) -> Optional[int]:
+        """the first round with any cycle at all. Not known with a modulus, a count of 0 could
+        be any multiple of it"""
+        if self.modulus:
+            raise ValueError(
+                f"Can't tell the first round with any cycle from counts modulo {self.modulus}"
+            )
+        return min(
+            (cur_round for cur_round, count in self.round_counts.items() if count),
+            default=None,
+        )
+
+    def __str__(self) -> str:
+        if self.modulus:
+            return f"Season {self.season} | Hamiltonian Cycles at season end: {self.season_end:,} (mod {self.modulus:,})"
+        first_round: str = "-" if self.first_round is None else str(self.first_round)
+        return f"Season {self.season} | Hamiltonian Cycles at season end: {self.season_end:,} | First round with any: {first_round}"
@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class ParityProjectionOutput(BaseModel):
+    """how likely a hamiltonian cycle is by the end of the fixture, and when"""
+
+    season: int
+    win_model: str
+    samples: int
+    seed: int
+    completed_games: int
+    fixtured_games: int
+    # the games already played have one, nothing left to project
+    already_found: bool = False
+    first_cycle_round: Optional[int] = None
+    first_cycle_date: Optional[datetime] = None
+    cycle_probability: float = 0.0
+    # of the samples with a cycle, the mean round it was first made in
+    expected_round: Optional[float] = None
+    # chance the first cycle is made in each round
+    round_probabilities: Dict[int, float] = {}
+    cache_hits: int = 0
+    searches: int = 0
+
+    def __str__(self) -> str:
+        if self.already_found:
+            return f"Season {self.season} already has a Hamiltonian Cycle, from round {self.first_cycle_round}"
+        expected_round: str = (
+            f"{self.expected_round:.1f}" if self.expected_round is not None else "-"
+        )
+        return (
+            f"Season {self.season} | {self.samples} samples ({self.win_model}) | "
+            f"P(Hamiltonian Cycle) {self.cycle_probability:.1%} | Expected round {expected_round}"
+        )
@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class ProgressSnapshot(BaseModel):
+    """where a round's search is at, published periodically while it runs"""
+
+    season: int
+    round: int
+    pairs_done: int
+    pairs_total: int
+    dfs_steps: int
+    steps_per_second: float
+    elapsed_seconds: float
+    eta_seconds: Optional[float] = None
+    best_bound: Optional[datetime] = None
+
+    @property
+    def fraction_explored(self) -> float:
+        """fraction of the top-level thread pairs fully searched"""
+        if not self.pairs_total:
+            return 1.0
+        return self.pairs_done / self.pairs_total
+
+    def __str__(self) -> str:
+        eta: str = f"{self.eta_seconds:.0f}s" if self.eta_seconds is not None else "?"
+        best_bound: str = (
+            f"{self.best_bound:%Y-%m-%d %H:%M}" if self.best_bound else "none"
+        )
+        return (
+            f"Season: {self.season} | Round: {self.round} | Explored: {self.pairs_done}/{self.pairs_total} "
+            f"({100 * self.fraction_explored:.1f}%) | DFS Steps: {self.dfs_steps} "
+            f"({self.steps_per_second:,.0f}/s) | Best: {best_bound} | "
+            f"Elapsed: {self.elapsed_seconds:.0f}s | ETA: {eta}"
+        )
@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class WhatIfResult(BaseModel):
+    """the answer to "what if winner beat loser", given the games played so far"""
+
+    winner: int
+    loser: int
+    winner_name: str
+    loser_name: str
+    completes_parity: bool = False
+    # the games played already have a hamiltonian cycle, nothing more to complete
+    already_complete: bool = False
+    # False if the winner has already beaten the loser, the graph wouldn't change
+    new_edge: bool = True
+    cycle: Optional[List[int]] = None
+    cycle_names: Optional[List[str]] = None
+    milliseconds: float = 0.0
+
+    def __str__(self) -> str:
+        outcome: str
+        if self.already_complete:
+            outcome = "parity already complete"
+        elif self.completes_parity and self.cycle_names:
+            outcome = f"completes parity | {' > '.join(self.cycle_names)}"
+        elif not self.new_edge:
+            outcome = "no change, already beaten them"
+        else:
+            outcome = "no Hamiltonian Cycle"
+        return f"{self.winner_name} beat {self.loser_name}: {outcome} ({self.milliseconds:.1f} ms)"
@@ -1,17 +1,59 @@
-from models import SeasonResults
-from helpers import LoggerHelper
-from algo.data_structures import AdjacencyGraph, HamiltonianCycle, DFSTraversalOutput
-from typing import List, Optional
+from models import SeasonResults, GameResult
+from helpers import ContextAdapter, LoggerHelper, DatabaseHelper, MetricsHelper
+from algo.data_structures import (
+    AdjacencyGraph,
+    HamiltonianCycle,
+    DFSTraversalOutput,
+    DFSCheckpoint,
+    EdgeDateIndex,
+    ProgressSnapshot,
+)
+from algo.cancellation import CancellationToken, SearchCancelledError
+from algo.constraint_propagation import ConstraintPropagation
+from algo.progress_reporter import ProgressReporter
+from algo.top_cycles import TopCycles
+from typing import Callable, List, Optional, Dict, ParamSpec, Set, TypeVar
 from datetime import datetime
+import asyncio
+import functools
+import hashlib
 import json
 from pathlib import Path
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
 import os
 import copy
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class _InlineExecutor(Executor):
+    """stands in for the thread pool, running each submission straight away in the calling
+    thread. Only used when profiling (max_workers=0), so the call stacks stay coherent"""
+
+    def submit(
+        self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> "Future[T]":
+        future: Future[T] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
 
 class DFS:
+    # bump whenever a change to the search could change its output, invalidates manifests
+    SOLVER_VERSION: str = "4"
+    # steps between checks of the time budget deadline and the cancellation token, keeps the
+    # clock out of the hot loop
+    STOP_CHECK_STEPS: int = 1024
+    # paths up to this long have the graph propagated again with the path forced, deeper than
+    # that it costs more than it saves
+    PROPAGATION_DEPTH: int = 8
     season_results: SeasonResults
     adjacency_graph: AdjacencyGraph
     traversal_output: DFSTraversalOutput
@@ -25,17 +67,62 @@ class DFS:
     output_file_debug: bool = False
 
     def __init__(
-        self, season_results: SeasonResults, output_file_debug: bool = False
+        self,
+        season_results: SeasonResults,
+        output_file_debug: bool = False,
+        results_database: Optional[DatabaseHelper] = None,
+        max_workers: Optional[int] = None,
+        progress_display: bool = False,
+        progress_interval: float = 30.0,
+        time_budget: Optional[float] = None,
+        resume: bool = True,
+        cancel_token: Optional[CancellationToken] = None,
+        compact_output: bool = False,
+        top_cycles: int = 0,
     ) -> None:
         self.season_results = season_results
+        # None is based on cpu count, 0 runs the search in the calling thread
+        self.max_workers = max_workers
+        # progress is logged every progress_interval seconds of a long search, listeners
+        # are handed every progress snapshot
+        self.progress_display = progress_display
+        self.progress_interval = progress_interval
+        self.progress_listeners: List[Callable[[ProgressSnapshot], None]] = []
+        # seconds process_season may search for before stopping with the best found so far,
+        # checkpointing what was left to search
+        self.time_budget = time_budget
+        self.resume = resume
+        self.deadline: Optional[float] = None
+        self.budget_expired: bool = False
+        # cancelling the token stops the search the same way running out of time does, but
+        # process_season then raises SearchCancelledError rather than returning
+        self.cancel_token = cancel_token or CancellationToken()
+        self.cancelled: bool = False
+        # either of the above, the one flag the hot loop looks at
+        self.stopping: bool = False
+        self.frontier: List[List[int]] = []
+        self.results_database = results_database
         self.adjacency_graph = AdjacencyGraph()
+        # the first game of each edge in the graph, and each team's wins and losses by date
+        self.edge_dates = EdgeDateIndex()
+        self.team_ids: List[int] = self.season_results.team_ids
+        self.team_id_set: Set[int] = set(self.team_ids)
+        # what is left of the graph after constraint propagation, what actually gets searched
+        self.search_successors: Dict[int, Set[int]] = {}
         self.traversal_output = DFSTraversalOutput()
         self.output_file_debug = output_file_debug
+        # json output on a single line rather than indented
+        self.compact_output = compact_output
+        # also keep the top_cycles earliest distinct hamiltonian cycles in the output
+        self.top_cycles = top_cycles
         self.logger = logging.getLogger(f"{self.season_results.season}_main")
+        self.metrics = MetricsHelper.get(self.season_results.season)
+        self.solved_nteams: int = self.season_results.nteams
 
     def _build_adjacency_graph(self, cur_round: int) -> None:
         """dynmically build adjacency graph up to the supplied cur_round"""
         self.adjacency_graph = AdjacencyGraph()
+        self.edge_dates = EdgeDateIndex()
         for round_results in self.season_results:
             for game_result in round_results:
                 if game_result.round <= cur_round:
@@ -43,6 +130,29 @@ class DFS:
                         self.adjacency_graph.add_child_to_parent(
                             game_result.winnerteamid, game_result.loserteamid
                         )
+                        self.edge_dates.add_game(game_result)
+
+    def _add_games_to_adjacency_graph(self, games: List[GameResult]) -> List[List[int]]:
+        """add games to the existing adjacency graph without rebuilding it, returning the
+        winner-loser pairs which were not already edges in the graph"""
+        new_edges: List[List[int]] = []
+        for game_result in sorted(games, key=lambda game: game.date):
+            if game_result.winnerteamid and game_result.loserteamid:
+                edge: List[int] = [game_result.winnerteamid, game_result.loserteamid]
+                if (
+                    game_result.winnerteamid not in self.adjacency_graph.parents
+                    or game_result.loserteamid
+                    not in self.adjacency_graph.get_children_for_parent(
+                        game_result.winnerteamid
+                    )
+                ):
+                    if edge not in new_edges:
+                        new_edges.append(edge)
+                self.adjacency_graph.add_child_to_parent(
+                    game_result.winnerteamid, game_result.loserteamid
+                )
+                self.edge_dates.add_game(game_result)
+        return new_edges
 
     def _populate_hamiltonian_cycle_with_game_data(
         self, hamiltonian_cycle: HamiltonianCycle
@@ -61,27 +171,222 @@ class DFS:
             if cur_game:
                 hamiltonian_cycle.games.append(cur_game)
 
-    def _save_output_to_file(self) -> None:
-        """save the traversal output to a json file in the output directory"""
+    @property
+    def output_file(self) -> Path:
+        project_root: Path = Path(__file__).parents[2]  # yueck
+        output_dir: Path = project_root / "output" / str(self.season_results.season)
+        return output_dir / f"{self.season_results.season}_dfs_traversal_output.json"
+
+    @property
+    def checkpoint_file(self) -> Path:
+        return (
+            self.output_file.parent
+            / f"{self.season_results.season}_dfs_checkpoint.json"
+        )
+
+    def _rounds_hash(self, upto_round: int) -> str:
+        """hash of the teams and every game up to (and incl.) the round"""
+        sha256 = hashlib.sha256()
+        sha256.update(json.dumps(self.season_results.team_ids).encode())
+        games = sorted(
+            (
+                game
+                for round_results in self.season_results
+                for game in round_results
+                if game.round <= upto_round
+            ),
+            key=lambda game: game.id,
+        )
+        for game in games:
+            sha256.update(
+                f"{game.id}|{game.round}|{game.winnerteamid}|{game.loserteamid}|{game.date}".encode()
+            )
+        return sha256.hexdigest()
+
+    def _save_checkpoint(
+        self, cur_round: int, frontier: Optional[List[List[int]]]
+    ) -> None:
+        """write out what was left to search, atomically so a kill mid-write cant corrupt it"""
+        first_hamiltonian_cycle = self.traversal_output.first_hamiltonian_cycle
+        checkpoint = DFSCheckpoint(
+            season=self.season_results.season,
+            solver_version=self.SOLVER_VERSION,
+            round=cur_round,
+            input_hash=self._rounds_hash(cur_round),
+            early_exit_date=self.early_exit_date,
+            frontier=frontier,
+            best_cycle=first_hamiltonian_cycle.cycle
+            if first_hamiltonian_cycle
+            else None,
+            dfs_steps=self.dfs_steps,
+            skipped_steps=self.skipped_steps,
+            full_paths_not_hamiltonian=self.full_paths_not_hamiltonian,
+            hamiltonian_cycles_found=self.hamiltonian_cycles_found,
+        )
+        checkpoint_file: Path = self.checkpoint_file
+        checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=checkpoint_file.parent, suffix=".tmp")
         try:
-            project_root: Path = Path(__file__).parents[2]  # yueck
+            with os.fdopen(fd, "w") as f:
+                f.write(checkpoint.model_dump_json(indent=2))
+            os.replace(tmp_path, checkpoint_file)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self.logger.info(
+            f"Checkpoint of round {cur_round} ({len(frontier) if frontier is not None else 'not started'} paths left) stored in {checkpoint_file}"
+        )
 
-            output_dir: Path = project_root / "output" / str(self.season_results.season)
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_file: Path = (
-                output_dir / f"{self.season_results.season}_dfs_traversal_output.json"
+    def _load_checkpoint(self) -> Optional[DFSCheckpoint]:
+        """the checkpoint left by a previous run, if there is one and it still applies"""
+        if not self.checkpoint_file.exists():
+            return None
+        try:
+            checkpoint = DFSCheckpoint.model_validate_json(
+                self.checkpoint_file.read_text()
             )
+        except ValueError as e:
+            self.logger.warning(f"Ignoring unreadable checkpoint: {e}")
+            return None
+        if (
+            checkpoint.season != self.season_results.season
+            or checkpoint.solver_version != self.SOLVER_VERSION
+            or checkpoint.round not in self.season_results.round_results
+            or checkpoint.input_hash != self._rounds_hash(checkpoint.round)
+        ):
+            self.logger.info("Ignoring checkpoint, the season has changed since")
+            return None
+        self.logger.info(f"Resuming from checkpoint of round {checkpoint.round}")
+        return checkpoint
+
+    def _restore_checkpoint(self, checkpoint: DFSCheckpoint) -> None:
+        """pick the counters and best cycle so far back up"""
+        self.dfs_steps = checkpoint.dfs_steps
+        self.skipped_steps = checkpoint.skipped_steps
+        self.full_paths_not_hamiltonian = checkpoint.full_paths_not_hamiltonian
+        self.hamiltonian_cycles_found = checkpoint.hamiltonian_cycles_found
+        if checkpoint.best_cycle:
+            best_cycle = HamiltonianCycle(cycle=checkpoint.best_cycle)
+            self._populate_hamiltonian_cycle_with_game_data(best_cycle)
+            self.traversal_output.update_first_hamiltonian_cycle(best_cycle)
+
+    def _stop_requested(self) -> bool:
+        """out of time or cancelled, either way the search needs to wind up"""
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.budget_expired = True
+        if self.cancel_token.cancelled:
+            self.cancelled = True
+        self.stopping = self.budget_expired or self.cancelled
+        return self.stopping
+
+    def _save_output_to_file(self) -> None:
+        """save the traversal output to a json file in the output directory"""
+        try:
+            output_file: Path = self.output_file
+            output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_file, "w") as f:
-                json.dump(
-                    json.loads(self.traversal_output.model_dump_json()), f, indent=2
+            with self.metrics.stage("save"), open(output_file, "w") as f:
+                # the one pass through the models' serializers, straight to the file
+                f.write(
+                    self.traversal_output.model_dump_json(
+                        indent=None if self.compact_output else 2
+                    )
                 )
 
             self.logger.info(f"Traversal results stored in {output_file}")
 
+            if self.results_database:
+                with self.metrics.stage("save_database"):
+                    self.results_database.save_season(
+                        season=self.season_results.season,
+                        traversal_output=self.traversal_output.model_dump(mode="json"),
+                        games=[
+                            game.model_dump(mode="json")
+                            for round_results in self.season_results
+                            for game in round_results
+                        ],
+                        nteams=self.season_results.nteams,
+                        nrounds=self.season_results.nrounds,
+                    )
+                self.logger.info(
+                    f"Traversal results stored in {self.results_database.db_path}"
+                )
+
         except Exception as e:
             self.logger.error(f"Failed to save output: {e}")
 
+    def _best_bound(self) -> Optional[datetime]:
+        """date of the best hamiltonian cycle found so far (if any), nothing later can win"""
+        if self.traversal_output.first_hamiltonian_cycle:
+            return self.traversal_output.first_hamiltonian_cycle.max_date
+        return None
+
+    def _path_max_date(self, path: List[int]) -> datetime:
+        """date of the latest (first) game along the path"""
+        return max(
+            self.edge_dates.first_games[(winner, loser)].date
+            for winner, loser in zip(path, path[1:])
+        )
+
+    def _lower_bound(
+        self, path: List[int], next_team: int, path_max_date: datetime
+    ) -> Optional[datetime]:
+        """no hamiltonian cycle carrying on from the path then next_team can have a max date
+        earlier than this, None if there cant be a cycle at all.
+
+        Every team still to be visited has to win against another unvisited team (or the
+        start of the path, to close the cycle) and lose to another unvisited team (or
+        next_team), and next_team has to beat one of the unvisited. The latest of each of
+        their earliest such games, and the path so far, is the bound
+        """
+        unvisited: Set[int] = self.team_id_set.difference(path)
+        unvisited.discard(next_team)
+        if not unvisited:
+            # only the game closing the cycle left, that gets checked once there
+            return path_max_date
+
+        bound: datetime = path_max_date
+        next_team_win = self.edge_dates.earliest_win(next_team, unvisited)
+        if next_team_win is None:
+            return None
+        if next_team_win > bound:
+            bound = next_team_win
+
+        win_against: Set[int] = unvisited | {path[0]}
+        loss_against: Set[int] = unvisited | {next_team}
+        for team in unvisited:
+            win = self.edge_dates.earliest_win(team, win_against)
+            loss = self.edge_dates.earliest_loss(team, loss_against)
+            if win is None or loss is None:
+                return None
+            if win > bound:
+                bound = win
+            if loss > bound:
+                bound = loss
+        return bound
+
+    def _propagate_forced_edges(self) -> bool:
+        """shrink the graph to the edges a cycle could actually use, ready to be searched.
+        Returns False if the edges forced into any cycle rule one out altogether"""
+        successors: Dict[int, Set[int]] = {
+            adjacency_list.parent: adjacency_list.children
+            for adjacency_list in self.adjacency_graph.adjacency_lists
+        }
+        search_successors = ConstraintPropagation.propagate(
+            self.season_results.team_ids, successors
+        )
+        if search_successors is None:
+            self.search_successors = {}
+            return False
+        removed: int = sum(len(losers) for losers in successors.values()) - sum(
+            len(losers) for losers in search_successors.values()
+        )
+        if removed:
+            self.logger.debug(f"{removed} games ruled out of any cycle by propagation")
+            self.metrics.increment("propagation_removed_edges", removed)
+        self.search_successors = search_successors
+        return True
+
     def _validate_hamiltonian_cycle_possible(self) -> bool:
         """helper method to first check all teams have either won or lost at least one game"""
         parents_count = len(self.adjacency_graph.parents)
@@ -93,25 +398,40 @@ class DFS:
             return False
 
     def _dfs(
-        self, cur_winner: int, path: List[int], thread_logger: logging.Logger
+        self,
+        cur_winner: int,
+        path: List[int],
+        thread_logger: ContextAdapter,
+        path_max_date: datetime,
     ) -> None:
-        """recursive method to perform DFS. Exits early upon successfull hamiltonian cycle being found"""
+        """recursive method to perform DFS. Exits early upon successfull hamiltonian cycle being found.
+        Branches are only followed while their lower bound could still beat the best cycle
+        found so far"""
         if self.early_exit:
             # early_exit trigger made, lets get out of here
             return
 
+        if self.stopping:
+            # out of time (or cancelled), this path is still to be searched
+            self.frontier.append(path.copy())
+            return
+
         self.dfs_steps += 1
+        if not self.dfs_steps % self.STOP_CHECK_STEPS and self._stop_requested():
+            self.frontier.append(path.copy())
+            return
+        # how much of the path is this call's, anything past it belongs to deeper calls
+        path_base: int = len(path)
 
         # gets the losers for the current winner
-        adjacency_list = self.adjacency_graph.get_adjacency_graph(cur_winner)
-        if not adjacency_list:
+        losers: Set[int] = self.search_successors.get(cur_winner, set())
+        if not losers:
             # this should never occur...
             return
 
         # once all teams have been visited, can inspect for hamiltonian cycle
         if len(path) == self.season_results.nteams:
-            adjacency_list = self.adjacency_graph.get_adjacency_graph(cur_winner)
-            if adjacency_list and path[0] in adjacency_list.children:
+            if path[0] in losers:
                 thread_logger.debug("Found Hamiltonian Cycle")
                 thread_logger.debug(f"path: {len(path):<2}\t{''.ljust(8)} {path}")
                 self.hamiltonian_cycles_found += 1
@@ -159,29 +479,48 @@ class DFS:
                 self.full_paths_not_hamiltonian += 1
             return
 
-        for cur_loser in adjacency_list.children:
+        if len(path) <= self.PROPAGATION_DEPTH:
+            # with the path so far forced, what's left of the graph might already rule out any
+            # cycle (or at least a few of the losers from here)
+            reduced = ConstraintPropagation.propagate(
+                self.team_ids, self.search_successors, path
+            )
+            if reduced is None:
+                self.skipped_steps += 1
+                return
+            losers = reduced[cur_winner]
+
+        for cur_loser in losers:
             if cur_loser not in path and not self.early_exit:
-                game = self.season_results.get_first_game_result_between_teams(
-                    cur_winner, cur_loser
-                )
+                game = self.edge_dates.first_game(cur_winner, cur_loser)
                 if game:
-                    # check if this game was before the max date of all games in the current first hamiltonian cycle
-                    # to allow for skipping pointless combinations
-                    if (
-                        self.traversal_output.first_hamiltonian_cycle
-                        and (
-                            game.date
-                            <= self.traversal_output.first_hamiltonian_cycle.max_date
-                        )
-                    ) or not self.traversal_output.first_hamiltonian_cycle:
+                    next_max_date: datetime = (
+                        game.date if game.date > path_max_date else path_max_date
+                    )
+                    # the earliest any cycle down this branch could be, only worth going
+                    # down if that beats the current first hamiltonian cycle
+                    bound = self._lower_bound(path, cur_loser, next_max_date)
+                    if bound is not None and (
+                        not self.traversal_output.first_hamiltonian_cycle
+                        or bound
+                        < self.traversal_output.first_hamiltonian_cycle.max_date
+                    ):
                         path.append(cur_loser)
                         thread_logger.debug(
                             f"path: {len(path):<2}\t{'Fwd:'.ljust(8)} {path}"
                         )
-                        self._dfs(cur_loser, path, thread_logger)
+                        self._dfs(cur_loser, path, thread_logger, next_max_date)
                         # check for early exit before backtracking
                         if self.early_exit:
                             return
+                        if self.stopping:
+                            # deeper calls have stored their own leftovers, the siblings
+                            # not yet tried from here are left too
+                            siblings: List[int] = list(losers)
+                            for sibling in siblings[siblings.index(cur_loser) + 1 :]:
+                                if sibling not in path[:path_base]:
+                                    self.frontier.append(path[:path_base] + [sibling])
+                            return
                         # traversal ended - backtrack
                         path.remove(
                             cur_loser
@@ -190,13 +529,12 @@ class DFS:
                             f"path: {len(path):<2}\t{'Back:'.ljust(8)} {path}"
                         )
                     else:
-                        # can skip this game, as it occured after the last game of the current hamiltonian cycle, no point checking it
+                        # can skip this game, no cycle through it could beat the current hamiltonian cycle
+                        # (or there's no way to finish a cycle through it at all)
                         self.skipped_steps += 1
-                        if self.traversal_output.first_hamiltonian_cycle:
-                            thread_logger.debug(
-                                f"{cur_winner}-{cur_loser} Gamedate {game.date} Found Hamiltonian Cycle Maxdate {self.traversal_output.first_hamiltonian_cycle.max_date} - Skipped"
-                            )
-                        pass
+                        thread_logger.debug(
+                            f"{cur_winner}-{cur_loser} Gamedate {game.date} Bound {bound} - Skipped"
+                        )
             else:
                 # explicit "do nothing" the cur_loser already visited in this path
                 pass
@@ -259,79 +597,382 @@ class DFS:
                         self.thread_pairs.append([game.winnerteamid, game.loserteamid])
                         return  # only want the first game
 
-    def _find_hamiltonian_cycles(self, cur_round: int) -> None:
-        """setup and start dfs search for hamiltonian cycles"""
+    def _find_hamiltonian_cycles(
+        self, cur_round: int, expand_thread_pairs: bool = True
+    ) -> None:
+        """setup and start dfs search for hamiltonian cycles, when expand_thread_pairs is
+        False only the pre-determined thread pairs are searched"""
         cpu_count: int = os.cpu_count() or 1  # mypy annoyances with max() function
+        executor: Executor = (
+            _InlineExecutor()
+            if self.max_workers == 0
+            else ThreadPoolExecutor(
+                max_workers=self.max_workers or max(cpu_count - 2, 1)
+            )
+        )
 
-        with ThreadPoolExecutor(max_workers=max(cpu_count - 2, 1)) as executor:
+        self.team_ids = self.season_results.team_ids
+        self.team_id_set = set(self.team_ids)
+        with executor:
             futures = []
             # one thread per parent-child relationship, by appending to the pre-determined ones
-            for parent_child in self.thread_pairs:
+            for parent_child in list(self.thread_pairs) if expand_thread_pairs else []:
                 parent = parent_child[0]
                 child = parent_child[1]
-                children = self.adjacency_graph.get_children_for_parent(parent)
+                children = self.search_successors.get(parent, set())
                 for child in children:
                     new_tp: List[int] = [parent, child]
                     if new_tp not in self.thread_pairs:
                         self.thread_pairs.append(new_tp)
 
-            for bp in self.thread_pairs:
-                # setup to mimick the 'first step' of the dfs search, allowing this parallel action to happen
-                parent = bp[0]
-                child = bp[1]
-                path_copy = copy.deepcopy([parent, child])
-                thread_logger = LoggerHelper.setup(
-                    datetime.now(),
-                    f"{self.season_results.season}_R{cur_round}_{parent}_{child}",
-                    self.output_file_debug,
+            with ProgressReporter(
+                season=self.season_results.season,
+                cur_round=cur_round,
+                pairs_total=len(self.thread_pairs),
+                dfs_steps=lambda: self.dfs_steps,
+                best_bound=self._best_bound,
+                logger=self.logger,
+                log_interval=self.progress_interval,
+                live_display=self.progress_display,
+                listeners=self.progress_listeners,
+            ) as progress:
+                for bp in self.thread_pairs:
+                    # setup to mimick the 'first step' of the dfs search, allowing this parallel action to happen
+                    # (when resuming from a checkpoint these are the longer paths left to search)
+                    path_copy = copy.deepcopy(bp)
+                    # tagged onto the season's log, rather than a log file per thread pair
+                    thread_logger = LoggerHelper.context(
+                        self.logger,
+                        f"R{cur_round} {'_'.join(str(teamid) for teamid in bp)}",
+                    )
+                    future = executor.submit(
+                        self._dfs,
+                        path_copy[-1],
+                        path_copy,
+                        thread_logger,
+                        self._path_max_date(path_copy),
+                    )
+                    future.add_done_callback(lambda _: progress.pair_done())
+                    futures.append(future)
+                # smash it out
+                for future in as_completed(futures):
+                    if not self.early_exit:
+                        # only log this if thread exited without an early exit
+                        self.logger.info(
+                            f"Season: {self.season_results.season} | DFS Steps: {self.dfs_steps:<2} | Skipped Steps: {self.skipped_steps:<2} | Hamiltonian Cycles Found: {self.hamiltonian_cycles_found}"
+                        )
+                    future.result()
+
+    def _record_round_outcome(self) -> bool:
+        """copy the traversal counters to the output and log the outcome of the round,
+        returns True if a hamiltonian cycle has been found"""
+        self.traversal_output.total_dfs_steps = self.dfs_steps
+        self.traversal_output.total_full_paths_not_hamiltonian = (
+            self.full_paths_not_hamiltonian
+        )
+        self.traversal_output.total_hamiltonian_cycles = self.hamiltonian_cycles_found
+        self.metrics.set_counter("dfs_steps", self.dfs_steps)
+        self.metrics.set_counter("skipped_steps", self.skipped_steps)
+        self.metrics.set_counter(
+            "full_paths_not_hamiltonian", self.full_paths_not_hamiltonian
+        )
+        self.metrics.set_counter(
+            "hamiltonian_cycles_found", self.hamiltonian_cycles_found
+        )
+        self.logger.info(
+            f"Season: {self.season_results.season} | DFS Steps: {self.dfs_steps:<2} | Skipped Steps: {self.skipped_steps:<2} | Early Exit: {self.early_exit} | Hamiltonian Cycles Found: {self.hamiltonian_cycles_found}"
+        )
+        if self.traversal_output.first_hamiltonian_cycle:
+            self.logger.info("Hamiltonian Cycle Found")
+            self.logger.info(self.traversal_output.first_hamiltonian_cycle.cycle_names)
+            self.logger.info(
+                self.traversal_output.first_hamiltonian_cycle.hamiltonian_cycle_game_details_pprint()
+            )
+            return True
+        else:
+            self.logger.info("Hamiltonian Cycle Not Found")
+            return False
+
+    def _record_top_cycles(self) -> None:
+        """the k earliest cycles, only once there is a first one (otherwise there are none) and
+        it is proven to be the first"""
+        self.traversal_output.top_hamiltonian_cycles = []
+        if not self.top_cycles or not self.traversal_output.first_hamiltonian_cycle:
+            return
+        if not self.traversal_output.proven_optimal:
+            # the time is up, and the exact top cycles could be earlier than the first found
+            self.logger.info(
+                "Time budget used up, top hamiltonian cycles skipped as the first isn't proven"
+            )
+            return
+        with self.metrics.stage("top_cycles"):
+            self.traversal_output.top_hamiltonian_cycles = TopCycles.find(
+                self.season_results, self.top_cycles
+            )
+
+    def _reset_traversal(self) -> None:
+        """clear all traversal state, ready for a fresh search of the season"""
+        self.adjacency_graph = AdjacencyGraph()
+        self.edge_dates = EdgeDateIndex()
+        self.search_successors = {}
+        self.traversal_output = DFSTraversalOutput()
+        self.early_exit = False
+        self.early_exit_date = None
+        self.thread_pairs = []
+        self.dfs_steps = 0
+        self.skipped_steps = 0
+        self.full_paths_not_hamiltonian = 0
+        self.hamiltonian_cycles_found = 0
+        self.budget_expired = False
+        self.cancelled = False
+        self.stopping = False
+        self.frontier = []
+        self.solved_nteams = self.season_results.nteams
+
+    def process_new_games(self, new_games: List[GameResult]) -> bool:
+        """incrementally update the search with newly completed games (already added to
+        season_results), returns True if the first hamiltonian cycle changed.
+
+        The graph prior to these games has already been proven to have no hamiltonian
+        cycle, so any new cycle _must_ include one of the new edges - only those need to be
+        used as starting thread pairs rather than searching the whole round again
+        """
+        if not new_games:
+            return False
+
+        if self.season_results.nteams != self.solved_nteams:
+            # the teams in the season changed (ie. a team played for the first time) so
+            # nothing proven so far still holds, start over
+            self.logger.info("Season teams changed, re-processing the whole season")
+            self._reset_traversal()
+            self.process_season()
+            return self.traversal_output.first_hamiltonian_cycle is not None
+
+        first_hamiltonian_cycle = self.traversal_output.first_hamiltonian_cycle
+        if first_hamiltonian_cycle:
+            if all(game.date >= first_hamiltonian_cycle.max_date for game in new_games):
+                # cant possibly improve on the cycle already found, but may make later ones
+                if self.top_cycles:
+                    self._record_top_cycles()
+                    self._save_output_to_file()
+                return False
+            # late arriving result from before the found cycle, just do it all again
+            self._reset_traversal()
+            self.process_season()
+            return (
+                self.traversal_output.first_hamiltonian_cycle != first_hamiltonian_cycle
+            )
+
+        games_by_round: Dict[int, List[GameResult]] = {}
+        for game in new_games:
+            games_by_round.setdefault(game.round, []).append(game)
+
+        for cur_round in sorted(games_by_round):
+            round_games = games_by_round[cur_round]
+            with self.metrics.stage("graph_build", round=cur_round):
+                new_edges = self._add_games_to_adjacency_graph(round_games)
+            if not new_edges:
+                continue
+
+            if not self._validate_hamiltonian_cycle_possible():
+                self.logger.info(
+                    f"Round {cur_round}: Hamiltonian Cycle is not possible, team(s) without wins or losses present"
                 )
-                futures.append(
-                    executor.submit(self._dfs, child, path_copy, thread_logger)
+                continue
+
+            if not self._propagate_forced_edges():
+                self.logger.info(
+                    f"Round {cur_round}: Hamiltonian Cycle is not possible, ruled out by the games any cycle would be forced to use"
                 )
-            # smash it out
-            for future in as_completed(futures):
-                if not self.early_exit:
-                    # only log this if thread exited without an early exit
-                    self.logger.info(
-                        f"Season: {self.season_results.season} | DFS Steps: {self.dfs_steps:<2} | Skipped Steps: {self.skipped_steps:<2} | Hamiltonian Cycles Found: {self.hamiltonian_cycles_found}"
-                    )
-                future.result()
+                continue
+
+            self.early_exit = False
+            self.early_exit_date = min(
+                game.date
+                for game in round_games
+                if game.winnerteamid and game.loserteamid
+            )
+            self.thread_pairs = new_edges
+            with self.metrics.stage("solve", round=cur_round):
+                self._find_hamiltonian_cycles(
+                    cur_round=cur_round, expand_thread_pairs=False
+                )
+
+            if self.cancelled and not self.early_exit:
+                # the new games were only part searched so nothing is proven, forces the
+                # next call to start over
+                self.solved_nteams = 0
+                raise SearchCancelledError(
+                    f"Season {self.season_results.season} search of new games cancelled"
+                )
+
+            if self._record_round_outcome():
+                self._record_top_cycles()
+                self._save_output_to_file()
+                return True
+
+        self._save_output_to_file()
+        return False
 
-    def process_season(self) -> None:
+    def process_season(self, save_output: bool = True) -> None:
         """lets gooooo"""
+        self.deadline = (
+            time.perf_counter() + self.time_budget if self.time_budget else None
+        )
+        checkpoint: Optional[DFSCheckpoint] = (
+            self._load_checkpoint() if self.resume else None
+        )
+
+        # no cycle can finish before every team has both won and lost, rounds that are over
+        # by then dont even need their graph built
+        earliest_cycle_date: Optional[datetime] = EdgeDateIndex.from_season(
+            self.season_results
+        ).earliest_cycle_date(self.season_results.team_ids)
+        if earliest_cycle_date:
+            self.logger.info(
+                f"No Hamiltonian Cycle possible before {earliest_cycle_date}"
+            )
+        rounds_last_date: Optional[datetime] = None
+
         # iterate over cur_round in sequential order to prevent unecessary compute/searching
         for cur_round in self.season_results.rounds_list:
-            self._build_adjacency_graph(cur_round=cur_round)
+            round_last_date: datetime = max(
+                game.date for game in self.season_results.get_round_results(cur_round)
+            )
+            if not rounds_last_date or round_last_date > rounds_last_date:
+                rounds_last_date = round_last_date
 
-            if self._validate_hamiltonian_cycle_possible():
-                self._find_pairs_for_early_exit_strategy(cur_round=cur_round)
-                self._find_hamiltonian_cycles(cur_round=cur_round)
+            if checkpoint and cur_round < checkpoint.round:
+                # already proven to have no hamiltonian cycle by the previous run
+                continue
 
-                self.traversal_output.total_dfs_steps = self.dfs_steps
-                self.traversal_output.total_full_paths_not_hamiltonian = (
-                    self.full_paths_not_hamiltonian
-                )
-                self.traversal_output.total_hamiltonian_cycles = (
-                    self.hamiltonian_cycles_found
-                )
+            if not earliest_cycle_date or rounds_last_date < earliest_cycle_date:
+                if cur_round == self.season_results.rounds_list[-1]:
+                    # nothing to search, but new games (watch mode) are added to this graph
+                    with self.metrics.stage("graph_build", round=cur_round):
+                        self._build_adjacency_graph(cur_round=cur_round)
                 self.logger.info(
-                    f"Season: {self.season_results.season} | DFS Steps: {self.dfs_steps:<2} | Skipped Steps: {self.skipped_steps:<2} | Early Exit: {self.early_exit} | Hamiltonian Cycles Found: {self.hamiltonian_cycles_found}"
+                    f"Round {cur_round}: Hamiltonian Cycle is not possible, team(s) without wins or losses present"
                 )
-                if self.traversal_output.first_hamiltonian_cycle:
-                    self.logger.info("Hamiltonian Cycle Found")
-                    self.logger.info(
-                        self.traversal_output.first_hamiltonian_cycle.cycle_names
-                    )
-                    self.logger.info(
-                        self.traversal_output.first_hamiltonian_cycle.hamiltonian_cycle_game_details_pprint()
-                    )
-                    break
-                else:
-                    self.logger.info("Hamiltonian Cycle Not Found")
-            else:
+                continue
+
+            if self._stop_requested():
+                if not (checkpoint and cur_round == checkpoint.round):
+                    # (otherwise the checkpoint being resumed still stands as is)
+                    self._save_checkpoint(cur_round, None)
+                break
+
+            with self.metrics.stage("graph_build", round=cur_round):
+                self._build_adjacency_graph(cur_round=cur_round)
+
+            if not self._validate_hamiltonian_cycle_possible():
                 self.logger.info(
                     f"Round {cur_round}: Hamiltonian Cycle is not possible, team(s) without wins or losses present"
                 )
+            elif not self._propagate_forced_edges():
+                self.logger.info(
+                    f"Round {cur_round}: Hamiltonian Cycle is not possible, ruled out by the games any cycle would be forced to use"
+                )
+            else:
+                with self.metrics.stage("solve", round=cur_round):
+                    if checkpoint and cur_round == checkpoint.round:
+                        self._restore_checkpoint(checkpoint)
+                    if (
+                        checkpoint
+                        and cur_round == checkpoint.round
+                        and checkpoint.frontier is not None
+                    ):
+                        # only what was left of the round
+                        self.early_exit_date = checkpoint.early_exit_date
+                        self.thread_pairs = checkpoint.frontier
+                        self._find_hamiltonian_cycles(
+                            cur_round=cur_round, expand_thread_pairs=False
+                        )
+                    else:
+                        self._find_pairs_for_early_exit_strategy(cur_round=cur_round)
+                        self._find_hamiltonian_cycles(cur_round=cur_round)
+
+                if self.stopping and not self.early_exit:
+                    self._save_checkpoint(cur_round, self.frontier)
+                    self._record_round_outcome()
+                    break
+
+                if self._record_round_outcome():
+                    break
+
+        if self.cancelled and not self.early_exit:
+            self.logger.info(f"Season {self.season_results.season} search cancelled")
+            raise SearchCancelledError(
+                f"Season {self.season_results.season} search cancelled, what was left is stored in {self.checkpoint_file}"
+            )
+
+        if self.budget_expired and not self.early_exit:
+            self.traversal_output.proven_optimal = False
+            self.logger.info(
+                f"Time budget of {self.time_budget}s used up, the result is the best found so far and not proven optimal"
+            )
+        else:
+            self.traversal_output.proven_optimal = True
+            if checkpoint:
+                self.checkpoint_file.unlink(missing_ok=True)
+        self._record_top_cycles()
 
         # save resultsaaahhh
-        self._save_output_to_file()
+        if save_output:
+            self._save_output_to_file()
+
+    async def _run_in_executor(
+        self,
+        fn: Callable[[], T],
+        progress_queue: Optional["asyncio.Queue[ProgressSnapshot]"],
+    ) -> T:
+        """run a blocking search on the event loop's default executor. Cancelling the awaiting
+        task cancels the search through the token, then waits for it to wind up (and
+        checkpoint) before the cancellation carries on"""
+        loop = asyncio.get_running_loop()
+        listeners: List[Callable[[ProgressSnapshot], None]] = []
+        if progress_queue is not None:
+            # snapshots are taken on the reporter thread, the queue belongs to the loop
+            queue: "asyncio.Queue[ProgressSnapshot]" = progress_queue
+
+            def put_snapshot(snapshot: ProgressSnapshot) -> None:
+                loop.call_soon_threadsafe(queue.put_nowait, snapshot)
+
+            listeners.append(put_snapshot)
+        self.progress_listeners.extend(listeners)
+
+        future: "asyncio.Future[T]" = loop.run_in_executor(None, fn)
+        try:
+            # shielded so a cancellation leaves the search running until it sees the token
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.cancel_token.cancel()
+            await asyncio.wait([future])
+            # (retrieved so asyncio doesnt complain about the SearchCancelledError)
+            future.exception()
+            raise
+        finally:
+            for listener in listeners:
+                self.progress_listeners.remove(listener)
+
+    async def process_season_async(
+        self,
+        save_output: bool = True,
+        progress_queue: Optional["asyncio.Queue[ProgressSnapshot]"] = None,
+    ) -> None:
+        """process_season without blocking the event loop, so fetching and rendering other
+        seasons can carry on alongside. Progress snapshots are put on progress_queue (if
+        given) as they are taken"""
+        await self._run_in_executor(
+            functools.partial(self.process_season, save_output), progress_queue
+        )
+
+    async def process_new_games_async(
+        self,
+        new_games: List[GameResult],
+        progress_queue: Optional["asyncio.Queue[ProgressSnapshot]"] = None,
+    ) -> bool:
+        """process_new_games without blocking the event loop"""
+        return await self._run_in_executor(
+            functools.partial(self.process_new_games, new_games), progress_queue
+        )
@@ -0,0 +1,202 @@
+from algo.dfs import DFS
+from algo.data_structures import HamiltonianCycle
+from algo.progress_reporter import ProgressReporter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# (visited teams bitmask, endpoint team index) -> (max date rank of the half, neighbouring team
+# index the half was extended from/to, for rebuilding the path)
+HalfPaths = Dict[Tuple[int, int], Tuple[int, int]]
+
+
+class MeetInTheMiddle(DFS):
+    """drop-in alternative to the DFS search for the bigger (16-18 team) seasons, where the
+    backtracking ends up walking a lot of full length paths.
+
+    Every cycle goes through the anchor team, so each round's graph is searched as two halves -
+    paths out of the anchor, and paths back into it - each only half the length of a cycle.
+    Halves are kept by (teams visited, end team) with only the earliest (lowest max date) one
+    for each, which is all that can matter once they're joined. A forward half and a backward
+    half meeting at the same team, covering every other team between them, make a cycle. The
+    earliest such join is the first hamiltonian cycle of the graph, no early exits required.
+
+    Everything around the search (rounds, checkpoints, output) is the same as DFS, except
+    that a stopped round can only be resumed from the start, so there is no time budget. Counters
+    are reused loosely: dfs_steps is half paths extended, hamiltonian_cycles_found is halves
+    joined, and full_paths_not_hamiltonian forward halves with no backward half to join
+    """
+
+    SOLVER_VERSION: str = f"{DFS.SOLVER_VERSION}-mitm"
+
+    def process_season(self, save_output: bool = True) -> None:
+        if self.time_budget:
+            # every run would be stopped part way through the same round, and start it over
+            raise ValueError("meet in the middle search can't be given a time budget")
+        super().process_season(save_output)
+
+    def _anchor_index(self, team_ids: List[int]) -> int:
+        """the team with the fewest games either way, so both halves branch as little as
+        possible from the start"""
+        losses: Dict[int, int] = {}
+        for winner_losers in self.search_successors.values():
+            for loser in winner_losers:
+                losses[loser] = losses.get(loser, 0) + 1
+        return min(
+            range(len(team_ids)),
+            key=lambda i: (
+                len(self.search_successors.get(team_ids[i], ()))
+                + losses.get(team_ids[i], 0)
+            ),
+        )
+
+    def _extend_halves(
+        self,
+        halves: HalfPaths,
+        neighbours: List[List[int]],
+        edge_ranks: Dict[Tuple[int, int], int],
+        forwards: bool,
+        anchor: int,
+    ) -> HalfPaths:
+        """every half one team longer, keeping the earliest for each (visited, end team)"""
+        extended: HalfPaths = {}
+        for (visited, end), (rank, _) in halves.items():
+            self.dfs_steps += 1
+            if not self.dfs_steps % self.STOP_CHECK_STEPS and self._stop_requested():
+                return {}
+            for team in neighbours[end]:
+                if team == anchor or visited >> team & 1:
+                    continue
+                edge_rank: int = edge_ranks[(end, team) if forwards else (team, end)]
+                key: Tuple[int, int] = (visited | 1 << team, team)
+                new_rank: int = rank if rank > edge_rank else edge_rank
+                if key not in extended or new_rank < extended[key][0]:
+                    extended[key] = (new_rank, end)
+        return extended
+
+    def _find_hamiltonian_cycles(
+        self, cur_round: int, expand_thread_pairs: bool = True
+    ) -> None:
+        """meet in the middle search of the graph up to the round, thread pairs are not needed"""
+        team_ids: List[int] = self.season_results.team_ids
+        nteams: int = len(team_ids)
+        team_index: Dict[int, int] = {teamid: i for i, teamid in enumerate(team_ids)}
+        self.team_id_set = set(team_ids)
+
+        # games compared by the order of their dates, ints are quicker than datetimes
+        dates: List[datetime] = sorted(
+            {game.date for game in self.edge_dates.first_games.values()}
+        )
+        date_rank: Dict[datetime, int] = {date: i for i, date in enumerate(dates)}
+        edge_ranks: Dict[Tuple[int, int], int] = {}
+        successors: List[List[int]] = [[] for _ in team_ids]
+        predecessors: List[List[int]] = [[] for _ in team_ids]
+        # only the edges left after constraint propagation
+        for winner in sorted(self.search_successors):
+            for loser in sorted(self.search_successors[winner]):
+                w, lo = team_index[winner], team_index[loser]
+                edge_ranks[(w, lo)] = date_rank[
+                    self.edge_dates.first_games[(winner, loser)].date
+                ]
+                successors[w].append(lo)
+                predecessors[lo].append(w)
+
+        anchor: int = self._anchor_index(team_ids)
+        # forward halves out of the anchor cover forward_depth other teams, backward halves
+        # back into it cover the rest plus the team they meet at
+        others: int = nteams - 1
+        forward_depth: int = (others + 1) // 2
+        backward_depth: int = others - forward_depth + 1
+        all_others: int = ((1 << nteams) - 1) & ~(1 << anchor)
+
+        with ProgressReporter(
+            season=self.season_results.season,
+            cur_round=cur_round,
+            pairs_total=forward_depth + backward_depth,
+            dfs_steps=lambda: self.dfs_steps,
+            best_bound=self._best_bound,
+            logger=self.logger,
+            log_interval=self.progress_interval,
+            live_display=self.progress_display,
+            listeners=self.progress_listeners,
+        ) as progress:
+            forward_layers: List[HalfPaths] = [
+                {
+                    (1 << team, team): (edge_ranks[(anchor, team)], anchor)
+                    for team in successors[anchor]
+                }
+            ]
+            progress.pair_done()
+            for _ in range(forward_depth - 1):
+                forward_layers.append(
+                    self._extend_halves(
+                        forward_layers[-1], successors, edge_ranks, True, anchor
+                    )
+                )
+                progress.pair_done()
+
+            backward_layers: List[HalfPaths] = [
+                {
+                    (1 << team, team): (edge_ranks[(team, anchor)], anchor)
+                    for team in predecessors[anchor]
+                }
+            ]
+            progress.pair_done()
+            for _ in range(backward_depth - 1):
+                backward_layers.append(
+                    self._extend_halves(
+                        backward_layers[-1], predecessors, edge_ranks, False, anchor
+                    )
+                )
+                progress.pair_done()
+
+        if self.stopping:
+            # nothing is proven until the halves are joined, the whole round is left (every
+            # cycle goes through the anchor, so that path covers it)
+            self.frontier = [[team_ids[anchor]]]
+            return
+
+        best: Optional[Tuple[int, Tuple[int, int]]] = None
+        backward: HalfPaths = backward_layers[-1]
+        for (visited, meet), (forward_rank, _) in sorted(forward_layers[-1].items()):
+            backward_half = backward.get(((all_others & ~visited) | 1 << meet, meet))
+            if backward_half is None:
+                self.full_paths_not_hamiltonian += 1
+                continue
+            self.hamiltonian_cycles_found += 1
+            rank: int = max(forward_rank, backward_half[0])
+            if best is None or rank < best[0]:
+                best = (rank, (visited, meet))
+
+        if best is None:
+            return
+
+        # walk each half back to the anchor to get the cycle
+        visited, meet = best[1]
+        forward_path: List[int] = []
+        team: int = meet
+        for layer in reversed(forward_layers):
+            forward_path.append(team)
+            previous: int = layer[(visited, team)][1]
+            visited &= ~(1 << team)
+            team = previous
+        forward_path.append(anchor)
+        forward_path.reverse()
+
+        visited = (all_others & ~best[1][0]) | 1 << meet
+        backward_path: List[int] = []
+        team = meet
+        for layer in reversed(backward_layers):
+            following: int = layer[(visited, team)][1]
+            visited &= ~(1 << team)
+            if team != meet:
+                backward_path.append(team)
+            team = following
+
+        cycle = HamiltonianCycle(
+            cycle=[team_ids[i] for i in forward_path + backward_path]
+        )
+        self._populate_hamiltonian_cycle_with_game_data(cycle)
+        self.traversal_output.update_first_hamiltonian_cycle(cycle)
+        self.logger.info(
+            f"Hamiltonian Cycle | {cycle.max_date} | {cycle.cycle} (meet in the middle)"
+        )
@@ -0,0 +1,303 @@
+from algo.cycle_search import CycleCache, CycleSweep
+from algo.data_structures import GameTimeline, ParityProjectionOutput
+from models import GameResult, ScheduledGame, SeasonResults
+from helpers import MetricsHelper
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+import math
+import multiprocessing
+import os
+import random
+
+WIN_MODELS: Tuple[str, ...] = ("coin", "record", "percentage")
+
+
+@dataclass(frozen=True)
+class _ProjectionState:
+    """everything a sample needs, sent to each worker process just the once"""
+
+    team_ids: List[int]
+    # the completed games' graph, already proven to have no hamiltonian cycle
+    successors: Dict[int, Set[int]]
+    # (home, away, home win probability) of each game left, in date order
+    games: List[Tuple[int, int, float]]
+
+
+def _run_batch(
+    state: _ProjectionState, cache: CycleCache, seed: int, batch: int, samples: int
+) -> Tuple[List[Optional[int]], int, int]:
+    """index (into state.games) of the game making the first cycle in each sample, or None,
+    with the cache hits and searches it took. Each batch has its own random stream, so the
+    results are the same however the batches are spread across workers"""
+    rng = random.Random(f"{seed}_{batch}")
+    first_games: List[Optional[int]] = []
+    cache_hits: int = 0
+    searches: int = 0
+    for _ in range(samples):
+        sweep = CycleSweep(state.team_ids, state.successors, cache)
+        first_game: Optional[int] = None
+        for i, (home, away, home_win_probability) in enumerate(state.games):
+            home_wins: bool = rng.random() < home_win_probability
+            if sweep.add_game(*((home, away) if home_wins else (away, home))):
+                first_game = i
+                break
+        first_games.append(first_game)
+        cache_hits += sweep.cache_hits
+        searches += sweep.searches
+    return first_games, cache_hits, searches
+
+
+_worker_state: Optional[_ProjectionState] = None
+_worker_cache: CycleCache = {}
+
+
+def _init_worker(state: _ProjectionState) -> None:
+    global _worker_state
+    _worker_state = state
+    _worker_cache.clear()
+
+
+def _run_batch_in_worker(
+    seed: int, batch: int, samples: int
+) -> Tuple[List[Optional[int]], int, int]:
+    assert _worker_state is not None
+    return _run_batch(_worker_state, _worker_cache, seed, batch, samples)
+
+
+class ParityProjection:
+    """monte carlo projection of the first hamiltonian cycle over the games left to play.
+
+    The completed games are swept once (game by game, searching only for cycles through each
+    new game) to prove their graph has no cycle yet. Every sample then carries on from that
+    shared graph, drawing a winner for each game left in date order and searching only when a
+    game adds a new edge. Samples run in batches across worker processes, each keeping a cache
+    of the graphs it has already searched - the early games of the fixture see the same few
+    graphs over and over. Draws are not sampled, and finals without both teams are left out.
+
+    win_model:
+        coin       - every game a coin flip
+        record     - log5 of each team's (smoothed) win ratio so far
+        percentage - log5 of each team's pythagorean expectation from points for and against
+    home_win_probabilities (game id -> probability) overrides the model for those games, ie.
+    tipsters' probabilities
+    """
+
+    # points for and against into an expected win ratio, points for^x / (for^x + against^x)
+    PYTHAGOREAN_EXPONENT: float = 3.87
+    BATCH_SIZE: int = 100
+
+    def __init__(
+        self,
+        season_results: SeasonResults,
+        fixture: List[ScheduledGame],
+        win_model: str = "record",
+        samples: int = 1000,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+        home_win_probabilities: Optional[Dict[int, float]] = None,
+    ) -> None:
+        if win_model not in WIN_MODELS:
+            raise ValueError(
+                f"Unknown win model {win_model}, expected one of {WIN_MODELS}"
+            )
+        self.season_results = season_results
+        # only games still to be played, with both teams known
+        completed_game_ids: Set[int] = season_results.game_ids
+        self.fixture: List[ScheduledGame] = sorted(
+            (
+                game
+                for game in fixture
+                if game.teams_decided and game.id not in completed_game_ids
+            ),
+            key=lambda game: game.date,
+        )
+        self.win_model = win_model
+        self.samples = samples
+        self.seed = seed
+        # None is based on cpu count, 0 runs every sample in the calling process
+        self.max_workers = max_workers
+        self.home_win_probabilities: Dict[int, float] = home_win_probabilities or {}
+        # (a team yet to play is only in the fixture)
+        team_ids: Set[int] = set(season_results.team_ids)
+        for game in self.fixture:
+            if game.hteamid and game.ateamid:
+                team_ids.update((game.hteamid, game.ateamid))
+        self.team_ids: List[int] = sorted(team_ids)
+        self.logger = logging.getLogger(f"{season_results.season}_main")
+        self.metrics = MetricsHelper.get(season_results.season)
+
+    @property
+    def output_file(self) -> Path:
+        project_root: Path = Path(__file__).parents[2]  # yueck
+        output_dir: Path = project_root / "output" / str(self.season_results.season)
+        return output_dir / f"{self.season_results.season}_parity_projection.json"
+
+    def _team_win_ratios(self) -> Dict[int, float]:
+        """each team's chance of beating an average team, by the win model"""
+        wins: Dict[int, float] = {team: 0.0 for team in self.team_ids}
+        played: Dict[int, int] = {team: 0 for team in self.team_ids}
+        points_for: Dict[int, int] = {team: 0 for team in self.team_ids}
+        points_against: Dict[int, int] = {team: 0 for team in self.team_ids}
+        for round_results in self.season_results:
+            for game in round_results:
+                for team, score, opponent_score in (
+                    (game.hteamid, game.hscore, game.ascore),
+                    (game.ateamid, game.ascore, game.hscore),
+                ):
+                    played[team] += 1
+                    points_for[team] += score
+                    points_against[team] += opponent_score
+                    if game.winnerteamid == team:
+                        wins[team] += 1
+                    elif not game.winnerteamid:
+                        wins[team] += 0.5
+
+        if self.win_model == "percentage":
+            ratios: Dict[int, float] = {}
+            for team in self.team_ids:
+                if not points_for[team] or not points_against[team]:
+                    ratios[team] = 0.5
+                    continue
+                scored: float = points_for[team] ** self.PYTHAGOREAN_EXPONENT
+                conceded: float = points_against[team] ** self.PYTHAGOREAN_EXPONENT
+                ratios[team] = scored / (scored + conceded)
+            return ratios
+        # a win and a loss added to everyone, so an unbeaten (or winless) team isn't certain
+        return {team: (wins[team] + 1) / (played[team] + 2) for team in self.team_ids}
+
+    def home_win_probability(
+        self, game: ScheduledGame, win_ratios: Dict[int, float]
+    ) -> float:
+        if game.id in self.home_win_probabilities:
+            return self.home_win_probabilities[game.id]
+        if self.win_model == "coin" or not (game.hteamid and game.ateamid):
+            return 0.5
+        home: float = win_ratios[game.hteamid]
+        away: float = win_ratios[game.ateamid]
+        # log5, the chance a team with win ratio home beats one with win ratio away
+        home_odds: float = home * (1 - away)
+        away_odds: float = away * (1 - home)
+        if not home_odds + away_odds:
+            return 0.5
+        return home_odds / (home_odds + away_odds)
+
+    def _sweep_completed_games(self) -> Tuple[CycleSweep, Optional[GameResult]]:
+        """the completed games' graph, and the game that made its first hamiltonian cycle
+        (if there is one)"""
+        sweep = CycleSweep(self.team_ids, {}, {})
+        for game in GameTimeline.from_season(self.season_results):
+            if game.winnerteamid and game.loserteamid:
+                if sweep.add_game(game.winnerteamid, game.loserteamid):
+                    return sweep, game
+        return sweep, None
+
+    def _projection_state(self, sweep: CycleSweep) -> _ProjectionState:
+        """the state shared by every sample, carrying on from the completed games"""
+        win_ratios: Dict[int, float] = self._team_win_ratios()
+        games: List[Tuple[int, int, float]] = [
+            (
+                game.hteamid,
+                game.ateamid,
+                self.home_win_probability(game, win_ratios),
+            )
+            for game in self.fixture
+            if game.hteamid and game.ateamid
+        ]
+        return _ProjectionState(self.team_ids, sweep.successors, games)
+
+    def _batches(self) -> List[Tuple[int, int]]:
+        """(batch number, samples in it)"""
+        return [
+            (batch, min(self.BATCH_SIZE, self.samples - start))
+            for batch, start in enumerate(range(0, self.samples, self.BATCH_SIZE))
+        ]
+
+    def _run_samples(
+        self, state: _ProjectionState
+    ) -> Tuple[List[Optional[int]], int, int]:
+        batch_results: List[Tuple[List[Optional[int]], int, int]]
+        if self.max_workers == 0:
+            cache: CycleCache = {}
+            batch_results = [
+                _run_batch(state, cache, self.seed, batch, samples)
+                for batch, samples in self._batches()
+            ]
+        else:
+            cpu_count: int = os.cpu_count() or 1
+            # spawn rather than fork, same as the render pool
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers or max(cpu_count - 2, 1),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(state,),
+            ) as executor:
+                futures: List[Future[Tuple[List[Optional[int]], int, int]]] = [
+                    executor.submit(_run_batch_in_worker, self.seed, batch, samples)
+                    for batch, samples in self._batches()
+                ]
+                batch_results = [future.result() for future in futures]
+
+        first_games: List[Optional[int]] = []
+        for batch_first_games, _, _ in batch_results:
+            first_games.extend(batch_first_games)
+        return (
+            first_games,
+            sum(cache_hits for _, cache_hits, _ in batch_results),
+            sum(searches for _, _, searches in batch_results),
+        )
+
+    def project(self) -> ParityProjectionOutput:
+        """run the samples"""
+        output = ParityProjectionOutput(
+            season=self.season_results.season,
+            win_model=self.win_model,
+            samples=self.samples,
+            seed=self.seed,
+            completed_games=len(self.season_results.game_ids),
+            fixtured_games=len(self.fixture),
+        )
+        with self.metrics.stage("projection_setup"):
+            sweep, first_game = self._sweep_completed_games()
+        if first_game:
+            self.logger.info(
+                f"Hamiltonian Cycle already made by the completed games, in round {first_game.round}"
+            )
+            output.already_found = True
+            output.cycle_probability = 1.0
+            output.first_cycle_round = first_game.round
+            output.first_cycle_date = first_game.date
+            output.expected_round = float(first_game.round)
+            output.round_probabilities = {first_game.round: 1.0}
+            return output
+
+        with self.metrics.stage("projection_samples"):
+            first_games, output.cache_hits, output.searches = self._run_samples(
+                self._projection_state(sweep)
+            )
+
+        rounds: List[int] = [
+            self.fixture[first_game_index].round
+            for first_game_index in first_games
+            if first_game_index is not None
+        ]
+        output.cycle_probability = len(rounds) / self.samples if self.samples else 0.0
+        if rounds:
+            output.expected_round = math.fsum(rounds) / len(rounds)
+            for cur_round in sorted(set(rounds)):
+                output.round_probabilities[cur_round] = (
+                    rounds.count(cur_round) / self.samples
+                )
+        self.metrics.set_counter("projection_cache_hits", output.cache_hits)
+        self.metrics.set_counter("projection_searches", output.searches)
+        self.logger.info(str(output))
+        return output
+
+    def save_output(self, output: ParityProjectionOutput) -> None:
+        output_file: Path = self.output_file
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            f.write(output.model_dump_json(indent=2))
+        self.logger.info(f"Parity projection stored in {output_file}")
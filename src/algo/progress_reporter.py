@@ -0,0 +1,126 @@
+from algo.data_structures import ProgressSnapshot
+from datetime import datetime
+from types import TracebackType
+from typing import Callable, List, Optional, TextIO, Type
+import logging
+import sys
+import threading
+import time
+
+
+class ProgressReporter:
+    """publishes the progress of a round's search from a background thread, so the search
+    itself does nothing more than it already did (bump dfs_steps, finish thread pairs).
+
+    Every sample_interval seconds a ProgressSnapshot is built and handed to any listeners,
+    and drawn on the terminal when live display is on. A progress line is logged every
+    log_interval seconds, so a search quick enough to finish within that logs nothing extra.
+    Used as a context manager around the search
+    """
+
+    def __init__(
+        self,
+        season: int,
+        cur_round: int,
+        pairs_total: int,
+        dfs_steps: Callable[[], int],
+        best_bound: Callable[[], Optional[datetime]],
+        logger: logging.Logger,
+        log_interval: float = 30.0,
+        live_display: bool = False,
+        sample_interval: float = 0.5,
+        listeners: Optional[List[Callable[[ProgressSnapshot], None]]] = None,
+        stream: TextIO = sys.stderr,
+    ) -> None:
+        self.season = season
+        self.cur_round = cur_round
+        self.pairs_total = pairs_total
+        self.pairs_done = 0
+        self._dfs_steps = dfs_steps
+        self._best_bound = best_bound
+        self.logger = logger
+        self.log_interval = log_interval
+        # only draw on an actual terminal, not redirected output
+        self.live_display = live_display and stream.isatty()
+        self.sample_interval = sample_interval
+        self.listeners = listeners or []
+        self.stream = stream
+        self.latest: Optional[ProgressSnapshot] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._start_time: float = 0.0
+        self._last_steps: int = 0
+        self._last_sample_time: float = 0.0
+
+    def pair_done(self) -> None:
+        """a top-level thread pair has been fully searched"""
+        with self._lock:
+            self.pairs_done += 1
+
+    def sample(self) -> ProgressSnapshot:
+        """build a snapshot of where things are at and publish it"""
+        now: float = time.perf_counter()
+        dfs_steps: int = self._dfs_steps()
+        sample_seconds: float = now - self._last_sample_time
+        steps_per_second: float = (
+            (dfs_steps - self._last_steps) / sample_seconds
+            if sample_seconds > 0
+            else 0.0
+        )
+        self._last_steps, self._last_sample_time = dfs_steps, now
+
+        elapsed_seconds: float = now - self._start_time
+        with self._lock:
+            pairs_done: int = self.pairs_done
+        # the top-level pairs are wildly different sizes, so this is only a rough guide
+        eta_seconds: Optional[float] = None
+        if pairs_done and self.pairs_total:
+            eta_seconds = elapsed_seconds * (self.pairs_total - pairs_done) / pairs_done
+
+        snapshot = ProgressSnapshot(
+            season=self.season,
+            round=self.cur_round,
+            pairs_done=pairs_done,
+            pairs_total=self.pairs_total,
+            dfs_steps=dfs_steps,
+            steps_per_second=steps_per_second,
+            elapsed_seconds=elapsed_seconds,
+            eta_seconds=eta_seconds,
+            best_bound=self._best_bound(),
+        )
+        self.latest = snapshot
+        for listener in self.listeners:
+            listener(snapshot)
+        return snapshot
+
+    def _run(self) -> None:
+        next_log_time: float = self._start_time + self.log_interval
+        while not self._stop.wait(self.sample_interval):
+            snapshot = self.sample()
+            if self.live_display:
+                self.stream.write(f"\r\033[K{snapshot}")
+                self.stream.flush()
+            if time.perf_counter() >= next_log_time:
+                self.logger.info(str(snapshot))
+                next_log_time += self.log_interval
+
+    def __enter__(self) -> "ProgressReporter":
+        self._start_time = self._last_sample_time = time.perf_counter()
+        self._last_steps = self._dfs_steps()
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._stop.set()
+        self._thread.join()
+        # always publish where it finished up
+        self.sample()
+        if self.live_display:
+            self.stream.write("\r\033[K")
+            self.stream.flush()
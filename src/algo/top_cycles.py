@@ -0,0 +1,66 @@
+from algo.cycle_search import CycleSearch
+from algo.data_structures import EdgeDateIndex, HamiltonianCycle
+from models import GameResult, SeasonResults
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+import heapq
+
+
+class TopCycles:
+    """the k earliest distinct hamiltonian cycles of a season, by the date of their last game.
+
+    Best first over the edges rather than over paths: every edge (the first game between a
+    winner and loser) goes on a heap by its date, and they are popped off in order and added to
+    the graph. Every edge already in the graph is no later than the one just added, so every
+    cycle through the new edge is finished on its date - and every cycle is found exactly once,
+    through its own latest edge. So cycles come out in max date order and the search stops as
+    soon as k are in hand, without ever running the full dfs again with cycles excluded.
+    Cycles are kept starting at their lowest team id, as a cycle has a rotation per team
+    """
+
+    @staticmethod
+    def canonical(cycle: List[int]) -> Tuple[int, ...]:
+        """the cycle's rotation starting from its lowest team id"""
+        start: int = cycle.index(min(cycle))
+        return tuple(cycle[start:] + cycle[:start])
+
+    @staticmethod
+    def find(season_results: SeasonResults, k: int) -> List[HamiltonianCycle]:
+        if k <= 0:
+            return []
+        team_ids: List[int] = season_results.team_ids
+        edge_dates: EdgeDateIndex = EdgeDateIndex.from_season(season_results)
+        earliest_cycle_date: Optional[datetime] = edge_dates.earliest_cycle_date(
+            team_ids
+        )
+        if earliest_cycle_date is None or len(team_ids) < 2:
+            return []
+
+        # (date, game id) so ties come off in a set order
+        edge_heap: List[Tuple[datetime, int, int, int]] = [
+            (game.date, game.id, winner, loser)
+            for (winner, loser), game in edge_dates.first_games.items()
+        ]
+        heapq.heapify(edge_heap)
+
+        successors: Dict[int, Set[int]] = {team: set() for team in team_ids}
+        seen: Set[Tuple[int, ...]] = set()
+        top_cycles: List[HamiltonianCycle] = []
+        while edge_heap and len(top_cycles) < k:
+            date, _, winner, loser = heapq.heappop(edge_heap)
+            successors[winner].add(loser)
+            if date < earliest_cycle_date:
+                continue
+            for cycle in CycleSearch.cycles_through_edge(
+                team_ids, successors, winner, loser, k - len(top_cycles)
+            ):
+                canonical: Tuple[int, ...] = TopCycles.canonical(cycle)
+                if canonical in seen:
+                    continue
+                seen.add(canonical)
+                games: List[GameResult] = [
+                    edge_dates.first_games[(team, canonical[(i + 1) % len(canonical)])]
+                    for i, team in enumerate(canonical)
+                ]
+                top_cycles.append(HamiltonianCycle(cycle=list(canonical), games=games))
+        return top_cycles
@@ -0,0 +1,121 @@
+from algo.cycle_search import CycleSweep
+from algo.data_structures import GameTimeline, WhatIfResult
+from models import GameResult, ScheduledGame, SeasonResults
+from typing import Dict, List, Optional, Tuple
+import logging
+import time
+
+
+class WhatIfEngine:
+    """answers "if team A beats team B, is parity complete?" straight away, for as many
+    hypothetical results as are asked.
+
+    The season's games are swept in once (game by game, so the graph is proven to have no
+    hamiltonian cycle as it goes) and the graph is kept, warm. As that graph has no cycle, one
+    more result can only make a cycle through its own edge, so each question is just that much
+    smaller search, and the answer is kept until a real result changes the graph. If the games
+    played already have a cycle, every answer is that parity is already complete.
+
+    The teams are those that have played plus any in the fixture (if given), so a team yet to
+    play can still be asked about, and its first real result added
+    """
+
+    def __init__(
+        self,
+        season_results: SeasonResults,
+        fixture: Optional[List[ScheduledGame]] = None,
+    ) -> None:
+        self.season_results = season_results
+        self.team_names: Dict[int, str] = {
+            teamid: team.name for teamid, team in season_results.teams.items()
+        }
+        # (a team yet to play is only in the fixture)
+        for scheduled_game in fixture or []:
+            if scheduled_game.hteamid and scheduled_game.ateamid:
+                self.team_names.setdefault(
+                    scheduled_game.hteamid, scheduled_game.hteamname or ""
+                )
+                self.team_names.setdefault(
+                    scheduled_game.ateamid, scheduled_game.ateamname or ""
+                )
+        self.team_ids: List[int] = sorted(self.team_names)
+        self.sweep = CycleSweep(self.team_ids)
+        # the completed game that made the first hamiltonian cycle, and the cycle
+        self.first_cycle_game: Optional[GameResult] = None
+        self.first_cycle: Optional[List[int]] = None
+        self.answers: Dict[Tuple[int, int], WhatIfResult] = {}
+        self.logger = logging.getLogger(f"{season_results.season}_main")
+
+        start: float = time.perf_counter()
+        for game in GameTimeline.from_season(season_results):
+            self.add_result(game)
+        self.logger.info(
+            f"What-if state for {season_results.season} ready in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+
+    @property
+    def complete(self) -> bool:
+        """the games played have a hamiltonian cycle"""
+        return self.first_cycle is not None
+
+    def _team_name(self, teamid: int) -> str:
+        return self.team_names[teamid] or str(teamid)
+
+    def add_result(self, game: GameResult) -> bool:
+        """keep the state up to date with a real result, returns True if it completed parity"""
+        if self.complete or not (game.winnerteamid and game.loserteamid):
+            return False
+        if (
+            game.winnerteamid not in self.sweep.successors
+            or game.loserteamid not in self.sweep.successors
+        ):
+            raise ValueError(
+                f"Game {game.id} has a team not in season {self.season_results.season}'s teams"
+            )
+        cycle = self.sweep.add_game(game.winnerteamid, game.loserteamid)
+        self.answers = {}
+        if cycle:
+            self.first_cycle = cycle
+            self.first_cycle_game = game
+            self.logger.info(
+                f"Hamiltonian Cycle completed by game {game.id} in round {game.round}"
+            )
+            return True
+        return False
+
+    def what_if(self, winner: int, loser: int) -> WhatIfResult:
+        """would winner beating loser complete parity"""
+        if (winner, loser) in self.answers:
+            return self.answers[(winner, loser)]
+        if winner == loser or not {winner, loser} <= set(self.sweep.successors):
+            raise ValueError(
+                f"{winner} v {loser} isn't a game between two teams of season {self.season_results.season}"
+            )
+
+        start: float = time.perf_counter()
+        result = WhatIfResult(
+            winner=winner,
+            loser=loser,
+            winner_name=self._team_name(winner),
+            loser_name=self._team_name(loser),
+            already_complete=self.complete,
+            new_edge=loser not in self.sweep.successors[winner],
+        )
+        if not result.already_complete:
+            cycle = self.sweep.cycle_with(winner, loser)
+            if cycle:
+                result.completes_parity = True
+                result.cycle = cycle
+                result.cycle_names = [self._team_name(teamid) for teamid in cycle]
+        result.milliseconds = (time.perf_counter() - start) * 1000
+        self.answers[(winner, loser)] = result
+        return result
+
+    def what_if_game(self, game: ScheduledGame) -> List[WhatIfResult]:
+        """both ways a fixtured game could go, home win then away win"""
+        if not (game.hteamid and game.ateamid):
+            raise ValueError(f"Game {game.id} doesn't have both teams decided yet")
+        return [
+            self.what_if(game.hteamid, game.ateamid),
+            self.what_if(game.ateamid, game.hteamid),
+        ]
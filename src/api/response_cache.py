@@ -0,0 +1,71 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        """headers which let the server respond with a 304 if nothing has changed"""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """on-disk cache of raw API response bodies, keyed by url. Bodies are stored as-is
+    alongside a small metadata file holding the validators for conditional requests"""
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        if cache_dir is None:
+            project_root: Path = Path(__file__).parents[2]  # yueck
+            cache_dir = project_root / ".api_cache"
+        self.cache_dir = cache_dir
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.json"
+
+    def _meta_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.meta.json"
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        body_path = self._body_path(url)
+        meta_path = self._meta_path(url)
+        if not body_path.exists() or not meta_path.exists():
+            return None
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        return CachedResponse(
+            url=url,
+            body=body_path.read_bytes(),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def put(self, response: CachedResponse) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._body_path(response.url).write_bytes(response.body)
+        with open(self._meta_path(response.url), "w") as f:
+            json.dump(
+                {
+                    "url": response.url,
+                    "etag": response.etag,
+                    "last_modified": response.last_modified,
+                },
+                f,
+                indent=2,
+            )
@@ -1,12 +1,40 @@
 import aiohttp
 import asyncio
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Dict, Any
-from models import SeasonResults, GameResult, Team
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+from models import SeasonResults, GameResult, ScheduledGame, Team
+from api.response_cache import ResponseCache, CachedResponse
+from helpers import MetricsHelper
 import logging
 
 
+class SquiggleGamesResponse(BaseModel):
+    """envelope of the squiggle games query, lets the whole response body be decoded and
+    validated into GameResult objects in a single pass"""
+
+    games: List[GameResult]
+
+
+_GAMES_RESPONSE_ADAPTER: TypeAdapter[SquiggleGamesResponse] = TypeAdapter(
+    SquiggleGamesResponse
+)
+
+
+class SquiggleFixtureResponse(BaseModel):
+    """same envelope, for the games yet to be played"""
+
+    games: List[ScheduledGame]
+
+
+_FIXTURE_RESPONSE_ADAPTER: TypeAdapter[SquiggleFixtureResponse] = TypeAdapter(
+    SquiggleFixtureResponse
+)
+_TEAMS_ADAPTER: TypeAdapter[List[Team]] = TypeAdapter(List[Team])
+
+
 class APIRequestError(Exception):
     """generic API request error"""
 
@@ -24,28 +52,55 @@ class APIResponseTypeError(Exception):
     pass
 
 
+class APICacheMissError(Exception):
+    """the response wanted is not in the response cache (only raised when working offline)"""
+
+
 class SquiggleAPI:
     """thx squiggle this is awesome API v helpful 10/10"""
 
     API_URL: str = "https://api.squiggle.com.au/"
     RESOURCE_URL: str = "https://squiggle.com.au"
+    CHUNK_SIZE: int = 64 * 1024
     headers: Dict[str, Any] = {"User-Agent": "mctipper(at)github:afl-parity"}
     season_results: SeasonResults
 
-    def __init__(self, season: int) -> None:
+    def __init__(self, season: int, use_cache: bool = True) -> None:
         self.season = season
+        self.response_cache: Optional[ResponseCache] = (
+            ResponseCache() if use_cache else None
+        )
+        self.all_teams: Dict[int, Team] = {}
         self.season_result_url = (
             f"{self.API_URL}?q=games;year={str(self.season)};complete=100"
         )
+        self.fixture_url = (
+            f"{self.API_URL}?q=games;year={str(self.season)};complete=!100"
+        )
         self.team_data_url = f"{self.API_URL}?q=teams;year={str(self.season)}"
         self.season_results = SeasonResults(season=season, round_results={}, teams={})
         self.logger = logging.getLogger(f"{self.season}_main")
+        self.metrics = MetricsHelper.get(self.season)
+
+    async def _get_api_response_body(self, url: str) -> bytes:
+        """helper method to get the raw response body from the API asynchronously, the body
+        is streamed in chunks rather than decoded by aiohttp so parsing can be done in bulk"""
+        cached: Optional[CachedResponse] = (
+            self.response_cache.get(url) if self.response_cache else None
+        )
+        request_headers: Dict[str, str] = cached.conditional_headers if cached else {}
+        self.metrics.increment("api_requests")
 
-    async def _get_api_response(self, url: str) -> Any:
-        """helper method to get data from the API asynchronously"""
         async with aiohttp.ClientSession(headers=self.headers) as session:
-            async with session.get(url) as response:
-                if response.status >= 400:
+            async with session.get(url, headers=request_headers) as response:
+                if response.status == 304 and cached:
+                    self.metrics.increment("api_cache_hits")
+                    # nothing has changed since last time, no need to download it all again
+                    self.logger.debug(
+                        f"{url} - {response.status} - using cached response"
+                    )
+                    return cached.body
+                elif response.status >= 400:
                     self.logger.error(f"{url} - {response.status} - {response.reason}")
                     raise APIRequestError(
                         f"API request failed with status code {response.status}",
@@ -56,69 +111,142 @@ class SquiggleAPI:
                 else:
                     self.logger.debug(f"{url} - {response.status} - {response.reason}")
 
-                if "json" in response.headers["Content-Type"]:
-                    return await response.json()
-                else:
+                if "json" not in response.headers["Content-Type"]:
                     raise APIResponseTypeError(
                         f"{response.headers['Content-Type']} is not a supported API response type"
                     )
 
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    body.extend(chunk)
+
+                if self.response_cache:
+                    self.response_cache.put(
+                        CachedResponse(
+                            url=url,
+                            body=bytes(body),
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
+                    )
+                return bytes(body)
+
+    async def _get_api_response(self, url: str) -> Any:
+        """helper method to get decoded json data from the API asynchronously"""
+        return from_json(await self._get_api_response_body(url))
+
+    @staticmethod
+    def parse_teams(team_data: Any, resource_url: str = RESOURCE_URL) -> List[Team]:
+        """bulk parse the decoded teams response, validated as a single batch"""
+        return _TEAMS_ADAPTER.validate_python(
+            [
+                {
+                    "id": team["id"],
+                    "name": team["name"],
+                    "abbrev": team["abbrev"],
+                    "logo_url": f"{resource_url}{team['logo']}",
+                }
+                for team in team_data["teams"]
+            ]
+        )
+
+    @staticmethod
+    def parse_season_results(body: bytes) -> List[GameResult]:
+        """bulk parse the raw games response body, json decoding and validation (dates
+        included) all happen in one pass within pydantic-core rather than per game"""
+        return _GAMES_RESPONSE_ADAPTER.validate_json(body).games
+
+    @staticmethod
+    def parse_fixture(body: bytes) -> List[ScheduledGame]:
+        """bulk parse the raw response body of the games yet to be played"""
+        return _FIXTURE_RESPONSE_ADAPTER.validate_json(body).games
+
+    async def fetch_fixture(self) -> List[ScheduledGame]:
+        """the rest of this season's fixture, every game not yet completed"""
+        with self.metrics.stage("fetch_fixture"):
+            body: bytes = await self._get_api_response_body(self.fixture_url)
+        fixture: List[ScheduledGame] = self.parse_fixture(body)
+        self.logger.info(f"Received {len(fixture)} fixtured games from squiggle API")
+        return fixture
+
+    def fixture_from_cache(self) -> List[ScheduledGame]:
+        """offline alternative to fetch_fixture, using only a previously cached response"""
+        if not self.response_cache:
+            raise APICacheMissError("No response cache configured")
+        cached_fixture = self.response_cache.get(self.fixture_url)
+        if not cached_fixture:
+            raise APICacheMissError(f"No cached fixture for season {self.season}")
+        return self.parse_fixture(cached_fixture.body)
+
     async def _populate_teams(self) -> None:
         """get team data from squiggs asynchronously"""
-        team_data: Any = await self._get_api_response(self.team_data_url)
+        with self.metrics.stage("fetch_teams"):
+            team_data: Any = await self._get_api_response(self.team_data_url)
 
         self.logger.info("Received teams data from squiggle API successfully")
 
-        for team in team_data["teams"]:
-            cur_team = Team(
-                id=int(team["id"]),
-                name=team["name"],
-                abbrev=team["abbrev"],
-                logo_url=f"{self.RESOURCE_URL}{team['logo']}",
-            )
-
-            self.season_results.add_team(cur_team)
+        parse_start: float = time.perf_counter()
+        with self.metrics.stage("parse_teams"):
+            for team in self.parse_teams(team_data, self.RESOURCE_URL):
+                self.all_teams[team.id] = team
+                self.season_results.add_team(team)
 
-        self.logger.info("Parsed teams data from squiggle API successfully")
+        self.logger.info(
+            f"Parsed teams data from squiggle API successfully in {(time.perf_counter() - parse_start) * 1000:.2f} ms"
+        )
 
     async def _populate_season_results(self) -> None:
         """get season result data from squiggs asynchronously"""
-        season_result_data: Any = await self._get_api_response(self.season_result_url)
+        with self.metrics.stage("fetch_games"):
+            body: bytes = await self._get_api_response_body(self.season_result_url)
 
         self.logger.info("Received season results data from squiggle API successfully")
 
-        for game in season_result_data["games"]:
-            cur_game = GameResult(
-                round=int(game["round"]),
-                roundname=game["roundname"],
-                id=int(game["id"]),
-                hteamid=game["hteamid"],
-                ateamid=game["ateamid"],
-                hscore=int(game["hscore"]),
-                ascore=int(game["ascore"]),
-                hteamname=game["hteam"],
-                ateamname=game["ateam"],
-                winnerteamid=int(game["winnerteamid"])
-                if game["winnerteamid"]
-                else None,
-                wteamname=game["winner"],
-                date=datetime.strptime(game["date"], "%Y-%m-%d %H:%M:%S"),
-            )
+        parse_start: float = time.perf_counter()
+        with self.metrics.stage("parse_games"):
+            games: List[GameResult] = self.parse_season_results(body)
+            for game in games:
+                self.season_results.add_game_result(game)
 
-            self.season_results.add_game_result(cur_game)
+        self.logger.info(
+            f"Parsed {len(games)} season results from squiggle API successfully in {(time.perf_counter() - parse_start) * 1000:.2f} ms"
+        )
+
+    async def refresh_season_results(self) -> List[GameResult]:
+        """re-poll the completed games for this season, only adding (and returning) the games
+        which have not been seen before. Teams are not re-fetched, they dont change mid-season
+        """
+        with self.metrics.stage("fetch_games"):
+            body: bytes = await self._get_api_response_body(self.season_result_url)
+        known_game_ids = self.season_results.game_ids
+        new_games: List[GameResult] = [
+            game
+            for game in self.parse_season_results(body)
+            if game.id not in known_game_ids
+        ]
+        for game in new_games:
+            self.season_results.add_game_result(game)
 
-        self.logger.info("Parsed teams data from squiggle API successfully")
+        if new_games:
+            self.logger.info(f"Received {len(new_games)} new season results")
+            self._tidy_up_teams()
+        return new_games
 
     def _tidy_up_teams(self) -> None:
         """during the war years teams exist but were not able to play games, this method
         removes those from the team list
         """
-        before_teams_count: int = self.season_results.nteams
-        self.season_results.remove_unused_teams()
+        # re-add from the full list first, a team yet to play early in a live season may
+        # have been tidied away by a previous call
+        with self.metrics.stage("tidy"):
+            for team in self.all_teams.values():
+                self.season_results.add_team(team)
+            before_teams_count: int = len(self.all_teams)
+            self.season_results.remove_unused_teams()
         after_teams_count: int = self.season_results.nteams
         if after_teams_count < before_teams_count:
             self.logger.info(
-                f"Removed {after_teams_count} teams from teams list for this season"
+                f"Removed {before_teams_count - after_teams_count} teams from teams list for this season"
             )
 
     async def _download_logos(self) -> None:
@@ -145,7 +273,8 @@ class SquiggleAPI:
 
             tasks = [download_logo(team) for team in self.season_results.team_list]
 
-            await asyncio.gather(*tasks)
+            with self.metrics.stage("download_logos"):
+                await asyncio.gather(*tasks)
 
             self.logger.info("Downloaded team logos from squiggle successfully")
 
@@ -153,11 +282,31 @@ class SquiggleAPI:
             self.logger.error(f"An error occurred while downloading logos: {str(e)}")
             raise e
 
-    async def populate_data(self) -> None:
-        """builder method, get all the goodies from squiggs asynchronously"""
+    async def populate_results(self) -> None:
+        """get the teams and game results from squiggs asynchronously, no logos"""
         # get the data
         await asyncio.gather(self._populate_teams(), self._populate_season_results())
         # small tidy-up
         self._tidy_up_teams()
+
+    def populate_results_from_cache(self) -> None:
+        """offline alternative to populate_results, using only previously cached responses"""
+        if not self.response_cache:
+            raise APICacheMissError("No response cache configured")
+        cached_teams = self.response_cache.get(self.team_data_url)
+        cached_games = self.response_cache.get(self.season_result_url)
+        if not cached_teams or not cached_games:
+            raise APICacheMissError(f"No cached responses for season {self.season}")
+
+        for team in self.parse_teams(from_json(cached_teams.body), self.RESOURCE_URL):
+            self.all_teams[team.id] = team
+            self.season_results.add_team(team)
+        for game in self.parse_season_results(cached_games.body):
+            self.season_results.add_game_result(game)
+        self._tidy_up_teams()
+
+    async def populate_data(self) -> None:
+        """builder method, get all the goodies from squiggs asynchronously"""
+        await self.populate_results()
         # download logos of teams from that season
         await self._download_logos()
@@ -1,10 +1,20 @@
 from .argument_parser_helper import ArgumentParserHelper
-from .logger_helper import LoggerHelper
+from .database_helper import DatabaseHelper
+from .logger_helper import ContextAdapter, LoggerHelper
+from .manifest_helper import ManifestHelper
+from .metrics_helper import MetricsHelper, SeasonMetrics
 from .output_helper import OutputHelper
+from .profile_helper import ProfileHelper
 
 
 __all__ = [
     "ArgumentParserHelper",
+    "ContextAdapter",
+    "DatabaseHelper",
     "LoggerHelper",
+    "ManifestHelper",
+    "MetricsHelper",
     "OutputHelper",
+    "ProfileHelper",
+    "SeasonMetrics",
 ]
@@ -1,12 +1,49 @@
 import argparse
 from datetime import datetime
 from dataclasses import dataclass
+from typing import Dict, Any, Optional
 
 
 @dataclass
 class Args:
     season: int | str
     debug: bool
+    watch: bool = False
+    poll_interval: int = 300
+    force: bool = False
+    render_workers: int = 0
+    renderer: str = "png"
+    svg_embed_logos: bool = False
+    status: bool = False
+    combined_jsonl: bool = False
+    sqlite: bool = False
+    metrics: bool = False
+    metrics_prometheus: Optional[str] = None
+    profile: Optional[str] = None
+    profile_interval: float = 5.0
+    progress: bool = False
+    progress_interval: float = 30.0
+    time_budget: Optional[float] = None
+    solver: str = "dfs"
+    compact_output: bool = False
+    project: bool = False
+    samples: int = 1000
+    win_model: str = "record"
+    seed: int = 0
+    what_if: bool = False
+    count_cycles: bool = False
+    top_cycles: int = 0
+
+    @property
+    def output_options(self) -> Dict[str, Any]:
+        """the options which can change the output of a season, recorded in its manifest"""
+        return {
+            "renderer": self.renderer,
+            "svg_embed_logos": self.svg_embed_logos,
+            "solver": self.solver,
+            "compact_output": self.compact_output,
+            "top_cycles": self.top_cycles,
+        }
 
 
 class ArgumentParserHelper:
@@ -29,13 +66,291 @@ class ArgumentParserHelper:
             action="store_true",
             help="Enable debug logging to file",
         )
+        self.parser.add_argument(
+            "--status",
+            action="store_true",
+            help="Just print the stored result for the season (no downloading or searching) and exit. Single season only",
+        )
+        self.parser.add_argument(
+            "-w",
+            "--watch",
+            action="store_true",
+            help="Keep running, polling for newly completed games and only re-solving when they arrive. Single season only",
+        )
+        self.parser.add_argument(
+            "--project",
+            action="store_true",
+            help="Project the chance of a hamiltonian cycle by the end of the season (and the round it's made in) by sampling the rest of the fixture, rather than solving the games played. Single season only",
+        )
+        self.parser.add_argument(
+            "--samples",
+            type=int,
+            default=1000,
+            help="Number of samples of the rest of the fixture with --project. Default is 1000",
+        )
+        self.parser.add_argument(
+            "--win-model",
+            type=str,
+            choices=["coin", "record", "percentage"],
+            default="record",
+            help="How the winner of each game left is drawn with --project, coin (50/50), record (win ratio so far) or percentage (points for and against so far). Default is record",
+        )
+        self.parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for --project, the same seed gives the same projection. Default is 0",
+        )
+        self.parser.add_argument(
+            "--what-if",
+            action="store_true",
+            help="For every game of the next round, print whether either result would complete a hamiltonian cycle. Single season only",
+        )
+        self.parser.add_argument(
+            "--count-cycles",
+            action="store_true",
+            help="Count exactly how many distinct hamiltonian cycles each season's graph has after every round (without finding them), rather than searching for the first",
+        )
+        self.parser.add_argument(
+            "-f",
+            "--force",
+            action="store_true",
+            help="Re-solve and re-render seasons even if their inputs are unchanged since the last run",
+        )
+        self.parser.add_argument(
+            "--renderer",
+            type=str,
+            choices=["png", "svg"],
+            default="png",
+            help="Infographic output, png (matplotlib) or svg (lightweight, diffable). Default is png",
+        )
+        self.parser.add_argument(
+            "--svg-embed-logos",
+            action="store_true",
+            help="Embed the team logos in svg infographics rather than linking to them",
+        )
+        self.parser.add_argument(
+            "--combined-jsonl",
+            action="store_true",
+            help="Also append the seasons processed to the append-only output/combined_outputs.jsonl",
+        )
+        self.parser.add_argument(
+            "--sqlite",
+            action="store_true",
+            help="Also store results in the output/results.sqlite database, for querying across seasons",
+        )
+        self.parser.add_argument(
+            "--metrics",
+            action="store_true",
+            help="Append per-stage timings and counters for each season to output/metrics.jsonl",
+        )
+        self.parser.add_argument(
+            "--metrics-prometheus",
+            type=str,
+            default=None,
+            metavar="PATH",
+            help="Also write the metrics in prometheus text format to PATH (ie. for the node_exporter textfile collector)",
+        )
+        self.parser.add_argument(
+            "--solver",
+            type=str,
+            choices=["dfs", "mitm", "sweep"],
+            default="dfs",
+            help="Search used to find the first hamiltonian cycle, dfs (backtracking), mitm (meet in the middle, quicker for the 16+ team seasons that have no early cycle) or sweep (game by game in date order, only searching cycles through each new game). Default is dfs",
+        )
+        self.parser.add_argument(
+            "--compact-output",
+            action="store_true",
+            help="Write each season's json output on a single line rather than indented",
+        )
+        self.parser.add_argument(
+            "--top-cycles",
+            type=int,
+            default=0,
+            metavar="K",
+            help="Also find the K earliest distinct hamiltonian cycles (by the date of their last game) and add them to each season's json output",
+        )
+        self.parser.add_argument(
+            "--time-budget",
+            type=float,
+            default=None,
+            metavar="SECONDS",
+            help="Stop searching a season after this long, keeping the best cycle found so far (marked as not proven optimal) and checkpointing what is left so the next run resumes it",
+        )
+        self.parser.add_argument(
+            "--progress",
+            action="store_true",
+            help="Show a live progress line (explored, steps/sec, best so far, eta) on the terminal while searching",
+        )
+        self.parser.add_argument(
+            "--progress-interval",
+            type=float,
+            default=30.0,
+            help="Seconds between progress log lines during a long search. Default is 30",
+        )
+        self.parser.add_argument(
+            "--profile",
+            type=str,
+            nargs="?",
+            const="cprofile",
+            choices=["cprofile", "sampling"],
+            default=None,
+            help="Profile each season's solve and render, writing .prof/.collapsed files to output/<season>/ and logging the hottest functions. cprofile (default) runs the search on a single thread, sampling is lower overhead for long solves",
+        )
+        self.parser.add_argument(
+            "--profile-interval",
+            type=float,
+            default=5.0,
+            help="Milliseconds between samples with --profile sampling. Default is 5",
+        )
+        self.parser.add_argument(
+            "--render-workers",
+            type=int,
+            default=0,
+            help="Number of processes used to render infographics when doing multiple seasons. Default (0) is based on cpu count",
+        )
+        self.parser.add_argument(
+            "--poll-interval",
+            type=int,
+            default=300,
+            help="Seconds between polls of the squiggle API when watching. Default is 300",
+        )
 
         self.args = self.process_args()
 
     def process_args(self) -> Args:
         parsed_args = self.parser.parse_args()
         self.validate_season(parsed_args.season)
-        return Args(season=parsed_args.season, debug=parsed_args.debug)
+        self.validate_watch(parsed_args.season, parsed_args.watch)
+        self.validate_status(parsed_args.season, parsed_args.status)
+        self.validate_profile(parsed_args.watch, parsed_args.profile)
+        self.validate_project(
+            parsed_args.season,
+            parsed_args.project,
+            parsed_args.watch,
+            parsed_args.samples,
+        )
+        self.validate_time_budget(
+            parsed_args.watch, parsed_args.time_budget, parsed_args.solver
+        )
+        self.validate_what_if(
+            parsed_args.season,
+            parsed_args.what_if,
+            parsed_args.watch,
+            parsed_args.project,
+        )
+        self.validate_count_cycles(
+            parsed_args.count_cycles,
+            parsed_args.watch,
+            parsed_args.project,
+            parsed_args.what_if,
+        )
+        self.validate_top_cycles(parsed_args.top_cycles)
+        return Args(
+            season=parsed_args.season,
+            debug=parsed_args.debug,
+            watch=parsed_args.watch,
+            poll_interval=parsed_args.poll_interval,
+            force=parsed_args.force,
+            render_workers=parsed_args.render_workers,
+            renderer=parsed_args.renderer,
+            svg_embed_logos=parsed_args.svg_embed_logos,
+            status=parsed_args.status,
+            combined_jsonl=parsed_args.combined_jsonl,
+            sqlite=parsed_args.sqlite,
+            metrics=parsed_args.metrics,
+            metrics_prometheus=parsed_args.metrics_prometheus,
+            profile=parsed_args.profile,
+            profile_interval=parsed_args.profile_interval,
+            progress=parsed_args.progress,
+            progress_interval=parsed_args.progress_interval,
+            time_budget=parsed_args.time_budget,
+            solver=parsed_args.solver,
+            compact_output=parsed_args.compact_output,
+            project=parsed_args.project,
+            samples=parsed_args.samples,
+            win_model=parsed_args.win_model,
+            seed=parsed_args.seed,
+            what_if=parsed_args.what_if,
+            count_cycles=parsed_args.count_cycles,
+            top_cycles=parsed_args.top_cycles,
+        )
+
+    def validate_watch(self, season: str, watch: bool) -> None:
+        """custom validator for 'watch', only makes sense for a single season"""
+        if watch and season.lower() == "all":
+            self.parser.error("Cannot watch 'all' seasons, provide a single season.")
+
+    def validate_status(self, season: str, status: bool) -> None:
+        """custom validator for 'status', only makes sense for a single season"""
+        if status and season.lower() == "all":
+            self.parser.error(
+                "Cannot get the status of 'all' seasons, provide a single season."
+            )
+
+    def validate_profile(self, watch: bool, profile: Optional[str]) -> None:
+        """custom validator for 'profile', a watch never finishes so would never be written"""
+        if profile and watch:
+            self.parser.error(
+                "Cannot profile when watching, profile a single run instead."
+            )
+
+    def validate_project(
+        self, season: str, project: bool, watch: bool, samples: int
+    ) -> None:
+        """custom validator for 'project', a single season that isn't being watched"""
+        if not project:
+            return
+        if season.lower() == "all":
+            self.parser.error("Cannot project 'all' seasons, provide a single season.")
+        if watch:
+            self.parser.error("Cannot project when watching.")
+        if samples <= 0:
+            self.parser.error("Samples must be a positive number.")
+
+    def validate_what_if(
+        self, season: str, what_if: bool, watch: bool, project: bool
+    ) -> None:
+        """custom validator for 'what_if', a single season and nothing else"""
+        if not what_if:
+            return
+        if season.lower() == "all":
+            self.parser.error(
+                "Cannot ask what-if of 'all' seasons, provide a single season."
+            )
+        if watch or project:
+            self.parser.error("Cannot ask what-if when watching or projecting.")
+
+    def validate_count_cycles(
+        self, count_cycles: bool, watch: bool, project: bool, what_if: bool
+    ) -> None:
+        """custom validator for 'count_cycles', its own mode"""
+        if count_cycles and (watch or project or what_if):
+            self.parser.error(
+                "Cannot count cycles when watching, projecting or asking what-if."
+            )
+
+    def validate_top_cycles(self, top_cycles: int) -> None:
+        """custom validator for 'top_cycles'"""
+        if top_cycles < 0:
+            self.parser.error("Top cycles can't be negative.")
+
+    def validate_time_budget(
+        self, watch: bool, time_budget: Optional[float], solver: str
+    ) -> None:
+        """custom validator for 'time_budget', positive and not when watching (incremental
+        searches are already quick). Only with dfs, the other solvers can't be checkpointed part
+        way through so every run would start over"""
+        if time_budget is None:
+            return
+        if time_budget <= 0:
+            self.parser.error("Time budget must be a positive number of seconds.")
+        if watch:
+            self.parser.error("Cannot use a time budget when watching.")
+        if solver != "dfs":
+            self.parser.error(
+                f"Cannot use a time budget with the {solver} solver, it can't resume part way through a search."
+            )
 
     def validate_season(self, season: str) -> None:
         """custom validator for 'season'"""
@@ -0,0 +1,196 @@
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class DatabaseHelper:
+    """optional sqlite copy of the results, so queries across seasons dont need to parse every
+    json output. A connection is opened per operation (in WAL mode) so writers and any number
+    of readers (dashboards etc) can use the database concurrently"""
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS seasons (
+            season INTEGER PRIMARY KEY,
+            nteams INTEGER,
+            nrounds INTEGER,
+            cycle_found INTEGER NOT NULL,
+            cycle_round INTEGER,
+            cycle_date TEXT
+        );
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY,
+            season INTEGER NOT NULL REFERENCES seasons (season),
+            round INTEGER NOT NULL,
+            roundname TEXT,
+            date TEXT NOT NULL,
+            hteamid INTEGER NOT NULL,
+            ateamid INTEGER NOT NULL,
+            hteamname TEXT,
+            ateamname TEXT,
+            hscore INTEGER,
+            ascore INTEGER,
+            winnerteamid INTEGER,
+            loserteamid INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS cycles (
+            season INTEGER NOT NULL REFERENCES seasons (season),
+            position INTEGER NOT NULL,
+            teamid INTEGER NOT NULL,
+            teamname TEXT,
+            game_id INTEGER,
+            PRIMARY KEY (season, position)
+        );
+        CREATE TABLE IF NOT EXISTS traversal_stats (
+            season INTEGER PRIMARY KEY REFERENCES seasons (season),
+            total_dfs_steps INTEGER,
+            total_skipped_steps INTEGER,
+            early_exit INTEGER,
+            total_full_paths_not_hamiltonian INTEGER,
+            total_hamiltonian_cycles INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_seasons_cycle_date ON seasons (cycle_date);
+        CREATE INDEX IF NOT EXISTS idx_games_season_round ON games (season, round);
+        CREATE INDEX IF NOT EXISTS idx_games_winner ON games (winnerteamid, season);
+        CREATE INDEX IF NOT EXISTS idx_games_loser ON games (loserteamid, season);
+        CREATE INDEX IF NOT EXISTS idx_cycles_team ON cycles (teamid, season);
+    """
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        if db_path is None:
+            project_root: Path = Path(__file__).parents[2]
+            db_path = project_root / "output" / "results.sqlite"
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def save_season(
+        self,
+        season: int,
+        traversal_output: Dict[str, Any],
+        games: Optional[List[Dict[str, Any]]] = None,
+        nteams: Optional[int] = None,
+        nrounds: Optional[int] = None,
+    ) -> None:
+        """(re)write everything for a season in one transaction. traversal_output is the same
+        shape as the seasons json output. When the full list of games isnt available (ie.
+        loading from the json outputs) the games making up the cycle are stored instead"""
+        first_hamiltonian_cycle: Optional[Dict[str, Any]] = traversal_output.get(
+            "first_hamiltonian_cycle"
+        )
+        cycle_games: List[Dict[str, Any]] = (
+            first_hamiltonian_cycle.get("games", []) if first_hamiltonian_cycle else []
+        )
+        if games is None:
+            games = cycle_games
+
+        with closing(self._connect()) as conn, conn:
+            # everything else references the season, so it goes last
+            for table in ("games", "cycles", "traversal_stats", "seasons"):
+                conn.execute(f"DELETE FROM {table} WHERE season = ?", (season,))
+
+            conn.execute(
+                "INSERT INTO seasons VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    season,
+                    nteams,
+                    nrounds,
+                    int(first_hamiltonian_cycle is not None),
+                    first_hamiltonian_cycle["round"]
+                    if first_hamiltonian_cycle
+                    else None,
+                    str(first_hamiltonian_cycle["date"])
+                    if first_hamiltonian_cycle
+                    else None,
+                ),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        game["id"],
+                        season,
+                        game["round"],
+                        game["roundname"],
+                        str(game["date"]),
+                        game["hteamid"],
+                        game["ateamid"],
+                        game["hteamname"],
+                        game["ateamname"],
+                        game["hscore"],
+                        game["ascore"],
+                        game["winnerteamid"],
+                        game.get("loserteamid"),
+                    )
+                    for game in games
+                ],
+            )
+            if first_hamiltonian_cycle:
+                game_ids: Dict[int, int] = {
+                    game["winnerteamid"]: game["id"] for game in cycle_games
+                }
+                cycle_names: List[str] = first_hamiltonian_cycle.get("cycle_names", [])
+                conn.executemany(
+                    "INSERT INTO cycles VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            season,
+                            position,
+                            teamid,
+                            cycle_names[position]
+                            if position < len(cycle_names)
+                            else None,
+                            game_ids.get(teamid),
+                        )
+                        for position, teamid in enumerate(
+                            first_hamiltonian_cycle["cycle"]
+                        )
+                    ],
+                )
+            conn.execute(
+                "INSERT INTO traversal_stats VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    season,
+                    traversal_output.get("total_dfs_steps"),
+                    traversal_output.get("total_skipped_steps"),
+                    int(bool(traversal_output.get("early_exit"))),
+                    traversal_output.get("total_full_paths_not_hamiltonian"),
+                    traversal_output.get("total_hamiltonian_cycles"),
+                ),
+            )
+
+    def seasons(self) -> List[int]:
+        with closing(self._connect()) as conn:
+            return [
+                row[0]
+                for row in conn.execute("SELECT season FROM seasons ORDER BY season")
+            ]
+
+    def seasons_with_team_in_first_cycle(self, teamid: int) -> List[int]:
+        """every season the team was part of the first hamiltonian cycle"""
+        with closing(self._connect()) as conn:
+            return [
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT season FROM cycles WHERE teamid = ? ORDER BY season",
+                    (teamid,),
+                )
+            ]
+
+    def seasons_by_cycle_date(self) -> List[Tuple[int, int, str]]:
+        """(season, round, date) of every first hamiltonian cycle, ordered by date"""
+        with closing(self._connect()) as conn:
+            return [
+                (row[0], row[1], row[2])
+                for row in conn.execute(
+                    "SELECT season, cycle_round, cycle_date FROM seasons "
+                    "WHERE cycle_found = 1 ORDER BY cycle_date"
+                )
+            ]
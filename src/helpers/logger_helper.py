@@ -1,24 +1,26 @@
+import atexit
 import logging
-from logging import Logger
-from typing import Any, Optional
+import queue
+from logging import Logger, LoggerAdapter, LogRecord
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, MutableMapping, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
-from logging import FileHandler, LogRecord
 from io import TextIOWrapper
 
 
-class LazyFileHandler(FileHandler):
+class LazyFileHandler(RotatingFileHandler):
     """nifty helper that delays the creation of the log file/dir until the first log command is actually received"""
 
     def __init__(
         self,
         filename: Any,
         mode: str = "a",
+        maxBytes: int = 0,
+        backupCount: int = 0,
         encoding: Optional[Any] = None,
-        delay: bool = True,
     ) -> None:
-        self.file_created = False
-        super().__init__(filename, mode, encoding, delay)
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay=True)
 
     def _open(self) -> TextIOWrapper:
         """overrider that first creates the dir before creating the file"""
@@ -26,60 +28,119 @@ class LazyFileHandler(FileHandler):
             Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
         return super()._open()
 
-    def emit(self, record: LogRecord) -> None:
-        """overrider that awaits a log before creating and opening the logfile"""
-        if not self.file_created:
-            self._open()
-            self.file_created = True
-        super().emit(record)
+
+class ContextAdapter(LoggerAdapter[Logger]):
+    """tags each message with where it came from (ie. the round and thread pair of a search)
+    rather than giving each its own logger and file"""
+
+    def __init__(self, logger: Logger, context: str) -> None:
+        super().__init__(logger, {"context": context})
+        self.context = context
+
+    def process(
+        self, msg: Any, kwargs: MutableMapping[str, Any]
+    ) -> Tuple[Any, MutableMapping[str, Any]]:
+        return f"[{self.context}] {msg}", kwargs
 
 
 class LoggerHelper:
-    @staticmethod
-    def setup(
-        current_datetime: datetime,
-        logname: str = "main",
-        output_file_debug: bool = False,
-    ) -> Logger:
-        """creates and configs out a logger"""
-        # determine the root directory of the application (hacky but static so works fine)
-        app_root = Path(__file__).resolve().parents[2]
+    """every logger hands its records to the one queue, and a single listener thread does all
+    the writing (to the console, and one rotating log file per execution). Threads logging
+    mid-search never wait on a file, and setting up the same logger again changes nothing"""
 
-        # create a generic logger
-        logger = logging.getLogger(logname)
-        logger.setLevel(logging.DEBUG)
+    LOG_DIR: Path = Path(__file__).resolve().parents[2] / ".logs"
+    LOG_FILE_MAX_BYTES: int = 50 * 1024**2
+    LOG_FILE_BACKUPS: int = 5
+    _queue: "Optional[queue.SimpleQueue[LogRecord]]" = None
+    _listener: Optional[QueueListener] = None
+    _file_handler: Optional[LazyFileHandler] = None
+
+    @staticmethod
+    def _start_listener(current_datetime: datetime) -> "queue.SimpleQueue[LogRecord]":
+        """the queue, with its listener (and handlers) started on the first call"""
+        if LoggerHelper._queue is not None:
+            return LoggerHelper._queue
 
         # create stream handler
         c_handler = logging.StreamHandler()
         c_handler.setLevel(logging.INFO)
 
-        # and now the file handler
+        # and now the file handler, for everything logged during this execution
         logfilepath = (
-            app_root
-            / f".logs/{current_datetime:%Y%m%d}/{current_datetime:%Y%m%d_%H%M%S}_{logname}.log"
+            LoggerHelper.LOG_DIR
+            / f"{current_datetime:%Y%m%d}/{current_datetime:%Y%m%d_%H%M%S}_main.log"
         )
-        if not logfilepath.parent.is_dir():
-            logfilepath.parent.mkdir(parents=True, exist_ok=True)
-
-        f_handler = LazyFileHandler(logfilepath)
-
-        if output_file_debug:
-            f_handler.setLevel(logging.DEBUG)
-        else:
-            f_handler.setLevel(logging.INFO)
+        f_handler = LazyFileHandler(
+            logfilepath,
+            maxBytes=LoggerHelper.LOG_FILE_MAX_BYTES,
+            backupCount=LoggerHelper.LOG_FILE_BACKUPS,
+        )
+        f_handler.setLevel(logging.INFO)
 
         # create different formatters and add them to each handler
         c_format = logging.Formatter(
             "%(levelname)-8s - [%(filename)s - %(funcName)s() ] - %(message)s"
         )
         f_format = logging.Formatter(
-            "%(asctime)s - %(levelname)-8s - [%(filename)s:%(lineno)s - %(funcName)s() ] --- %(message)s"
+            "%(asctime)s - %(levelname)-8s - %(name)s - [%(filename)s:%(lineno)s - %(funcName)s() ] --- %(message)s"
         )
         c_handler.setFormatter(c_format)
         f_handler.setFormatter(f_format)
 
-        # register them and we are away
-        logger.addHandler(c_handler)
-        logger.addHandler(f_handler)
+        log_queue: "queue.SimpleQueue[LogRecord]" = queue.SimpleQueue()
+        listener = QueueListener(
+            log_queue, c_handler, f_handler, respect_handler_level=True
+        )
+        listener.start()
+        # whatever is still queued gets written before the interpreter exits
+        atexit.register(LoggerHelper.shutdown)
+
+        LoggerHelper._queue = log_queue
+        LoggerHelper._listener = listener
+        LoggerHelper._file_handler = f_handler
+        return log_queue
+
+    @staticmethod
+    def setup(
+        current_datetime: datetime,
+        logname: str = "main",
+        output_file_debug: bool = False,
+    ) -> Logger:
+        """creates and configs out a logger, safe to call again for the same one"""
+        log_queue = LoggerHelper._start_listener(current_datetime)
+
+        # create a generic logger, debug records are only made at all if they're wanted
+        logger = logging.getLogger(logname)
+        logger.setLevel(logging.DEBUG if output_file_debug else logging.INFO)
+        if output_file_debug and LoggerHelper._file_handler:
+            LoggerHelper._file_handler.setLevel(logging.DEBUG)
+
+        # register it (just the once) and we are away
+        queue_handlers = [
+            handler for handler in logger.handlers if isinstance(handler, QueueHandler)
+        ]
+        if not any(handler.queue is log_queue for handler in queue_handlers):
+            for handler in queue_handlers:
+                # left over from before a shutdown
+                logger.removeHandler(handler)
+            logger.addHandler(QueueHandler(log_queue))
 
         return logger
+
+    @staticmethod
+    def context(logger: Logger, context: str) -> ContextAdapter:
+        """the logger, with every message tagged by the context"""
+        return ContextAdapter(logger, context)
+
+    @staticmethod
+    def shutdown() -> None:
+        """write out anything still queued and close the log file, the next setup starts
+        afresh"""
+        if LoggerHelper._listener is not None:
+            LoggerHelper._listener.stop()
+        if LoggerHelper._file_handler is not None:
+            LoggerHelper._file_handler.close()
+        LoggerHelper._queue = None
+        LoggerHelper._listener = None
+        LoggerHelper._file_handler = None
+        atexit.unregister(LoggerHelper.shutdown)
@@ -0,0 +1,108 @@
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models import SeasonResults
+
+
+class ManifestHelper:
+    """each season's output dir gets a manifest recording what produced it (a hash of the
+    input games, the solver version and the options used), so unchanged seasons can be skipped
+    """
+
+    @staticmethod
+    def _output_dir() -> Path:
+        project_root: Path = Path(__file__).parents[2]
+        return project_root / "output"
+
+    @staticmethod
+    def manifest_path(season: int) -> Path:
+        return ManifestHelper._output_dir() / str(season) / f"{season}_manifest.json"
+
+    @staticmethod
+    def compute_input_hash(season_results: "SeasonResults") -> str:
+        """stable hash of the teams and games of a season, independent of the order the
+        API happened to return them in"""
+        games: List[Dict[str, Any]] = sorted(
+            (
+                # only what was given, not what is worked out from it
+                game.model_dump(exclude=set(type(game).model_computed_fields))
+                for round_results in season_results.round_results.values()
+                for game in round_results.results
+            ),
+            key=lambda game: game["id"],
+        )
+        teams: List[Dict[str, Any]] = [
+            season_results.teams[team_id].model_dump()
+            for team_id in season_results.team_ids
+        ]
+        canonical: str = json.dumps(
+            {"season": season_results.season, "teams": teams, "games": games},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def read_manifest(season: int) -> Optional[Dict[str, Any]]:
+        manifest_path = ManifestHelper.manifest_path(season)
+        if not manifest_path.exists():
+            return None
+        try:
+            with open(manifest_path, "r") as f:
+                manifest: Dict[str, Any] = json.load(f)
+            return manifest
+        except json.JSONDecodeError:
+            # treat a corrupt manifest as missing, it will just be recomputed
+            return None
+
+    @staticmethod
+    def is_up_to_date(
+        season: int,
+        input_hash: str,
+        solver_version: str,
+        options: Dict[str, Any],
+    ) -> bool:
+        """true when the existing output was produced from the same inputs, by the same solver
+        version with the same options, and all of the outputs it lists still exist"""
+        manifest = ManifestHelper.read_manifest(season)
+        if not manifest:
+            return False
+        if (
+            manifest.get("input_hash") != input_hash
+            or manifest.get("solver_version") != solver_version
+            or manifest.get("options") != options
+        ):
+            return False
+        output_dir = ManifestHelper._output_dir()
+        return all(
+            (output_dir / output_file).exists()
+            for output_file in manifest.get("outputs", [])
+        )
+
+    @staticmethod
+    def write_manifest(
+        season: int,
+        input_hash: str,
+        solver_version: str,
+        options: Dict[str, Any],
+        outputs: List[Path],
+    ) -> None:
+        output_dir = ManifestHelper._output_dir()
+        manifest: Dict[str, Any] = {
+            "season": season,
+            "input_hash": input_hash,
+            "solver_version": solver_version,
+            "options": options,
+            "outputs": sorted(
+                str(output.relative_to(output_dir)) for output in outputs
+            ),
+            "created": f"{datetime.now():%Y-%m-%d %H:%M:%S}",
+        }
+        manifest_path = ManifestHelper.manifest_path(season)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
@@ -0,0 +1,197 @@
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class SeasonMetrics:
+    """stage timings, counters and gauges collected for a single season. Safe to use from the
+    dfs worker threads, but nothing here should be called per dfs step - counters are set from
+    the running totals once a round is done"""
+
+    def __init__(self, season: int) -> None:
+        self.season = season
+        self._lock = threading.Lock()
+        self.stages: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str, **labels: Any) -> Iterator[None]:
+        """time the enclosed block as a stage, labels (ie. round) are kept with the timing"""
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - start, **labels)
+
+    def record_stage(self, name: str, seconds: float, **labels: Any) -> None:
+        with self._lock:
+            self.stages.append({"stage": name, "seconds": seconds, **labels})
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_counter(self, name: str, value: int) -> None:
+        """for things that already keep their own running total (ie. dfs steps)"""
+        with self._lock:
+            self.counters[name] = value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self.gauges[name] = value
+
+    def stage_totals(self) -> Dict[str, float]:
+        """total seconds spent in each stage"""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for stage in self.stages:
+                totals[stage["stage"]] = (
+                    totals.get(stage["stage"], 0.0) + stage["seconds"]
+                )
+        return totals
+
+    def snapshot(self) -> Dict[str, Any]:
+        """plain (picklable, json-able) copy of everything collected"""
+        with self._lock:
+            return {
+                "season": self.season,
+                "stages": [dict(stage) for stage in self.stages],
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+            }
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """fold in metrics collected elsewhere (ie. a render worker process)"""
+        with self._lock:
+            self.stages.extend(snapshot.get("stages", []))
+            for name, value in snapshot.get("counters", {}).items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            self.gauges.update(snapshot.get("gauges", {}))
+
+
+class MetricsHelper:
+    """per-season metrics, fetched by season the same way the loggers are, so DFS,
+    SquiggleAPI and the infographics can all record into the same place without passing
+    anything around. Nothing is written unless asked for (--metrics / --metrics-prometheus)
+    """
+
+    _registry: Dict[int, SeasonMetrics] = {}
+    _registry_lock = threading.Lock()
+
+    @staticmethod
+    def get(season: int) -> SeasonMetrics:
+        with MetricsHelper._registry_lock:
+            if season not in MetricsHelper._registry:
+                MetricsHelper._registry[season] = SeasonMetrics(season)
+            return MetricsHelper._registry[season]
+
+    @staticmethod
+    def reset(season: Optional[int] = None) -> None:
+        """forget collected metrics, for a single season or all of them"""
+        with MetricsHelper._registry_lock:
+            if season is None:
+                MetricsHelper._registry.clear()
+            else:
+                MetricsHelper._registry.pop(season, None)
+
+    @staticmethod
+    def peak_rss_bytes() -> int:
+        """peak resident memory of this process so far"""
+        max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # linux reports kilobytes, macos bytes
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    @staticmethod
+    def _output_dir() -> Path:
+        project_root: Path = Path(__file__).parents[2]
+        return project_root / "output"
+
+    @staticmethod
+    def metrics_path() -> Path:
+        return MetricsHelper._output_dir() / "metrics.jsonl"
+
+    @staticmethod
+    def _recorded_seasons(seasons: Optional[List[int]]) -> List[SeasonMetrics]:
+        with MetricsHelper._registry_lock:
+            return [
+                metrics
+                for season, metrics in sorted(MetricsHelper._registry.items())
+                if seasons is None or season in seasons
+            ]
+
+    @staticmethod
+    def write_jsonl(
+        seasons: Optional[List[int]] = None, path: Optional[Path] = None
+    ) -> Path:
+        """append a line per season to the metrics file"""
+        path = path or MetricsHelper.metrics_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        timestamp: str = datetime.now().isoformat(timespec="seconds")
+        peak_rss_bytes: int = MetricsHelper.peak_rss_bytes()
+        with open(path, "a") as f:
+            for metrics in MetricsHelper._recorded_seasons(seasons):
+                line: Dict[str, Any] = {"timestamp": timestamp, **metrics.snapshot()}
+                line["stage_totals"] = metrics.stage_totals()
+                line["peak_rss_bytes"] = peak_rss_bytes
+                f.write(json.dumps(line) + "\n")
+        return path
+
+    @staticmethod
+    def _prometheus_name(name: str) -> str:
+        return "".join(c if c.isalnum() else "_" for c in name).lower()
+
+    @staticmethod
+    def write_prometheus(path: Path, seasons: Optional[List[int]] = None) -> Path:
+        """prometheus text format, suitable for the node_exporter textfile collector. Written
+        atomically so the collector never reads half a file"""
+        lines: List[str] = [
+            "# HELP afl_parity_stage_seconds Seconds spent in each stage of the last run",
+            "# TYPE afl_parity_stage_seconds gauge",
+        ]
+        recorded = MetricsHelper._recorded_seasons(seasons)
+        for metrics in recorded:
+            for stage, seconds in sorted(metrics.stage_totals().items()):
+                lines.append(
+                    f'afl_parity_stage_seconds{{season="{metrics.season}",stage="{stage}"}} {seconds:.6f}'
+                )
+        counter_names = sorted({name for m in recorded for name in m.counters})
+        for name in counter_names:
+            metric: str = f"afl_parity_{MetricsHelper._prometheus_name(name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for metrics in recorded:
+                if name in metrics.counters:
+                    lines.append(
+                        f'{metric}{{season="{metrics.season}"}} {metrics.counters[name]}'
+                    )
+        gauge_names = sorted({name for m in recorded for name in m.gauges})
+        for name in gauge_names:
+            metric = f"afl_parity_{MetricsHelper._prometheus_name(name)}"
+            lines.append(f"# TYPE {metric} gauge")
+            for metrics in recorded:
+                if name in metrics.gauges:
+                    lines.append(
+                        f'{metric}{{season="{metrics.season}"}} {metrics.gauges[name]}'
+                    )
+        lines.append("# TYPE afl_parity_peak_rss_bytes gauge")
+        lines.append(f"afl_parity_peak_rss_bytes {MetricsHelper.peak_rss_bytes()}")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write("\n".join(lines) + "\n")
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return path
@@ -1,38 +1,173 @@
 import os
 import json
+import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from helpers.database_helper import DatabaseHelper
 
 
 class OutputHelper:
     @staticmethod
-    def combine_all_json_outputs() -> None:
+    def season_status(season: int) -> str:
+        """one line summary of the stored result for a season, read straight from the json
+        output so nothing heavy needs to be imported"""
+        json_file_path: Path = (
+            OutputHelper._output_dir()
+            / str(season)
+            / f"{season}_dfs_traversal_output.json"
+        )
+        if not json_file_path.exists():
+            return f"{season}: not yet searched"
+
+        with open(json_file_path, "r") as f:
+            data = json.load(f)
+
+        # older outputs predate time budgets, they were always searched to the end
+        unproven: str = (
+            " (time budget ran out, not proven optimal)"
+            if not data.get("proven_optimal", True)
+            else ""
+        )
+        first_hamiltonian_cycle = data.get("first_hamiltonian_cycle")
+        if not first_hamiltonian_cycle:
+            return f"{season}: no hamiltonian cycle found{unproven}"
+        return (
+            f"{season}: hamiltonian cycle found in round {first_hamiltonian_cycle['round']} "
+            f"({first_hamiltonian_cycle['date']}) - {' > '.join(first_hamiltonian_cycle['cycle_names'])}{unproven}"
+        )
+
+    @staticmethod
+    def _output_dir() -> Path:
         project_root: Path = Path(__file__).parents[2]
-        output_dir: Path = project_root / "output"
+        return project_root / "output"
+
+    @staticmethod
+    def _read_season_output(season: int) -> Optional[Dict[str, Any]]:
+        json_file_path: Path = (
+            OutputHelper._output_dir()
+            / str(season)
+            / f"{season}_dfs_traversal_output.json"
+        )
+        if not json_file_path.exists():
+            return None
+
+        with open(json_file_path, "r") as f:
+            data: Dict[str, Any] = json.load(f)
+        return data
+
+    @staticmethod
+    def _combined_entry(season: int) -> Optional[Dict[str, Any]]:
+        """the seasons traversal output, minus the game details, for the combined outputs"""
+        data = OutputHelper._read_season_output(season)
+        if data is None:
+            return None
+
+        # remove the games from the combined file, if want that details just look in the individual outputs
+        if data["first_hamiltonian_cycle"]:
+            if "games" in data["first_hamiltonian_cycle"]:
+                del data["first_hamiltonian_cycle"]["games"]
+        for cycle in data.get("top_hamiltonian_cycles", []):
+            cycle.pop("games", None)
+
+        return data
+
+    @staticmethod
+    def _atomic_write_json(path: Path, data: Any, indent: int = 4) -> None:
+        """write to a temp file alongside, then swap it in, so readers never see half a file"""
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=indent)
+            os.chmod(tmp_path, 0o644)  # mkstemp is owner-only, match a regular open()
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def combine_all_json_outputs() -> None:
+        """full rebuild of the combined outputs from every seasons json output"""
+        output_dir: Path = OutputHelper._output_dir()
 
         # output data
         combined_data: Dict[str, Any] = {}
 
-        # walk through the dirs and get all the jsons
-        for root, dirs, _ in os.walk(output_dir):
-            # sorted(dirs) to make the combined response neat and sequential _nice_
-            for dir_name in sorted(dirs):
-                season = dir_name
-                json_file_path = os.path.join(
-                    root, dir_name, f"{season}_dfs_traversal_output.json"
-                )
-
-                if os.path.exists(json_file_path):
-                    with open(json_file_path, "r") as f:
-                        data = json.load(f)
-
-                    # remove the games from the combined file, if want that details just look in the individual outputs
-                    if data["first_hamiltonian_cycle"]:
-                        if "games" in data["first_hamiltonian_cycle"]:
-                            del data["first_hamiltonian_cycle"]["games"]
-
-                    combined_data[season] = data
-
-        combined_output_path = output_dir / "combined_outputs.json"
-        with open(combined_output_path, "w") as f:
-            json.dump(combined_data, f, indent=4)
+        # only the season dirs, no need to go looking through the logos
+        # sorted to make the combined response neat and sequential _nice_
+        for season in sorted(
+            int(child.name)
+            for child in output_dir.iterdir()
+            if child.is_dir() and child.name.isdigit()
+        ):
+            data = OutputHelper._combined_entry(season)
+            if data is not None:
+                combined_data[str(season)] = data
+
+        OutputHelper._atomic_write_json(
+            output_dir / "combined_outputs.json", combined_data
+        )
+
+    @staticmethod
+    def update_combined_outputs(seasons: List[int], jsonl: bool = False) -> None:
+        """incrementally update the combined outputs with only the seasons touched this run,
+        rather than re-reading every seasons output. Optionally also appends those seasons to
+        the append-only combined_outputs.jsonl (last line for a season wins)"""
+        output_dir: Path = OutputHelper._output_dir()
+        combined_output_path: Path = output_dir / "combined_outputs.json"
+
+        if not combined_output_path.exists():
+            OutputHelper.combine_all_json_outputs()
+        else:
+            with open(combined_output_path, "r") as f:
+                combined_data: Dict[str, Any] = json.load(f)
+
+            for season in seasons:
+                data = OutputHelper._combined_entry(season)
+                if data is not None:
+                    combined_data[str(season)] = data
+
+            OutputHelper._atomic_write_json(
+                combined_output_path,
+                {key: combined_data[key] for key in sorted(combined_data, key=int)},
+            )
+
+        if jsonl:
+            with open(output_dir / "combined_outputs.jsonl", "a") as f:
+                for season in seasons:
+                    data = OutputHelper._combined_entry(season)
+                    if data is not None:
+                        f.write(json.dumps({"season": season, **data}) + "\n")
+
+    @staticmethod
+    def update_database(database: "DatabaseHelper", seasons: List[int]) -> None:
+        """backfill the database from the json outputs for any of the seasons it doesnt have
+        yet (ie. those skipped this run as unchanged). Only the games making up each cycle are
+        in the json outputs, so that is all that can be stored for these"""
+        existing_seasons = set(database.seasons())
+        for season in seasons:
+            if season in existing_seasons:
+                continue
+            data = OutputHelper._read_season_output(season)
+            if data is not None:
+                database.save_season(season=season, traversal_output=data)
+
+    @staticmethod
+    def read_combined_jsonl() -> Dict[str, Any]:
+        """latest record for each season from combined_outputs.jsonl, same shape as the
+        combined_outputs.json"""
+        combined_jsonl_path: Path = (
+            OutputHelper._output_dir() / "combined_outputs.jsonl"
+        )
+        combined_data: Dict[str, Any] = {}
+        if not combined_jsonl_path.exists():
+            return combined_data
+
+        with open(combined_jsonl_path, "r") as f:
+            for line in f:
+                if line.strip():
+                    record: Dict[str, Any] = json.loads(line)
+                    combined_data[str(record.pop("season"))] = record
+
+        return {key: combined_data[key] for key in sorted(combined_data, key=int)}
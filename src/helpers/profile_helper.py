@@ -0,0 +1,206 @@
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType, FrameType, TracebackType
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+
+# a function as cProfile keys it, (filename, line number, function name)
+ProfileFunction = Tuple[str, int, str]
+# a call stack, outermost frame first
+Stack = Tuple[str, ...]
+
+
+class SamplingProfiler:
+    """samples the stack of every thread at a fixed interval, much lower overhead than cProfile
+    for long solves and sees each dfs worker thread separately. Used as a context manager"""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples: Dict[Stack, int] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def _code_name(code: CodeType) -> str:
+        return f"{Path(code.co_filename).name}:{code.co_qualname}"
+
+    def _run(self) -> None:
+        own_thread_id: Optional[int] = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id:
+                    continue
+                stack: List[str] = []
+                cur_frame: Optional[FrameType] = frame
+                while cur_frame:
+                    stack.append(self._code_name(cur_frame.f_code))
+                    cur_frame = cur_frame.f_back
+                key: Stack = tuple(reversed(stack))
+                self.samples[key] = self.samples.get(key, 0) + 1
+
+    def __enter__(self) -> "SamplingProfiler":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+class ProfileHelper:
+    """--profile support, each stage (solve, render) of a season gets its own profile written
+    next to the seasons output, as a .prof (cprofile mode only, for snakeviz/pstats etc) and as
+    collapsed stacks (for flamegraph.pl, speedscope etc)
+
+    cProfile is process wide from python 3.12 (only one can be active at a time), so the dfs
+    worker threads cannot each get their own - in cprofile mode the search is run on a single
+    worker thread to keep the call stacks coherent. sampling mode leaves the threads alone
+    """
+
+    TOP_N: int = 15
+    # limits for turning the cProfile call graph into stacks, only approximate anyway
+    MAX_STACK_DEPTH: int = 48
+    MIN_STACK_MICROSECONDS: float = 1.0
+
+    @staticmethod
+    def _output_dir(season: int) -> Path:
+        project_root: Path = Path(__file__).parents[2]
+        output_dir: Path = project_root / "output" / str(season)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+
+    @staticmethod
+    def profile_path(season: int, stage: str, suffix: str) -> Path:
+        return ProfileHelper._output_dir(season) / f"{season}_{stage}_profile{suffix}"
+
+    @staticmethod
+    def _function_name(function: ProfileFunction) -> str:
+        filename, _, name = function
+        if filename == "~":
+            # builtins, ie. "<method 'append' of 'list' objects>"
+            return name
+        return f"{Path(filename).name}:{name}"
+
+    @staticmethod
+    def collapsed_from_stats(stats: pstats.Stats) -> Dict[Stack, int]:
+        """cProfile only records caller-callee pairs rather than whole stacks, so stacks are
+        rebuilt by walking down from the entry points and sharing each function's time between
+        its callers by how much each one spent calling it. Recursion is folded into the first
+        call. Values are microseconds of self time"""
+        stats_dict = stats.stats  # type: ignore[attr-defined]
+        callees: Dict[ProfileFunction, Dict[ProfileFunction, float]] = {}
+        for function, (_, _, _, _, callers) in stats_dict.items():
+            for caller, caller_stats in callers.items():
+                callees.setdefault(caller, {})[function] = caller_stats[3]
+
+        stacks: Dict[Stack, int] = {}
+
+        def walk(
+            function: ProfileFunction,
+            stack: Stack,
+            on_stack: Tuple[ProfileFunction, ...],
+            seconds: float,
+        ) -> None:
+            _, _, self_time, cumulative_time, _ = stats_dict[function]
+            stack = stack + (ProfileHelper._function_name(function),)
+            share: float = seconds / cumulative_time if cumulative_time else 0.0
+            self_microseconds = int(self_time * share * 1e6)
+            if self_microseconds >= ProfileHelper.MIN_STACK_MICROSECONDS:
+                stacks[stack] = stacks.get(stack, 0) + self_microseconds
+            if len(stack) >= ProfileHelper.MAX_STACK_DEPTH:
+                return
+            for callee, callee_time in callees.get(function, {}).items():
+                callee_seconds: float = callee_time * share
+                if (
+                    callee in on_stack
+                    or callee == function
+                    or callee_seconds * 1e6 < ProfileHelper.MIN_STACK_MICROSECONDS
+                ):
+                    continue
+                walk(callee, stack, on_stack + (function,), callee_seconds)
+
+        for function, (_, _, _, cumulative_time, callers) in stats_dict.items():
+            if not callers:
+                walk(function, (), (), cumulative_time)
+        return stacks
+
+    @staticmethod
+    def write_collapsed(path: Path, stacks: Dict[Stack, int]) -> None:
+        """one "outer;inner;innermost value" line per stack, what flamegraph.pl expects"""
+        with open(path, "w") as f:
+            for stack, value in sorted(stacks.items()):
+                f.write(f"{';'.join(stack)} {value}\n")
+
+    @staticmethod
+    def top_functions_from_stats(stats: pstats.Stats, n: int = TOP_N) -> str:
+        stream = io.StringIO()
+        stats.stream = stream  # type: ignore[attr-defined]
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(n)
+        return stream.getvalue()
+
+    @staticmethod
+    def top_functions_from_samples(samples: Dict[Stack, int], n: int = TOP_N) -> str:
+        """functions ordered by how often they were the one running (self samples)"""
+        total: int = sum(samples.values())
+        self_samples: Dict[str, int] = {}
+        for stack, count in samples.items():
+            if stack:
+                self_samples[stack[-1]] = self_samples.get(stack[-1], 0) + count
+        lines: List[str] = [f"{total} samples"]
+        for name, count in sorted(self_samples.items(), key=lambda item: -item[1])[:n]:
+            lines.append(f"{count:>8} {100 * count / total:>6.1f}%  {name}")
+        return "\n".join(lines)
+
+    @staticmethod
+    @contextmanager
+    def profile(
+        season: int,
+        stage: str,
+        mode: Optional[str],
+        logger: logging.Logger,
+        interval: float = 0.005,
+    ) -> Iterator[None]:
+        """profile the enclosed block (or do nothing at all when mode is None), writing the
+        results to file and logging the hottest functions"""
+        if mode is None:
+            yield
+            return
+
+        if mode == "sampling":
+            with SamplingProfiler(interval) as sampler:
+                yield
+            collapsed_path = ProfileHelper.profile_path(season, stage, ".collapsed")
+            ProfileHelper.write_collapsed(collapsed_path, sampler.samples)
+            logger.info(
+                f"Season {season} {stage} profile written to {collapsed_path}\n"
+                f"{ProfileHelper.top_functions_from_samples(sampler.samples)}"
+            )
+            return
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+        prof_path = ProfileHelper.profile_path(season, stage, ".prof")
+        profiler.dump_stats(prof_path)
+        stats = pstats.Stats(profiler)
+        collapsed_path = ProfileHelper.profile_path(season, stage, ".collapsed")
+        ProfileHelper.write_collapsed(
+            collapsed_path, ProfileHelper.collapsed_from_stats(stats)
+        )
+        logger.info(
+            f"Season {season} {stage} profile written to {prof_path} and {collapsed_path}\n"
+            f"{ProfileHelper.top_functions_from_stats(stats)}"
+        )
@@ -1,18 +1,238 @@
-from helpers import ArgumentParserHelper, LoggerHelper, OutputHelper
-from api.squiggle_api import SquiggleAPI
-from algo.dfs import DFS
-from render.infographic import Infographic
+from helpers import (
+    ArgumentParserHelper,
+    DatabaseHelper,
+    LoggerHelper,
+    OutputHelper,
+    ManifestHelper,
+    MetricsHelper,
+    ProfileHelper,
+)
+from helpers.argument_parser_helper import Args
+from concurrent.futures import Future
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Set, Tuple, Type, TYPE_CHECKING
+from pathlib import Path
+import logging
 import time
 import asyncio
 
+# NOTE
+# the heavier subsystems (aiohttp, pydantic, matplotlib) are imported within the functions that
+# use them rather than up here, so short invocations like --status start up near instantly
+
+if TYPE_CHECKING:
+    from api import SquiggleAPI
+    from render import RenderPool
+
+
+def write_metrics(seasons: List[int], args: Args) -> None:
+    """send the collected metrics to whichever sinks were asked for"""
+    if args.metrics:
+        MetricsHelper.write_jsonl(seasons)
+    if args.metrics_prometheus:
+        MetricsHelper.write_prometheus(Path(args.metrics_prometheus), seasons)
+
+
+async def fetch_season(season: int, args: Args) -> "SquiggleAPI":
+    """set up the season's logging and download its results, run as a task so the next season
+    downloads while the current one is searched"""
+    from api import SquiggleAPI
+
+    # universal logging
+    logger = LoggerHelper.setup(
+        current_datetime=datetime.now(),
+        logname=f"{season}_main",
+        output_file_debug=args.debug,
+    )
+    logger.info(f"\n\n{'*' * 8} Starting {season} {'*' * 8}\n")
+
+    squiggle_api = SquiggleAPI(season)
+    await squiggle_api.populate_data()
+    return squiggle_api
+
+
+async def watch_season(season: int, args: Args) -> None:
+    """long-running mode for the live season: solve once, then keep polling squiggle and
+    only search again (incrementally) when newly completed games turn up"""
+    from api import SquiggleAPI
+    from algo import SOLVERS
+    from render import render_infographic
+
+    logger = LoggerHelper.setup(
+        current_datetime=datetime.now(),
+        logname=f"{season}_main",
+        output_file_debug=args.debug,
+    )
+    logger.info(f"\n\n{'*' * 8} Watching {season} {'*' * 8}\n")
+
+    squiggle_api = SquiggleAPI(season)
+    await squiggle_api.populate_data()
+
+    dfs = SOLVERS[args.solver](
+        squiggle_api.season_results,
+        args.debug,
+        DatabaseHelper() if args.sqlite else None,
+        progress_display=args.progress,
+        progress_interval=args.progress_interval,
+        compact_output=args.compact_output,
+        top_cycles=args.top_cycles,
+    )
+    await dfs.process_season_async()
+    answer_changed: bool = dfs.traversal_output.first_hamiltonian_cycle is not None
+
+    while True:
+        if answer_changed:
+            render_infographic(
+                dfs.season_results,
+                dfs.traversal_output,
+                args.renderer,
+                args.svg_embed_logos,
+            )
+            OutputHelper.update_combined_outputs([season], args.combined_jsonl)
+
+        # a line per poll, rather than one that grows forever
+        write_metrics([season], args)
+        MetricsHelper.reset(season)
+
+        if dfs.traversal_output.first_hamiltonian_cycle:
+            # nothing later in the season can better the first cycle, all done
+            logger.info(f"First Hamiltonian Cycle found for {season}, stopping watch")
+            return
+
+        await asyncio.sleep(args.poll_interval)
+
+        new_games = await squiggle_api.refresh_season_results()
+        if not new_games:
+            logger.info("No new results")
+            answer_changed = False
+            continue
+
+        solve_start: float = time.time()
+        answer_changed = await dfs.process_new_games_async(new_games)
+        logger.info(
+            f"Processed {len(new_games)} new results in {(time.time() - solve_start):.3f} seconds"
+        )
+
+
+async def project_season(season: int, args: Args) -> None:
+    """monte carlo projection of the season's first hamiltonian cycle, over the games still
+    to be played"""
+    from api import SquiggleAPI
+    from algo import ParityProjection
+
+    logger = LoggerHelper.setup(
+        current_datetime=datetime.now(),
+        logname=f"{season}_main",
+        output_file_debug=args.debug,
+    )
+    logger.info(f"\n\n{'*' * 8} Projecting {season} {'*' * 8}\n")
+
+    squiggle_api = SquiggleAPI(season)
+    _, fixture = await asyncio.gather(
+        squiggle_api.populate_results(), squiggle_api.fetch_fixture()
+    )
+
+    projection = ParityProjection(
+        squiggle_api.season_results,
+        fixture,
+        win_model=args.win_model,
+        samples=args.samples,
+        seed=args.seed,
+    )
+    projection_start: float = time.time()
+    # samples are farmed out to worker processes, this just waits on them
+    output = await asyncio.to_thread(projection.project)
+    logger.info(
+        f"Projected {args.samples} samples in {(time.time() - projection_start):.2f} seconds"
+    )
+    projection.save_output(output)
+    print(output)
+    write_metrics([season], args)
+
+
+async def what_if_season(season: int, args: Args) -> None:
+    """whether either result of each game in the next round would complete parity"""
+    from api import SquiggleAPI
+    from algo import WhatIfEngine
+
+    logger = LoggerHelper.setup(
+        current_datetime=datetime.now(),
+        logname=f"{season}_main",
+        output_file_debug=args.debug,
+    )
+
+    squiggle_api = SquiggleAPI(season)
+    _, fixture = await asyncio.gather(
+        squiggle_api.populate_results(), squiggle_api.fetch_fixture()
+    )
+    engine = WhatIfEngine(squiggle_api.season_results, fixture)
+
+    upcoming = [game for game in fixture if game.teams_decided]
+    if not upcoming:
+        print(f"No games left to play in {season}")
+        return
+    next_round: int = min(game.round for game in upcoming)
+    for game in sorted(upcoming, key=lambda game: game.date):
+        if game.round != next_round:
+            continue
+        print(f"{game.roundname} | {game.date} | {game.hteamname} v {game.ateamname}")
+        for result in engine.what_if_game(game):
+            print(f"    {result}")
+    logger.info(f"What-if for round {next_round} of {season} done")
+
+
+async def count_season_cycles(season: int, args: Args) -> None:
+    """exactly how many hamiltonian cycles the season has after each round"""
+    from api import SquiggleAPI
+    from algo import CycleCounter
+
+    logger = LoggerHelper.setup(
+        current_datetime=datetime.now(),
+        logname=f"{season}_main",
+        output_file_debug=args.debug,
+    )
+
+    squiggle_api = SquiggleAPI(season)
+    await squiggle_api.populate_results()
+    count_start: float = time.time()
+    with MetricsHelper.get(season).stage("count_cycles"):
+        counts = await asyncio.to_thread(
+            CycleCounter.count_season, squiggle_api.season_results
+        )
+    output_file: Path = CycleCounter.save_counts(counts)
+    logger.info(
+        f"Counted Hamiltonian Cycles of {season} in {(time.time() - count_start):.2f} seconds, stored in {output_file}"
+    )
+    print(counts)
+
 
 async def main() -> None:
     start_time: float = time.time()
     prev_checkpoint_time: float = start_time
     argument_parser_helper = ArgumentParserHelper()
 
+    if argument_parser_helper.args.status:
+        print(OutputHelper.season_status(int(argument_parser_helper.args.season)))
+        return
+
+    if argument_parser_helper.args.project:
+        await project_season(
+            int(argument_parser_helper.args.season), argument_parser_helper.args
+        )
+        return
+
+    if argument_parser_helper.args.what_if:
+        await what_if_season(
+            int(argument_parser_helper.args.season), argument_parser_helper.args
+        )
+        return
+
+    if argument_parser_helper.args.watch:
+        await watch_season(
+            int(argument_parser_helper.args.season), argument_parser_helper.args
+        )
+        return
+
     seasons: List[int]
     if argument_parser_helper.args.season == "all":
         FIRST_SEASON: int = 1897
@@ -21,41 +241,162 @@ async def main() -> None:
     else:
         seasons = [int(argument_parser_helper.args.season)]
 
-    for season in seasons:
-        # universal logging
-        logger = LoggerHelper.setup(
-            current_datetime=datetime.now(),
-            logname=f"{season}_main",
-            output_file_debug=argument_parser_helper.args.debug,
-        )
+    if argument_parser_helper.args.count_cycles:
+        for season in seasons:
+            await count_season_cycles(season, argument_parser_helper.args)
+        write_metrics(seasons, argument_parser_helper.args)
+        return
 
-        logger.info(f"\n\n{'*' * 8} Starting {season} {'*' * 8}\n")
+    from algo import DFS, SOLVERS
+    from render import RenderPool, render_infographic
 
-        # get data
-        squiggle_api = SquiggleAPI(season)
-        await squiggle_api.populate_data()
+    # png renders are farmed out to worker processes when doing more than one season, so the
+    # next season can be fetched and searched while matplotlib does its thing. svg is quick
+    # enough to just do on a thread alongside the next fetch
+    # when profiling everything is kept in this process so it can be seen
+    solver: Type[DFS] = SOLVERS[argument_parser_helper.args.solver]
+    renderer: str = argument_parser_helper.args.renderer
+    embed_logos: bool = argument_parser_helper.args.svg_embed_logos
+    profile: Optional[str] = argument_parser_helper.args.profile
+    profile_interval: float = argument_parser_helper.args.profile_interval / 1000
+    render_pool: Optional["RenderPool"] = (
+        RenderPool(argument_parser_helper.args.render_workers)
+        if len(seasons) > 1 and renderer == "png" and not profile
+        else None
+    )
+    results_database: Optional[DatabaseHelper] = (
+        DatabaseHelper() if argument_parser_helper.args.sqlite else None
+    )
+    pending_manifests: List[Tuple[int, str, List[Path], Future[Optional[Path]]]] = []
+    # seasons cut short by the time budget, next run needs to pick them back up
+    unproven_seasons: Set[int] = set()
 
-        # determine if hamiltonian cycle exists via DFS algorithm
-        dfs = DFS(squiggle_api.season_results, argument_parser_helper.args.debug)
-        dfs.process_season()
+    # fetch, solve and render are pipelined - the next season downloads while this one is
+    # searched (on an executor) and rendered
+    fetch: "asyncio.Task[SquiggleAPI]" = asyncio.create_task(
+        fetch_season(seasons[0], argument_parser_helper.args)
+    )
 
-        # create infographic of the result (if any)
-        infographic = Infographic(
-            season_results=dfs.season_results, traversal_output=dfs.traversal_output
-        )
-        infographic.create_infographic()
+    try:
+        for season_index, season in enumerate(seasons):
+            # get data
+            squiggle_api = await fetch
+            if season_index + 1 < len(seasons):
+                fetch = asyncio.create_task(
+                    fetch_season(seasons[season_index + 1], argument_parser_helper.args)
+                )
+            logger = logging.getLogger(f"{season}_main")
 
-        # admin
-        checkpoint_time: float = time.time()
+            # skip the season entirely if nothing has changed since it was last produced
+            input_hash: str = ManifestHelper.compute_input_hash(
+                squiggle_api.season_results
+            )
+            if not argument_parser_helper.args.force and ManifestHelper.is_up_to_date(
+                season=season,
+                input_hash=input_hash,
+                solver_version=solver.SOLVER_VERSION,
+                options=argument_parser_helper.args.output_options,
+            ):
+                logger.info(f"Season {season} unchanged since last run, skipping")
+                prev_checkpoint_time = time.time()
+                continue
 
-        logger.info(
-            f"Season {season} in {(checkpoint_time - prev_checkpoint_time):.2f} seconds"
-        )
+            # determine if hamiltonian cycle exists via DFS algorithm
+            dfs = solver(
+                squiggle_api.season_results,
+                argument_parser_helper.args.debug,
+                results_database,
+                max_workers=0 if profile == "cprofile" else None,
+                progress_display=argument_parser_helper.args.progress,
+                progress_interval=argument_parser_helper.args.progress_interval,
+                time_budget=argument_parser_helper.args.time_budget,
+                compact_output=argument_parser_helper.args.compact_output,
+                top_cycles=argument_parser_helper.args.top_cycles,
+            )
+            if profile:
+                # kept on this thread (and nothing else going on) so it can be profiled
+                with ProfileHelper.profile(
+                    season, "solve", profile, logger, profile_interval
+                ):
+                    dfs.process_season()
+            else:
+                await dfs.process_season_async()
+
+            # create infographic of the result (if any)
+            render_future: Future[Optional[Path]]
+            if render_pool:
+                render_future = render_pool.submit(
+                    dfs.season_results, dfs.traversal_output, renderer, embed_logos
+                )
+            elif profile:
+                render_future = Future()
+                with ProfileHelper.profile(
+                    season, "render", profile, logger, profile_interval
+                ):
+                    render_future.set_result(
+                        render_infographic(
+                            dfs.season_results,
+                            dfs.traversal_output,
+                            renderer,
+                            embed_logos,
+                        )
+                    )
+            else:
+                render_future = Future()
+                render_future.set_result(
+                    await asyncio.to_thread(
+                        render_infographic,
+                        dfs.season_results,
+                        dfs.traversal_output,
+                        renderer,
+                        embed_logos,
+                    )
+                )
+            pending_manifests.append(
+                (season, input_hash, [dfs.output_file], render_future)
+            )
+            if not dfs.traversal_output.proven_optimal:
+                unproven_seasons.add(season)
+
+            # admin
+            checkpoint_time: float = time.time()
 
-        prev_checkpoint_time = checkpoint_time
+            logger.info(
+                f"Season {season} in {(checkpoint_time - prev_checkpoint_time):.2f} seconds"
+            )
+            MetricsHelper.get(season).set_gauge(
+                "season_seconds", checkpoint_time - prev_checkpoint_time
+            )
+
+            prev_checkpoint_time = checkpoint_time
+    finally:
+        fetch.cancel()
+        if render_pool:
+            render_pool.shutdown()
+
+    # manifests are only written once everything for that season is on disk
+    for season, input_hash, outputs, render_future in pending_manifests:
+        infographic_file: Optional[Path] = render_future.result()
+        if infographic_file:
+            outputs.append(infographic_file)
+        if season in unproven_seasons:
+            continue
+        ManifestHelper.write_manifest(
+            season=season,
+            input_hash=input_hash,
+            solver_version=solver.SOLVER_VERSION,
+            options=argument_parser_helper.args.output_options,
+            outputs=outputs,
+        )
 
-    # post loop admin
-    OutputHelper.combine_all_json_outputs()
+    # post loop admin, only the seasons actually processed need updating
+    OutputHelper.update_combined_outputs(
+        [season for season, _, _, _ in pending_manifests],
+        argument_parser_helper.args.combined_jsonl,
+    )
+    if results_database:
+        OutputHelper.update_database(results_database, seasons)
+    write_metrics(seasons, argument_parser_helper.args)
 
     end_time: float = time.time()
     logger.info(f"Complete in {(end_time - start_time):.2f} seconds")
@@ -1,3 +1,17 @@
-from .season_models import Team, GameResult, RoundResults, SeasonResults
+from .season_models import (
+    Team,
+    GameResult,
+    ScheduledGame,
+    RoundResults,
+    SeasonResults,
+)
+from .synthetic_season import SyntheticSeason
 
-__all__ = ["Team", "GameResult", "RoundResults", "SeasonResults"]
+__all__ = [
+    "Team",
+    "GameResult",
+    "ScheduledGame",
+    "RoundResults",
+    "SeasonResults",
+    "SyntheticSeason",
+]
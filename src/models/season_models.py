@@ -1,7 +1,13 @@
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    Field,
+    AliasChoices,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
 from datetime import datetime
-from typing import List, Dict, Optional, Iterator
-import json
+from typing import List, Dict, Optional, Iterator, Any, Set
 
 
 class Team(BaseModel):
@@ -18,7 +24,9 @@ class Team(BaseModel):
 
 
 class GameResult(BaseModel):
-    """individual games"""
+    """individual games - the validation aliases allow a squiggle API game record to be
+    validated directly into this model, without any manual re-mapping of the keys
+    """
 
     id: int
     round: int
@@ -28,11 +36,20 @@ class GameResult(BaseModel):
     hscore: int
     ascore: int
     winnerteamid: Optional[int]
-    hteamname: str
-    ateamname: str
-    wteamname: Optional[str]
+    hteamname: str = Field(validation_alias=AliasChoices("hteamname", "hteam"))
+    ateamname: str = Field(validation_alias=AliasChoices("ateamname", "ateam"))
+    wteamname: Optional[str] = Field(
+        validation_alias=AliasChoices("wteamname", "winner")
+    )
     date: datetime
 
+    @field_validator("winnerteamid", mode="before")
+    @classmethod
+    def _draws_have_no_winner(cls, value: Any) -> Any:
+        """squiggle reports draws with an empty winnerteamid, treat those as no winner"""
+        return value if value else None
+
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
     @property
     def loserteamid(self) -> int | None:
         if not self.winnerteamid:
@@ -43,6 +60,7 @@ class GameResult(BaseModel):
             return self.ateamid
         return None
 
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
     @property
     def lteamname(self) -> str | None:
         if not self.winnerteamid:
@@ -53,6 +71,7 @@ class GameResult(BaseModel):
             return self.ateamname
         return None
 
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
     @property
     def wscore(self) -> int | None:
         if not self.winnerteamid:
@@ -63,6 +82,7 @@ class GameResult(BaseModel):
             return self.ascore
         return None
 
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
     @property
     def lscore(self) -> int | None:
         if not self.winnerteamid:
@@ -73,13 +93,43 @@ class GameResult(BaseModel):
             return self.ascore
         return None
 
-    def model_dump_json(self) -> str:  # type: ignore[override]
-        data = self.model_dump()
-        data["loserteamid"] = self.loserteamid
-        data["lteamname"] = self.lteamname
-        data["wscore"] = self.wscore
-        data["lscore"] = self.lscore
-        return json.dumps(data, default=str)
+    @field_serializer("date", when_used="json")
+    def _date_as_str(self, date: datetime) -> str:
+        """same "YYYY-MM-DD HH:MM:SS" the outputs have always had, rather than iso format"""
+        return str(date)
+
+
+class ScheduledGame(BaseModel):
+    """a game yet to be played, straight from a squiggle API game record same as GameResult.
+    Finals not yet decided have no teams"""
+
+    id: int
+    round: int
+    roundname: str
+    hteamid: Optional[int]
+    ateamid: Optional[int]
+    hteamname: Optional[str] = Field(
+        validation_alias=AliasChoices("hteamname", "hteam")
+    )
+    ateamname: Optional[str] = Field(
+        validation_alias=AliasChoices("ateamname", "ateam")
+    )
+    date: datetime
+
+    @field_validator("hteamid", "ateamid", mode="before")
+    @classmethod
+    def _undecided_has_no_team(cls, value: Any) -> Any:
+        return value if value else None
+
+    @property
+    def teams_decided(self) -> bool:
+        return bool(self.hteamid and self.ateamid)
+
+    @classmethod
+    def from_game_result(cls, game: GameResult) -> "ScheduledGame":
+        """a completed game as if it was yet to be played, ie. to project from part way
+        through a finished (or synthetic) season"""
+        return cls.model_validate(game.model_dump())
 
 
 class RoundResults(BaseModel):
@@ -119,6 +169,15 @@ class SeasonResults(BaseModel):
         """list of team id integers"""
         return sorted(list(self.teams.keys()))
 
+    @property
+    def game_ids(self) -> Set[int]:
+        """ids of every game loaded so far"""
+        return {
+            game.id
+            for round_results in self.round_results.values()
+            for game in round_results.results
+        }
+
     @property
     def team_list(self) -> List[Team]:
         return [team for _, team in self.teams.items()]
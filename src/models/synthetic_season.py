@@ -0,0 +1,163 @@
+from pydantic import BaseModel, Field
+from datetime import datetime, timedelta
+from typing import List, Literal, Tuple, Optional
+import random
+from models.season_models import SeasonResults, GameResult, Team
+
+
+class SyntheticSeason(BaseModel):
+    """made-up seasons for any number of teams, real seasons top out at 18 so this is the only
+    way to see how the search scales. The same settings (incl. seed) always build the same season.
+
+    fixture:
+        round_robin - everyone plays everyone once per nteams-1 rounds (circle method), repeating
+                      with home and away swapped if there are more rounds than that
+        random      - a fresh random draw each round
+
+    win_model:
+        uniform    - coin flip
+        strength   - each team gets a random strength, bradley-terry odds of winning
+        ladder     - lower team id always wins, transitive so never a cycle (and the top team
+                     never loses, so fails the cheap all-teams-won-and-lost check)
+        split      - top half always beats the bottom half, within each half a team beats the
+                     next few teams around a circle (so everyone still wins and loses, in the
+                     full round robin anyway). No cycle can get back to the top half so the
+                     search has to exhaust everything. The adversarial one, needs 6+ teams
+    """
+
+    nteams: int = Field(ge=3)
+    nrounds: Optional[int] = None
+    fixture: Literal["round_robin", "random"] = "round_robin"
+    win_model: Literal["uniform", "strength", "ladder", "split"] = "uniform"
+    draw_probability: float = Field(default=0.0, ge=0.0, le=1.0)
+    seed: int = 0
+    season: int = 2100
+
+    @property
+    def name(self) -> str:
+        return f"synthetic_{self.nteams}_{self.fixture}_{self.win_model}_s{self.seed}"
+
+    @property
+    def rounds(self) -> int:
+        """default is a single round robin"""
+        if self.nrounds is not None:
+            return self.nrounds
+        return self.nteams - 1 if self.nteams % 2 == 0 else self.nteams
+
+    def _teams(self) -> List[Team]:
+        return [
+            Team(
+                id=teamid,
+                name=f"Team {teamid}",
+                abbrev=f"T{teamid}",
+                logo_url=f"https://squiggle.com.au/wp-content/uploads/synthetic/T{teamid}.png",
+            )
+            for teamid in range(1, self.nteams + 1)
+        ]
+
+    def _round_robin_pairings(self, rnd: int) -> List[Tuple[int, int]]:
+        """circle method, one team is fixed and the rest rotate around it. An odd number of
+        teams gets a bye (0) which is dropped"""
+        team_ids: List[int] = list(range(1, self.nteams + 1))
+        if len(team_ids) % 2:
+            team_ids.append(0)
+        n: int = len(team_ids)
+        rounds_per_cycle: int = n - 1
+        shift: int = rnd % rounds_per_cycle
+        rotated: List[int] = [team_ids[0]] + (
+            team_ids[1:][-shift:] + team_ids[1:][:-shift] if shift else team_ids[1:]
+        )
+        pairings: List[Tuple[int, int]] = []
+        for i in range(n // 2):
+            home, away = rotated[i], rotated[n - 1 - i]
+            if (rnd // rounds_per_cycle) % 2:
+                home, away = away, home
+            if home and away:
+                pairings.append((home, away))
+        return pairings
+
+    def _random_pairings(self, rng: random.Random) -> List[Tuple[int, int]]:
+        team_ids: List[int] = list(range(1, self.nteams + 1))
+        rng.shuffle(team_ids)
+        return [(team_ids[i], team_ids[i + 1]) for i in range(0, len(team_ids) - 1, 2)]
+
+    def _home_win_probability(
+        self, home: int, away: int, strengths: List[float]
+    ) -> float:
+        if self.win_model == "strength":
+            return strengths[home] / (strengths[home] + strengths[away])
+        if self.win_model == "ladder":
+            return 1.0 if home < away else 0.0
+        if self.win_model == "split":
+            half: int = self.nteams // 2
+            if (home <= half) != (away <= half):
+                return 1.0 if home <= half else 0.0
+            # within a half, each team beats the next half of its half (going around in a
+            # circle) so every team is sure to both win and lose
+            half_size: int = half if home <= half else self.nteams - half
+            distance: int = (away - home) % half_size
+            if 2 * distance < half_size:
+                return 1.0
+            if 2 * distance > half_size:
+                return 0.0
+        return 0.5
+
+    def generate(self) -> SeasonResults:
+        """build the season, teams and every game result"""
+        rng = random.Random(self.seed)
+        # index 0 unused so strengths line up with team ids
+        strengths: List[float] = [1.0] + [
+            rng.lognormvariate(0, 1) for _ in range(self.nteams)
+        ]
+
+        season_results = SeasonResults(season=self.season, round_results={}, teams={})
+        for team in self._teams():
+            season_results.add_team(team)
+
+        season_start = datetime(self.season, 3, 1, 19, 30)
+        game_id: int = 1
+        for rnd in range(self.rounds):
+            pairings = (
+                self._round_robin_pairings(rnd)
+                if self.fixture == "round_robin"
+                else self._random_pairings(rng)
+            )
+            for game_n, (home, away) in enumerate(pairings):
+                hscore: int = rng.randint(40, 130)
+                ascore: int = rng.randint(40, 130)
+                winner: Optional[int]
+                if rng.random() < self.draw_probability:
+                    winner = None
+                    ascore = hscore
+                else:
+                    home_wins = rng.random() < self._home_win_probability(
+                        home, away, strengths
+                    )
+                    winner = home if home_wins else away
+                    # make the scores agree with the result
+                    hscore, ascore = (
+                        (max(hscore, ascore) + 1, min(hscore, ascore))
+                        if home_wins
+                        else (min(hscore, ascore), max(hscore, ascore) + 1)
+                    )
+
+                season_results.add_game_result(
+                    GameResult(
+                        id=game_id,
+                        round=rnd + 1,
+                        roundname=f"Round {rnd + 1}",
+                        hteamid=home,
+                        ateamid=away,
+                        hscore=hscore,
+                        ascore=ascore,
+                        winnerteamid=winner,
+                        hteamname=f"Team {home}",
+                        ateamname=f"Team {away}",
+                        wteamname=f"Team {winner}" if winner else None,
+                        # a week between rounds, every game at a distinct time
+                        date=season_start + timedelta(days=7 * rnd, hours=game_n * 3),
+                    )
+                )
+                game_id += 1
+
+        return season_results
@@ -1,3 +1,21 @@
-from .infographic import Infographic
+from typing import Any
+from .base_infographic import BaseInfographic
+from .svg_infographic import SvgInfographic
+from .render_pool import RenderPool, render_infographic
 
-__all__ = ["Infographic"]
+__all__ = [
+    "BaseInfographic",
+    "Infographic",
+    "RenderPool",
+    "SvgInfographic",
+    "render_infographic",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # the matplotlib infographic is only imported when asked for, it drags in matplotlib
+    if name == "Infographic":
+        from .infographic import Infographic
+
+        return Infographic
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
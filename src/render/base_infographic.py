@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+from algo.data_structures import DFSTraversalOutput
+from models import SeasonResults, Team
+from pathlib import Path
+from typing import List, Tuple
+import math
+
+
+class BaseInfographic(ABC):
+    """the bits shared by every infographic renderer, where the files go and where each team
+    sits on the circle. Deliberately free of any drawing library imports"""
+
+    def __init__(
+        self, season_results: SeasonResults, traversal_output: DFSTraversalOutput
+    ):
+        self.season_results = season_results
+        self.traversal_output = traversal_output
+
+    @property
+    def _output_dir(self) -> Path:
+        project_root: Path = Path(__file__).parents[2]  # yueck
+        output_dir: Path = project_root / "output"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+
+    @property
+    def _logo_dir(self) -> Path:
+        logo_dir = self._output_dir / "logos"
+        logo_dir.mkdir(parents=True, exist_ok=True)
+        return logo_dir
+
+    @property
+    def _season_output_dir(self) -> Path:
+        season_output_dir: Path = self._output_dir / str(self.season_results.season)
+        season_output_dir.mkdir(parents=True, exist_ok=True)
+        return season_output_dir
+
+    @property
+    @abstractmethod
+    def output_file(self) -> Path:
+        """where the infographic is written, each renderer has its own file type"""
+
+    @abstractmethod
+    def create_infographic(self) -> None:
+        """draw the infographic and write it to output_file"""
+
+    def _logo_filename(self, team: Team) -> str:
+        # the Fitzroy.png image is huge for some reason, so prefer just to use a different one than resizing annoyances
+        # the 1990 logo isnt actually referenced until 1994
+        if team.logo_filename == "Fitzroy.png":
+            return "Fitzroy1990.png"
+        return team.logo_filename
+
+    def _cycle_edges(self) -> List[Tuple[int, int]]:
+        """winner-loser pairs around the hamiltonian cycle, wrapping back to the start"""
+        if not self.traversal_output.first_hamiltonian_cycle:
+            return []
+        hamiltonian_cycle = self.traversal_output.first_hamiltonian_cycle.cycle
+        return [
+            (cur_winner, hamiltonian_cycle[(i + 1) % len(hamiltonian_cycle)])
+            for i, cur_winner in enumerate(hamiltonian_cycle)
+        ]
+
+    def _generate_points(self) -> None:
+        """generates an equidistant set of x and y points which will be placements for each team in the circle"""
+
+        # generic parameters for the shape
+        a: int = 10
+        # b: int = 10 # (initially experimented with an ellipse, but stuck with a circle)
+
+        # evenly spaced angles between 0 and 2pi (inclusive, so the last point is the first)
+        nteams: int = self.season_results.nteams
+        theta: List[float] = [2 * math.pi * i / nteams for i in range(nteams + 1)]
+        self.x: List[float] = [a * math.cos(t) for t in theta]
+        self.y: List[float] = [a * math.sin(t) for t in theta]
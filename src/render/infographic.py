@@ -1,64 +1,49 @@
-from algo.data_structures import DFSTraversalOutput
-from models import SeasonResults, Team, GameResult
+from models import Team, GameResult
+from render.base_infographic import BaseInfographic
+from helpers import MetricsHelper
 import numpy as np
-from typing import Any
+from typing import Dict
 from numpy.typing import NDArray
 from pathlib import Path
-import matplotlib.pyplot as plt
-from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+import matplotlib
 
+matplotlib.use("Agg")  # non-interactive, only ever writing to file
 
-class Infographic:
-    """draws the ugly infographic of the parity for that season (if one exists)"""
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.offsetbox import OffsetImage, AnnotationBbox  # noqa: E402
 
-    def __init__(
-        self, season_results: SeasonResults, traversal_output: DFSTraversalOutput
-    ):
-        self.season_results = season_results
-        self.traversal_output = traversal_output
+# decoded logos, kept per process so each logo is only ever read from disk once
+_LOGO_CACHE: Dict[Path, NDArray[np.float64]] = {}
 
-    @property
-    def _output_dir(self) -> Path:
-        project_root: Path = Path(__file__).parents[2]  # yueck
-        output_dir: Path = project_root / "output"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return output_dir
 
-    @property
-    def _logo_dir(self) -> Path:
-        logo_dir = self._output_dir / "logos"
-        logo_dir.mkdir(parents=True, exist_ok=True)
-        return logo_dir
+def load_logo(logo_filepath: Path) -> NDArray[np.float64]:
+    """decode a logo, or return it from the in-memory cache if already decoded"""
+    if logo_filepath not in _LOGO_CACHE:
+        _LOGO_CACHE[logo_filepath] = plt.imread(logo_filepath, format="png")
+    return _LOGO_CACHE[logo_filepath]
 
-    @property
-    def _season_output_dir(self) -> Path:
-        season_output_dir: Path = self._output_dir / str(self.season_results.season)
-        season_output_dir.mkdir(parents=True, exist_ok=True)
-        return season_output_dir
 
-    def _generate_points(self) -> None:
-        """generates an equidistant set of x and y points which will be placements for each team in the circle"""
+def preload_logos(logo_dir: Path) -> None:
+    """decode every logo available up front"""
+    for logo_filepath in sorted(logo_dir.glob("*.png")):
+        load_logo(logo_filepath)
 
-        # generic parameters for the shape
-        a: int = 10
-        # b: int = 10 # (initially experimented with an ellipse, but stuck with a circle)
 
-        # generate evenly spaced angles between 0 and 2pi
-        theta: NDArray[np.floating[Any]] = np.linspace(
-            0, 2 * np.pi, self.season_results.nteams + 1
-        )
-        x_flat: NDArray[np.float64] = a * np.cos(theta)
-        y_flat: NDArray[np.float64] = a * np.sin(theta)
+class Infographic(BaseInfographic):
+    """draws the ugly infographic of the parity for that season (if one exists)"""
 
-        # good grief numpy and mypy are not happy pappys
-        self.x: list[float] = x_flat.tolist()  # type: ignore
-        self.y: list[float] = y_flat.tolist()  # type: ignore
+    @property
+    def output_file(self) -> Path:
+        return self._season_output_dir / Path(
+            f"hamiltonian_cycle_infographic_{self.season_results.season}.png"
+        )
 
     def create_infographic(self) -> None:
         """using matplotlib to build an annotated circle, with team logos as points"""
 
         if self.traversal_output.first_hamiltonian_cycle:
-            _, ax = plt.subplots(figsize=(20, 20))
+            metrics = MetricsHelper.get(self.season_results.season)
+            fig, ax = plt.subplots(figsize=(20, 20))
             ax.set_axis_off()  # this aint no graph
             ax.set_facecolor("#FFFDD0")  # Prince would be so happy
 
@@ -94,17 +79,13 @@ class Infographic:
                     cur_loser = hamiltonian_cycle[0]
 
                 cur_team: Team = self.season_results.get_team(cur_winner)
-
-                # the Fitzroy.png image is huge for some reason, so prefer just to use a different one than resizing annoyances
-                # the 1990 logo isnt actually referenced until 1994
-                logo_override: str
-                if cur_team.logo_filename == "Fitzroy.png":
-                    logo_override = "Fitzroy1990.png"
-                else:
-                    logo_override = cur_team.logo_filename
-
-                logo_filepath: Path = self._logo_dir / logo_override
-                img: NDArray[np.float64] = plt.imread(logo_filepath, format="png")
+                logo_filepath: Path = self._logo_dir / self._logo_filename(cur_team)
+                metrics.increment(
+                    "logo_cache_hits"
+                    if logo_filepath in _LOGO_CACHE
+                    else "logo_cache_misses"
+                )
+                img: NDArray[np.float64] = load_logo(logo_filepath)
                 imagebox: OffsetImage = OffsetImage(img, zoom=0.8)
                 imagebox.image.axes = ax
 
@@ -174,13 +155,9 @@ class Infographic:
             # neaten the presentation
             ax.set_aspect("equal")
 
-            # output resulting infograph to file
-            plt.savefig(
-                self._season_output_dir
-                / Path(
-                    f"hamiltonian_cycle_infographic_{self.season_results.season}.png"
-                )
-            )
+            # output resulting infograph to file, closing the figure so they dont pile up in memory
+            fig.savefig(self.output_file)
+            plt.close(fig)
         else:
             # explicit "do nothing" when there is no hamiltonian cycle to draw
             pass
@@ -0,0 +1,134 @@
+from algo.data_structures import DFSTraversalOutput
+from models import SeasonResults
+from render.base_infographic import BaseInfographic
+from render.svg_infographic import SvgInfographic
+from helpers import MetricsHelper
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, List, Type, Tuple, Dict, Any
+import multiprocessing
+import os
+
+
+def _init_worker() -> None:
+    """runs once in each worker process, decoding every logo into that workers cache"""
+    from render.infographic import preload_logos
+
+    project_root: Path = Path(__file__).parents[2]  # yueck
+    logo_dir: Path = project_root / "output" / "logos"
+    if logo_dir.is_dir():
+        preload_logos(logo_dir)
+
+
+def render_infographic(
+    season_results: SeasonResults,
+    traversal_output: DFSTraversalOutput,
+    renderer: str = "png",
+    embed_logos: bool = False,
+) -> Optional[Path]:
+    """draw a single infographic, returns the file written (if there was anything to draw).
+    matplotlib is only imported when actually drawing a png"""
+    infographic: BaseInfographic
+    if renderer == "svg":
+        infographic = SvgInfographic(
+            season_results=season_results,
+            traversal_output=traversal_output,
+            embed_logos=embed_logos,
+        )
+    else:
+        from render.infographic import Infographic
+
+        infographic = Infographic(
+            season_results=season_results, traversal_output=traversal_output
+        )
+    with MetricsHelper.get(season_results.season).stage("render", renderer=renderer):
+        infographic.create_infographic()
+    if traversal_output.first_hamiltonian_cycle:
+        return infographic.output_file
+    return None
+
+
+def _render_in_worker(
+    season_results: SeasonResults,
+    traversal_output: DFSTraversalOutput,
+    renderer: str,
+    embed_logos: bool,
+) -> Tuple[Optional[Path], Dict[str, Any]]:
+    """render_infographic, but also hands back the metrics recorded in the worker process
+    as they would otherwise never make it back to the main process"""
+    MetricsHelper.reset(season_results.season)
+    infographic_file = render_infographic(
+        season_results, traversal_output, renderer, embed_logos
+    )
+    return infographic_file, MetricsHelper.get(season_results.season).snapshot()
+
+
+class RenderPool:
+    """renders infographics in a pool of worker processes, so matplotlib can get on with it
+    while the main process moves on to the next season"""
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        if not max_workers:
+            cpu_count: int = os.cpu_count() or 1
+            max_workers = max(cpu_count - 2, 1)
+        self.max_workers = max_workers
+        self.futures: List[Future[Optional[Path]]] = []
+        # spawn rather than fork, the parent is running an event loop and threads
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def submit(
+        self,
+        season_results: SeasonResults,
+        traversal_output: DFSTraversalOutput,
+        renderer: str = "png",
+        embed_logos: bool = False,
+    ) -> "Future[Optional[Path]]":
+        worker_future = self.executor.submit(
+            _render_in_worker, season_results, traversal_output, renderer, embed_logos
+        )
+        future: Future[Optional[Path]] = Future()
+
+        def _on_done(
+            done: "Future[Tuple[Optional[Path], Dict[str, Any]]]",
+        ) -> None:
+            if done.cancelled():
+                future.cancel()
+                return
+            exception = done.exception()
+            if exception:
+                future.set_exception(exception)
+                return
+            infographic_file, metrics_snapshot = done.result()
+            MetricsHelper.get(season_results.season).merge(metrics_snapshot)
+            future.set_result(infographic_file)
+
+        worker_future.add_done_callback(_on_done)
+        self.futures.append(future)
+        return future
+
+    def shutdown(self) -> None:
+        """wait for all submitted renders to finish, raising the first failure (if any)"""
+        try:
+            for future in self.futures:
+                future.result()
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> "RenderPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.shutdown()
+        else:
+            self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,170 @@
+from algo.data_structures import DFSTraversalOutput
+from models import SeasonResults, GameResult, Team
+from render.base_infographic import BaseInfographic
+from pathlib import Path
+from typing import List, Tuple
+from xml.sax.saxutils import escape, quoteattr
+import base64
+import math
+
+
+class SvgInfographic(BaseInfographic):
+    """draws the same ugly infographic as Infographic, but writes the SVG by hand - no
+    matplotlib, and the output is plain text so it can be diffed between runs.
+
+    Logos are linked relative to the season output dir by default, or embedded as base64
+    when embed_logos is set (makes the file standalone, but much bigger)
+    """
+
+    # canvas is the same 20x20 inch, 100dpi, as the matplotlib version
+    SIZE: int = 2000
+    # circle radius is 10 in _generate_points, leave some room for the logos around it
+    EXTENT: float = 12.0
+    LOGO_SIZE: int = 120
+    # keep arrows clear of the logos at either end
+    ARROW_SHRINK: float = 85.0
+    ARROW_WIDTH: int = 14
+    TITLE_FONT_SIZE: int = 56
+    LABEL_FONT_SIZE: int = 28
+
+    def __init__(
+        self,
+        season_results: SeasonResults,
+        traversal_output: DFSTraversalOutput,
+        embed_logos: bool = False,
+    ):
+        super().__init__(season_results, traversal_output)
+        self.embed_logos = embed_logos
+
+    @property
+    def output_file(self) -> Path:
+        return self._season_output_dir / Path(
+            f"hamiltonian_cycle_infographic_{self.season_results.season}.svg"
+        )
+
+    def _to_canvas(self, x: float, y: float) -> Tuple[float, float]:
+        """data co-ordinates (centred on 0,0, y up) to canvas co-ordinates (y down)"""
+        scale: float = self.SIZE / (2 * self.EXTENT)
+        return (x + self.EXTENT) * scale, (self.EXTENT - y) * scale
+
+    @staticmethod
+    def _fmt(value: float) -> str:
+        """fixed precision so the same inputs always produce byte-identical output"""
+        formatted = f"{value:.2f}"
+        return "0.00" if formatted == "-0.00" else formatted
+
+    def _text(self, x: float, y: float, lines: List[str], font_size: int) -> str:
+        """multi-line text, vertically centred on the point"""
+        cx, cy = self._to_canvas(x, y)
+        first_dy: float = -(len(lines) - 1) / 2 * 1.2
+        tspans = "".join(
+            f'<tspan x="{self._fmt(cx)}" dy="{first_dy if i == 0 else 1.2:.2f}em">{escape(line)}</tspan>'
+            for i, line in enumerate(lines)
+        )
+        return (
+            f'<text x="{self._fmt(cx)}" y="{self._fmt(cy)}" font-size="{font_size}" '
+            f'text-anchor="middle" dominant-baseline="central">{tspans}</text>'
+        )
+
+    def _logo_href(self, team: Team) -> str:
+        logo_filename: str = self._logo_filename(team)
+        if self.embed_logos:
+            logo_filepath: Path = self._logo_dir / logo_filename
+            encoded: str = base64.b64encode(logo_filepath.read_bytes()).decode()
+            return f"data:image/png;base64,{encoded}"
+        return f"../logos/{logo_filename}"
+
+    def _logo(self, x: float, y: float, team: Team) -> str:
+        cx, cy = self._to_canvas(x, y)
+        half: float = self.LOGO_SIZE / 2
+        return (
+            f'<image x="{self._fmt(cx - half)}" y="{self._fmt(cy - half)}" '
+            f'width="{self.LOGO_SIZE}" height="{self.LOGO_SIZE}" '
+            f"href={quoteattr(self._logo_href(team))}/>"
+        )
+
+    def _arrow(self, x1: float, y1: float, x2: float, y2: float) -> str:
+        ax1, ay1 = self._to_canvas(x1, y1)
+        ax2, ay2 = self._to_canvas(x2, y2)
+        length: float = math.hypot(ax2 - ax1, ay2 - ay1)
+        ux: float = (ax2 - ax1) / length
+        uy: float = (ay2 - ay1) / length
+        return (
+            f'<line x1="{self._fmt(ax1 + ux * self.ARROW_SHRINK)}" '
+            f'y1="{self._fmt(ay1 + uy * self.ARROW_SHRINK)}" '
+            f'x2="{self._fmt(ax2 - ux * self.ARROW_SHRINK)}" '
+            f'y2="{self._fmt(ay2 - uy * self.ARROW_SHRINK)}" '
+            f'stroke="black" stroke-width="{self.ARROW_WIDTH}" marker-end="url(#arrowhead)"/>'
+        )
+
+    def build_svg(self) -> str:
+        """the full svg document as a string, empty if there is no hamiltonian cycle"""
+        if not self.traversal_output.first_hamiltonian_cycle:
+            return ""
+
+        season = self.season_results.season
+        rnd = self.traversal_output.first_hamiltonian_cycle.max_round
+        dt = self.traversal_output.first_hamiltonian_cycle.max_date
+
+        self._generate_points()
+
+        elements: List[str] = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.SIZE}" height="{self.SIZE}" '
+            f'viewBox="0 0 {self.SIZE} {self.SIZE}" font-family="DejaVu Sans, sans-serif">',
+            "<defs>",
+            '<marker id="arrowhead" viewBox="0 0 10 10" refX="5" refY="5" markerWidth="3" '
+            'markerHeight="3" orient="auto-start-reverse"><path d="M 0 0 L 10 5 L 0 10 z"/></marker>',
+            "</defs>",
+            f'<rect width="{self.SIZE}" height="{self.SIZE}" fill="white"/>',
+            # info to put in the centre of the circle
+            self._text(
+                0,
+                0,
+                [f"Season {season}", f"Round {rnd}", f"{dt:%a. %d/%m/%Y}"],
+                self.TITLE_FONT_SIZE,
+            ),
+        ]
+
+        # same ordering as the matplotlib version, logos first then arrows and annotations
+        cycle_edges = self._cycle_edges()
+        for i, (cur_winner, _) in enumerate(cycle_edges):
+            cur_team: Team = self.season_results.get_team(cur_winner)
+            elements.append(self._logo(self.x[i], self.y[i], cur_team))
+
+        for i, (cur_winner, cur_loser) in enumerate(cycle_edges):
+            cur_game_deets: GameResult = (
+                self.season_results.get_first_game_result_between_teams(
+                    cur_winner, cur_loser
+                )
+            )
+            # the last point generated is the first again, so no wrapping needed here
+            cur_x, cur_y = self.x[i], self.y[i]
+            next_x, next_y = self.x[i + 1], self.y[i + 1]
+            # the 0.85 is to move the annotations slightly in, so they appear 'next' to the arrows
+            mid_x: float = ((cur_x + next_x) / 2) * 0.85
+            mid_y: float = ((cur_y + next_y) / 2) * 0.85
+
+            elements.append(self._arrow(cur_x, cur_y, next_x, next_y))
+            elements.append(
+                self._text(
+                    mid_x,
+                    mid_y,
+                    [
+                        f"Rnd. {cur_game_deets.round}",
+                        f"{cur_game_deets.wscore}-{cur_game_deets.lscore}",
+                    ],
+                    self.LABEL_FONT_SIZE,
+                )
+            )
+
+        elements.append("</svg>")
+        return "\n".join(elements) + "\n"
+
+    def create_infographic(self) -> None:
+        """write the svg to file (if there is a hamiltonian cycle to draw)"""
+        svg: str = self.build_svg()
+        if svg:
+            self.output_file.write_text(svg)
+        else:
+            # explicit "do nothing" when there is no hamiltonian cycle to draw
+            pass
@@ -0,0 +1,84 @@
+import pytest
+from algo import DFS, ChronologicalSweep, SearchCancelledError
+from models import SyntheticSeason
+
+
+@pytest.mark.parametrize(
+    "synthetic_season",
+    [
+        SyntheticSeason(nteams=nteams, win_model=win_model, seed=seed)
+        for nteams in (5, 8, 11)
+        for win_model in ("uniform", "strength", "split")
+        for seed in range(2)
+    ]
+    + [
+        SyntheticSeason(
+            nteams=7, fixture="random", nrounds=8, win_model=win_model, seed=seed
+        )
+        for win_model in ("uniform", "strength")
+        for seed in range(4)
+    ],
+    ids=lambda synthetic_season: synthetic_season.name,
+)
+def test_same_first_cycle_as_dfs(synthetic_season):
+    season_results = synthetic_season.generate()
+    dfs = DFS(season_results, max_workers=0, resume=False)
+    dfs.process_season(save_output=False)
+    sweep = ChronologicalSweep(season_results, max_workers=0)
+    sweep.process_season(save_output=False)
+
+    expected = dfs.traversal_output.first_hamiltonian_cycle
+    found = sweep.traversal_output.first_hamiltonian_cycle
+    assert sweep.traversal_output.proven_optimal
+    if expected is None:
+        assert found is None
+        return
+    assert found.max_date == expected.max_date
+    assert sorted(found.cycle) == season_results.team_ids
+    assert len(found.games) == season_results.nteams
+
+
+def test_fewer_steps_than_dfs():
+    season_results = SyntheticSeason(nteams=16, win_model="split").generate()
+    dfs = DFS(season_results, max_workers=0, resume=False)
+    dfs.process_season(save_output=False)
+    sweep = ChronologicalSweep(season_results, max_workers=0)
+    sweep.process_season(save_output=False)
+    assert sweep.dfs_steps < dfs.dfs_steps
+
+
+def test_process_new_games():
+    season_results = SyntheticSeason(nteams=8, seed=1).generate()
+    last_round = season_results.rounds_list[-1]
+    new_games = list(season_results.get_round_results(last_round))
+    season_results.round_results.pop(last_round)
+
+    sweep = ChronologicalSweep(season_results, max_workers=0)
+    sweep.process_season(save_output=False)
+    sweep._save_output_to_file = lambda: None
+    for game in new_games:
+        season_results.add_game_result(game)
+    sweep.process_new_games(new_games)
+
+    dfs = DFS(season_results, max_workers=0, resume=False)
+    dfs.process_season(save_output=False)
+    assert (
+        sweep.traversal_output.first_hamiltonian_cycle.max_date
+        == dfs.traversal_output.first_hamiltonian_cycle.max_date
+    )
+
+
+class _Cancelled:
+    cancelled = True
+
+
+def test_cancelled_and_no_time_budget():
+    season_results = SyntheticSeason(nteams=8).generate()
+    with pytest.raises(SearchCancelledError):
+        ChronologicalSweep(season_results, cancel_token=_Cancelled()).process_season(
+            save_output=False
+        )
+    with pytest.raises(ValueError):
+        ChronologicalSweep(season_results, time_budget=10).process_season(
+            save_output=False
+        )
@@ -0,0 +1,66 @@
+from algo.constraint_propagation import ConstraintPropagation
+
+
+def test_forced_edges():
+    # 1's only win is over 2, so 3's win over 2 can't be used, leaving 3 only 3 -> 1
+    successors = {1: {2}, 2: {3}, 3: {1, 2}}
+    assert ConstraintPropagation.propagate([1, 2, 3], successors) == {
+        1: {2},
+        2: {3},
+        3: {1},
+    }
+    # not changed in place
+    assert successors[3] == {1, 2}
+
+
+def test_forced_path():
+    successors = {1: {2, 3}, 2: {3, 1}, 3: {1, 2}}
+    assert ConstraintPropagation.propagate([1, 2, 3], successors, path=[1, 3]) == {
+        1: {3},
+        2: {1},
+        3: {2},
+    }
+    # the path uses an edge that isn't there
+    assert (
+        ConstraintPropagation.propagate([1, 2], {1: {2}, 2: {1}}, path=[2, 2]) is None
+    )
+
+
+def test_no_win_or_loss():
+    assert (
+        ConstraintPropagation.propagate([1, 2, 3], {1: {2}, 2: {3}, 3: set()}) is None
+    )
+    assert ConstraintPropagation.propagate([1, 2, 3], {1: {2}, 2: {1}, 3: {1}}) is None
+
+
+def test_chain_closed_early_removed():
+    # 1 -> 2 -> 3 is forced, so 3 can't go back to 1 before 4 is visited
+    successors = {1: {2}, 2: {3}, 3: {1, 4}, 4: {1, 2, 3}}
+    assert ConstraintPropagation.propagate([1, 2, 3, 4], successors) == {
+        1: {2},
+        2: {3},
+        3: {4},
+        4: {1},
+    }
+
+
+def test_forced_sub_loop():
+    # 1 and 2 only beat each other, a loop that leaves out 3 and 4
+    successors = {1: {2}, 2: {1}, 3: {4, 1}, 4: {3, 2}}
+    assert ConstraintPropagation.propagate([1, 2, 3, 4], successors) is None
+
+
+def test_chain_into_loop():
+    # 1 -> 2 -> 3 -> 2, the chain from 1 runs into a loop
+    successors = {1: {2}, 2: {3}, 3: {2}, 4: {1}}
+    predecessors = {1: {4}, 2: {1, 3}, 3: {2}, 4: set()}
+    assert (
+        ConstraintPropagation._forced_chains_ok([1, 2, 3, 4], successors, predecessors)
+        is None
+    )
+    assert ConstraintPropagation.propagate([1, 2, 3, 4], successors) is None
+
+
+def test_whole_cycle_forced():
+    successors = {1: {2}, 2: {3}, 3: {1}}
+    assert ConstraintPropagation.propagate([1, 2, 3], successors) == successors
@@ -0,0 +1,114 @@
+import itertools
+import math
+import pytest
+from algo import DFS, CycleCounter
+from algo.data_structures import HamiltonianCycleCounts
+from models import SyntheticSeason
+
+
+def _successors(season_results):
+    successors = {team: set() for team in season_results.team_ids}
+    for round_results in season_results:
+        for game in round_results:
+            if game.winnerteamid:
+                successors[game.winnerteamid].add(game.loserteamid)
+    return successors
+
+
+def _every_ordering(team_ids, successors):
+    first, *others = team_ids
+    cycles = 0
+    for order in itertools.permutations(others):
+        cycle = [first, *order]
+        cycles += all(b in successors[a] for a, b in zip(cycle, cycle[1:] + cycle[:1]))
+    return cycles
+
+
+@pytest.mark.parametrize(
+    "synthetic_season",
+    [
+        SyntheticSeason(
+            nteams=nteams,
+            fixture="random",
+            nrounds=nteams + 3,
+            win_model=win_model,
+            seed=seed,
+        )
+        for nteams in (5, 7, 8)
+        for win_model in ("uniform", "strength", "split")
+        for seed in range(2)
+    ],
+    ids=lambda synthetic_season: synthetic_season.name,
+)
+def test_same_as_every_ordering(synthetic_season):
+    season_results = synthetic_season.generate()
+    successors = _successors(season_results)
+    assert CycleCounter.count(season_results.team_ids, successors) == _every_ordering(
+        season_results.team_ids, successors
+    )
+
+
+def test_everyone_beats_everyone():
+    # every ordering of the other teams is a cycle, far too many to ever enumerate
+    for nteams in (2, 3, 6, 12):
+        team_ids = list(range(1, nteams + 1))
+        successors = {team: set(team_ids) - {team} for team in team_ids}
+        assert CycleCounter.count(team_ids, successors) == math.factorial(nteams - 1)
+    assert CycleCounter.count(team_ids, successors, modulus=1000) == (
+        math.factorial(11) % 1000
+    )
+
+
+def test_no_cycles():
+    season_results = SyntheticSeason(nteams=8, win_model="ladder").generate()
+    assert CycleCounter.count(season_results.team_ids, _successors(season_results)) == 0
+    assert CycleCounter.count([1], {1: set()}) == 0
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_count_season(seed):
+    season_results = SyntheticSeason(
+        nteams=9, fixture="random", nrounds=12, seed=seed
+    ).generate()
+    counts = CycleCounter.count_season(season_results)
+    assert list(counts.round_counts) == season_results.rounds_list
+    # more games never take a cycle away
+    round_counts = list(counts.round_counts.values())
+    assert round_counts == sorted(round_counts)
+    assert counts.season_end == round_counts[-1]
+    assert counts.season_end == CycleCounter.count(
+        season_results.team_ids, _successors(season_results)
+    )
+
+    dfs = DFS(season_results, max_workers=0, resume=False)
+    dfs.process_season(save_output=False)
+    assert dfs.traversal_output.first_hamiltonian_cycle
+    assert counts.first_round == dfs.traversal_output.first_hamiltonian_cycle.max_round
+
+
+def test_save_counts(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        CycleCounter, "output_file", staticmethod(lambda season: tmp_path / "out.json")
+    )
+    counts = CycleCounter.count_season(SyntheticSeason(nteams=6).generate())
+    output_file = CycleCounter.save_counts(counts)
+    assert type(counts).model_validate_json(output_file.read_text()) == counts
+
+
+def test_counts_first_round():
+    counts = HamiltonianCycleCounts(
+        season=2025, round_counts={0: 2, 1: 5}, season_end=5
+    )
+    # the opening round is round 0
+    assert counts.first_round == 0
+    assert str(counts).endswith("First round with any: 0")
+    assert HamiltonianCycleCounts(season=2025, round_counts={0: 0}).first_round is None
+    assert str(HamiltonianCycleCounts(season=2025)).endswith("First round with any: -")
+
+    # a count of 0 modulo 5 could be 5 cycles
+    counts = HamiltonianCycleCounts(
+        season=2025, modulus=5, round_counts={0: 0, 1: 0}, season_end=0
+    )
+    with pytest.raises(ValueError):
+        counts.first_round
+    assert str(counts).endswith("(mod 5)")
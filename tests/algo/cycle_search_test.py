@@ -0,0 +1,83 @@
+import pytest
+from algo import DFS
+from algo.cycle_search import CycleSearch, CycleSweep
+from algo.data_structures import GameTimeline
+from models import SyntheticSeason
+
+
+def test_through_edge():
+    successors = {1: {2, 3}, 2: {3}, 3: {1, 4}, 4: {1}}
+    assert CycleSearch.through_edge([1, 2, 3, 4], successors, 1, 2) == [1, 2, 3, 4]
+    # every cycle has to go 1 -> 2
+    assert CycleSearch.through_edge([1, 2, 3, 4], successors, 1, 3) is None
+    # not changed in place
+    assert successors[1] == {2, 3}
+
+
+def test_no_cycle():
+    # transitive, nobody beats 1
+    successors = {1: {2, 3}, 2: {3}, 3: set()}
+    assert CycleSearch.through_edge([1, 2, 3], successors, 1, 2) is None
+
+
+@pytest.mark.parametrize(
+    "synthetic_season",
+    [
+        SyntheticSeason(
+            nteams=nteams, fixture="random", nrounds=12, win_model=win_model, seed=seed
+        )
+        for nteams in (6, 9, 12)
+        for win_model in ("uniform", "strength", "split")
+        for seed in range(2)
+    ],
+    ids=lambda synthetic_season: synthetic_season.name,
+)
+def test_game_by_game_same_first_cycle_as_dfs(synthetic_season):
+    season_results = synthetic_season.generate()
+    dfs = DFS(season_results, max_workers=0, resume=False)
+    dfs.process_season(save_output=False)
+    expected = dfs.traversal_output.first_hamiltonian_cycle
+
+    team_ids = season_results.team_ids
+    successors = {team: set() for team in team_ids}
+    found = None
+    for game in GameTimeline.from_season(season_results):
+        if game.loserteamid in successors[game.winnerteamid]:
+            continue
+        successors[game.winnerteamid].add(game.loserteamid)
+        cycle = CycleSearch.through_edge(
+            team_ids, successors, game.winnerteamid, game.loserteamid
+        )
+        if cycle:
+            found = (game.date, cycle)
+            break
+
+    if expected is None:
+        assert found is None
+        return
+    assert found[0] == expected.max_date
+    assert sorted(found[1]) == team_ids
+    assert found[1][:2] == [game.winnerteamid, game.loserteamid]
+
+
+def test_sweep():
+    sweep = CycleSweep([1, 2, 3])
+    assert sweep.add_game(1, 2) is None
+    assert sweep.add_game(2, 3) is None
+    # asking doesn't add the game
+    assert sweep.cycle_with(3, 1) == [3, 1, 2]
+    assert 1 not in sweep.successors[3]
+    assert sweep.searches == 1
+    # the same graph again is looked up
+    assert sweep.add_game(3, 1) == [3, 1, 2]
+    assert sweep.cache_hits == 1
+
+
+def test_sweep_shared_cache():
+    cache = {}
+    CycleSweep([1, 2, 3], {1: {2}, 2: {3}}, cache).add_game(3, 1)
+    sweep = CycleSweep([1, 2, 3], {1: {2}, 2: {3}}, cache)
+    assert sweep.add_game(3, 1) == [3, 1, 2]
+    assert (sweep.searches, sweep.cache_hits) == (0, 1)
+    # a team yet to win, not searched at all
+    assert CycleSweep([1, 2, 3], {1: {2}}).cycle_with(3, 1) is None
@@ -1,4 +1,7 @@
+import json
+import pytest
 from datetime import datetime
+from pathlib import Path
 from algo.data_structures import HamiltonianCycle, DFSTraversalOutput
 from models import GameResult
 
@@ -99,3 +102,52 @@ def test_model_dump_json():
     assert "total_full_paths_not_hamiltonian" in json_data
     assert "total_hamiltonian_cycles" in json_data
     assert "first_hamiltonian_cycle" in json_data
+
+
+@pytest.mark.parametrize("season", [1897, 2000, 2024])
+def test_model_dump_json_same_as_outputs(season):
+    output_file = (
+        Path(__file__).parents[3]
+        / "output"
+        / str(season)
+        / f"{season}_dfs_traversal_output.json"
+    )
+    output = output_file.read_text()
+    traversal_output = DFSTraversalOutput.model_validate_json(output)
+    data = json.loads(traversal_output.model_dump_json(indent=2))
+    # (written before there was a time budget)
+    data.pop("proven_optimal")
+    assert json.dumps(data, indent=2) == output
+    assert list(data["first_hamiltonian_cycle"] or {}) == (
+        ["cycle", "cycle_names", "date", "round", "games"]
+        if data["first_hamiltonian_cycle"]
+        else []
+    )
+
+
+def test_model_dump_without_top_cycles():
+    traversal_output = DFSTraversalOutput()
+    assert "top_hamiltonian_cycles" not in traversal_output.model_dump()
+    assert "top_hamiltonian_cycles" not in json.loads(
+        traversal_output.model_dump_json()
+    )
+
+    game = GameResult(
+        id=1,
+        round=0,
+        roundname="Opening Round",
+        hteamid=1,
+        ateamid=2,
+        hscore=100,
+        ascore=90,
+        winnerteamid=1,
+        hteamname="Team A",
+        ateamname="Team B",
+        wteamname="Team A",
+        date=datetime(2025, 3, 10),
+    )
+    traversal_output.top_hamiltonian_cycles = [
+        HamiltonianCycle(cycle=[1, 2], games=[game])
+    ]
+    data = json.loads(traversal_output.model_dump_json())
+    assert [cycle["cycle"] for cycle in data["top_hamiltonian_cycles"]] == [[1, 2]]
@@ -0,0 +1,32 @@
+from datetime import datetime
+from algo.data_structures import EdgeDateIndex
+
+
+def test_first_game_kept(make_game):
+    index = EdgeDateIndex([make_game(1, 1, 1, 2, 5), make_game(2, 1, 1, 2, 9)])
+    assert index.first_game(1, 2).id == 1
+    assert index.first_game(2, 1) is None
+    # a late arriving earlier result takes over
+    index.add_game(make_game(3, 1, 1, 2, 2))
+    assert index.first_game(1, 2).id == 3
+    assert index.wins[1] == [(datetime(2025, 3, 2), 2)]
+    assert index.losses[2] == [(datetime(2025, 3, 2), 1)]
+
+
+def test_earliest_win_and_loss(make_game):
+    index = EdgeDateIndex(
+        [make_game(1, 1, 1, 2, 5), make_game(2, 1, 1, 3, 3), make_game(3, 1, 3, 2, 4)]
+    )
+    assert index.earliest_win(1, {2, 3}) == datetime(2025, 3, 3)
+    assert index.earliest_win(1, {2}) == datetime(2025, 3, 5)
+    assert index.earliest_win(1, {4}) is None
+    assert index.earliest_loss(2, {1, 3}) == datetime(2025, 3, 4)
+    assert index.earliest_loss(2, {1}) == datetime(2025, 3, 5)
+
+
+def test_earliest_cycle_date(make_game):
+    index = EdgeDateIndex([make_game(1, 1, 1, 2, 1), make_game(2, 1, 2, 3, 2)])
+    # team 1 never loses
+    assert index.earliest_cycle_date([1, 2, 3]) is None
+    index.add_game(make_game(3, 1, 3, 1, 7))
+    assert index.earliest_cycle_date([1, 2, 3]) == datetime(2025, 3, 7)
@@ -0,0 +1,38 @@
+from datetime import datetime
+from algo.data_structures import GameTimeline
+
+
+def test_games_in_date_order(make_game):
+    timeline = GameTimeline(
+        [make_game(1, 1, 1, 2, 9), make_game(2, 1, 2, 3, 2), make_game(3, 1, 3, 1, 5)]
+    )
+    assert [game.id for game in timeline] == [2, 3, 1]
+    assert timeline.dates == sorted(timeline.dates)
+    # same date stays in the order added
+    timeline.add_game(make_game(4, 1, 1, 3, 5))
+    assert [game.id for game in timeline] == [2, 3, 4, 1]
+
+
+def test_draws_left_out(make_game):
+    draw = make_game(1, 1, 1, 2, 3).model_copy(
+        update={"winnerteamid": None, "hscore": 90, "wteamname": None}
+    )
+    timeline = GameTimeline([draw, make_game(2, 1, 1, 2, 4)])
+    assert len(timeline) == 1
+
+
+def test_snapshot_at(make_game):
+    timeline = GameTimeline(
+        [make_game(1, 1, 1, 2, 1), make_game(2, 1, 2, 3, 5), make_game(3, 1, 3, 1, 9)]
+    )
+    assert [game.id for game in timeline.games_before(datetime(2025, 3, 5))] == [1]
+    assert [game.id for game in timeline.games_from(datetime(2025, 3, 5))] == [2, 3]
+    assert timeline.games_before(datetime(2025, 2, 1)) == []
+
+    adjacency_graph = timeline.adjacency_graph_at(datetime(2025, 3, 6))
+    assert adjacency_graph.parents == {1, 2}
+    assert adjacency_graph.children == {2, 3}
+    edge_dates = timeline.edge_dates_at(datetime(2025, 3, 10))
+    assert edge_dates.earliest_cycle_date([1, 2, 3]) == datetime(2025, 3, 9)
+    # (the game on the day itself isn't in the snapshot yet)
+    assert timeline.edge_dates_at(datetime(2025, 3, 9)).first_game(3, 1) is None
@@ -0,0 +1,318 @@
+import asyncio
+import itertools
+import json
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from algo import DFS, SearchCancelledError
+from algo.data_structures import DFSCheckpoint
+from models import SeasonResults, SyntheticSeason
+
+
+@pytest.fixture
+def season_results(make_team, make_game):
+    season_results = SeasonResults(season=2025, round_results={}, teams={})
+    for teamid in range(1, 5):
+        season_results.add_team(make_team(teamid))
+    # every team has won and lost after round 2, but no cycle through all four yet
+    season_results.add_game_result(make_game(1, 1, 1, 2, 1))
+    season_results.add_game_result(make_game(2, 1, 3, 4, 2))
+    season_results.add_game_result(make_game(3, 2, 2, 1, 8))
+    season_results.add_game_result(make_game(4, 2, 4, 3, 9))
+    return season_results
+
+
+@pytest.fixture
+def dfs(season_results, monkeypatch):
+    dfs = DFS(season_results)
+    monkeypatch.setattr(dfs, "_save_output_to_file", lambda: None)
+    return dfs
+
+
+def test_process_season_no_cycle(dfs):
+    dfs.process_season()
+    assert dfs.traversal_output.first_hamiltonian_cycle is None
+
+
+def test_process_season_finds_cycle(dfs, season_results, make_game):
+    season_results.add_game_result(make_game(5, 3, 2, 3, 15))
+    season_results.add_game_result(make_game(6, 3, 4, 1, 16))
+    dfs.process_season()
+    assert dfs.traversal_output.first_hamiltonian_cycle is not None
+    assert dfs.traversal_output.first_hamiltonian_cycle.max_date == datetime(
+        2025, 3, 16
+    )
+
+
+def test_process_new_games_finds_cycle(dfs, season_results, make_game):
+    dfs.process_season()
+    new_games = [make_game(5, 3, 2, 3, 15), make_game(6, 3, 4, 1, 16)]
+    for game in new_games:
+        season_results.add_game_result(game)
+    assert dfs.process_new_games(new_games) is True
+    first_hamiltonian_cycle = dfs.traversal_output.first_hamiltonian_cycle
+    assert first_hamiltonian_cycle is not None
+    assert sorted(first_hamiltonian_cycle.cycle) == [1, 2, 3, 4]
+    assert first_hamiltonian_cycle.max_date == datetime(2025, 3, 16)
+
+
+def test_process_new_games_no_change(dfs, season_results, make_game):
+    dfs.process_season()
+    new_games = [make_game(5, 3, 1, 3, 15)]
+    season_results.add_game_result(new_games[0])
+    assert dfs.process_new_games(new_games) is False
+    assert dfs.traversal_output.first_hamiltonian_cycle is None
+    assert dfs.process_new_games([]) is False
+
+
+def test_process_new_games_uses_skipped_rounds(
+    dfs, season_results, make_team, make_game
+):
+    # team 5 has no loss until the new game, so every round was skipped without a search
+    season_results.add_team(make_team(5))
+    season_results.add_game_result(make_game(5, 3, 2, 3, 15))
+    season_results.add_game_result(make_game(6, 3, 5, 1, 16))
+    dfs.process_season()
+    assert dfs.traversal_output.first_hamiltonian_cycle is None
+
+    new_games = [make_game(7, 4, 4, 5, 22)]
+    season_results.add_game_result(new_games[0])
+    assert dfs.process_new_games(new_games) is True
+    first_hamiltonian_cycle = dfs.traversal_output.first_hamiltonian_cycle
+    assert first_hamiltonian_cycle is not None
+    assert sorted(first_hamiltonian_cycle.cycle) == [1, 2, 3, 4, 5]
+    assert first_hamiltonian_cycle.max_date == datetime(2025, 3, 22)
+
+
+@pytest.mark.parametrize("compact_output", [False, True])
+def test_save_output_to_file(
+    season_results, tmp_path, monkeypatch, compact_output, make_game
+):
+    output_file = tmp_path / "output.json"
+    monkeypatch.setattr(DFS, "output_file", property(lambda self: output_file))
+    season_results.add_game_result(make_game(5, 3, 2, 3, 15))
+    season_results.add_game_result(make_game(6, 3, 4, 1, 16))
+    dfs = DFS(season_results, compact_output=compact_output)
+    dfs.process_season()
+
+    output = output_file.read_text()
+    assert (len(output.splitlines()) == 1) == compact_output
+    data = json.loads(output)
+    assert data["first_hamiltonian_cycle"]["date"] == "2025-03-16 00:00:00"
+    assert data["first_hamiltonian_cycle"]["games"][0]["lteamname"]
+
+
+def test_inline_search_same_result(season_results, monkeypatch, make_game):
+    season_results.add_game_result(make_game(5, 3, 2, 3, 15))
+    season_results.add_game_result(make_game(6, 3, 4, 1, 16))
+    threaded = DFS(season_results)
+    inline = DFS(season_results, max_workers=0)
+    for dfs in (threaded, inline):
+        monkeypatch.setattr(dfs, "_save_output_to_file", lambda: None)
+        dfs.process_season()
+    assert (
+        inline.traversal_output.first_hamiltonian_cycle
+        == threaded.traversal_output.first_hamiltonian_cycle
+    )
+
+
+def _earliest_cycle_brute_force(season_results):
+    """min over every hamiltonian cycle of the season of its latest (first) game"""
+    first_games = {}
+    for round_results in season_results:
+        for game in round_results:
+            if game.winnerteamid and game.loserteamid:
+                first_games.setdefault((game.winnerteamid, game.loserteamid), game.date)
+    first, *others = season_results.team_ids
+    best = None
+    for order in itertools.permutations(others):
+        cycle = [first, *order, first]
+        edges = list(zip(cycle, cycle[1:]))
+        if all(edge in first_games for edge in edges):
+            max_date = max(first_games[edge] for edge in edges)
+            best = max_date if best is None else min(best, max_date)
+    return best
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("win_model", ["uniform", "strength"])
+def test_bound_keeps_earliest_cycle(seed, win_model):
+    season_results = SyntheticSeason(
+        nteams=7, fixture="random", nrounds=8, win_model=win_model, seed=seed
+    ).generate()
+    dfs = DFS(season_results, max_workers=0, resume=False)
+    dfs.process_season(save_output=False)
+    first_hamiltonian_cycle = dfs.traversal_output.first_hamiltonian_cycle
+    expected = _earliest_cycle_brute_force(season_results)
+    if expected is None:
+        assert first_hamiltonian_cycle is None
+    else:
+        assert first_hamiltonian_cycle.max_date == expected
+
+
+def test_lower_bound(dfs, season_results, make_game):
+    dfs._build_adjacency_graph(2)
+    # 1-2 then 2 has to beat 3 or 4, and it never has
+    assert dfs._lower_bound([1], 2, datetime(2025, 3, 1)) is None
+
+    season_results.add_game_result(make_game(5, 3, 2, 3, 15))
+    season_results.add_game_result(make_game(6, 3, 4, 1, 16))
+    dfs._build_adjacency_graph(3)
+    # 2 can only go on to 3 (on the 15th), the only cycle 1-2-3-4 finishes on the 16th
+    assert dfs._lower_bound([1], 2, datetime(2025, 3, 1)) == datetime(2025, 3, 15)
+
+
+def test_progress_published(dfs, season_results, make_game):
+    season_results.add_game_result(make_game(5, 3, 2, 3, 15))
+    season_results.add_game_result(make_game(6, 3, 4, 1, 16))
+    snapshots = []
+    dfs.progress_listeners.append(snapshots.append)
+    dfs.process_season()
+    # at least the final snapshot of each round searched
+    assert snapshots
+    assert snapshots[-1].pairs_done == snapshots[-1].pairs_total
+    assert snapshots[-1].best_bound == datetime(2025, 3, 16)
+
+
+@pytest.fixture
+def checkpoint_file(tmp_path, monkeypatch):
+    checkpoint_file = tmp_path / "checkpoint.json"
+    monkeypatch.setattr(DFS, "checkpoint_file", property(lambda self: checkpoint_file))
+    return checkpoint_file
+
+
+def test_time_budget_checkpoint_and_resume(checkpoint_file, monkeypatch):
+    # a clock that ticks on every look, and the deadline checked on every step
+    clock = itertools.count()
+    monkeypatch.setattr(
+        "algo.dfs.time", SimpleNamespace(perf_counter=lambda: next(clock))
+    )
+    monkeypatch.setattr(DFS, "STOP_CHECK_STEPS", 1)
+    season_results = SyntheticSeason(nteams=14, win_model="split").generate()
+
+    unbudgeted = DFS(season_results, max_workers=0)
+    unbudgeted.process_season(save_output=False)
+
+    runs = 0
+    while True:
+        runs += 1
+        dfs = DFS(season_results, max_workers=0, time_budget=40)
+        dfs.process_season(save_output=False)
+        if dfs.traversal_output.proven_optimal:
+            break
+        assert checkpoint_file.exists()
+        assert runs < 100
+
+    assert runs > 1
+    assert not checkpoint_file.exists()
+    assert dfs.traversal_output.first_hamiltonian_cycle is None
+    # every path searched in the end, a few more steps for re-searching the frontier paths
+    assert dfs.dfs_steps >= unbudgeted.dfs_steps
+
+
+def test_time_budget_keeps_best_so_far(dfs, season_results, checkpoint_file, make_game):
+    season_results.add_game_result(make_game(5, 3, 2, 3, 15))
+    season_results.add_game_result(make_game(6, 3, 4, 1, 16))
+    dfs.process_season()
+    first_hamiltonian_cycle = dfs.traversal_output.first_hamiltonian_cycle
+    assert dfs.traversal_output.proven_optimal
+
+    # out of time part way through, the cycle found is kept but not proven
+    dfs._reset_traversal()
+    dfs._restore_checkpoint(
+        DFSCheckpoint(
+            season=2025,
+            solver_version=DFS.SOLVER_VERSION,
+            round=3,
+            input_hash="",
+            best_cycle=first_hamiltonian_cycle.cycle,
+        )
+    )
+    assert dfs.traversal_output.first_hamiltonian_cycle == first_hamiltonian_cycle
+
+
+def test_stale_checkpoint_ignored(dfs, season_results, checkpoint_file):
+    checkpoint_file.write_text(
+        DFSCheckpoint(
+            season=2025,
+            solver_version=DFS.SOLVER_VERSION,
+            round=2,
+            input_hash="not the same games",
+            frontier=[],
+        ).model_dump_json()
+    )
+    assert dfs._load_checkpoint() is None
+    checkpoint_file.write_text(
+        DFSCheckpoint(
+            season=2025,
+            solver_version=DFS.SOLVER_VERSION,
+            round=2,
+            input_hash=dfs._rounds_hash(2),
+            frontier=[],
+        ).model_dump_json()
+    )
+    assert dfs._load_checkpoint() is not None
+
+
+class _CancelAfter:
+    """stands in for a CancellationToken, cancelled after being looked at so many times"""
+
+    def __init__(self, checks):
+        self.checks = checks
+
+    @property
+    def cancelled(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_cancel_checkpoints_and_raises(checkpoint_file, monkeypatch):
+    monkeypatch.setattr(DFS, "STOP_CHECK_STEPS", 1)
+    season_results = SyntheticSeason(nteams=14, win_model="split").generate()
+    unbudgeted = DFS(season_results, max_workers=0, resume=False)
+    unbudgeted.process_season(save_output=False)
+
+    dfs = DFS(season_results, max_workers=0, cancel_token=_CancelAfter(50))
+    with pytest.raises(SearchCancelledError):
+        dfs.process_season(save_output=False)
+    assert checkpoint_file.exists()
+
+    # picks up where the cancelled search left off
+    dfs = DFS(season_results, max_workers=0)
+    dfs.process_season(save_output=False)
+    assert dfs.traversal_output.proven_optimal
+    assert not checkpoint_file.exists()
+    assert dfs.dfs_steps >= unbudgeted.dfs_steps
+
+
+def test_process_season_async_streams_progress(dfs, season_results, make_game):
+    season_results.add_game_result(make_game(5, 3, 2, 3, 15))
+    season_results.add_game_result(make_game(6, 3, 4, 1, 16))
+
+    async def solve():
+        queue = asyncio.Queue()
+        await dfs.process_season_async(progress_queue=queue)
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    snapshots = asyncio.run(solve())
+    assert snapshots
+    assert snapshots[-1].best_bound == datetime(2025, 3, 16)
+    assert not dfs.progress_listeners
+
+
+def test_process_season_async_cancelled(checkpoint_file):
+    season_results = SyntheticSeason(nteams=18, win_model="split").generate()
+    dfs = DFS(season_results)
+
+    async def solve_then_cancel():
+        task = asyncio.create_task(dfs.process_season_async(save_output=False))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(solve_then_cancel())
+    assert dfs.cancel_token.cancelled
+    assert dfs.cancelled
+    # the search had wound up and checkpointed before the cancellation came through
+    assert checkpoint_file.exists()
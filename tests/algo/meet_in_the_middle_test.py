@@ -0,0 +1,76 @@
+import pytest
+from algo import DFS, MeetInTheMiddle, SearchCancelledError
+from models import SyntheticSeason
+
+
+@pytest.mark.parametrize(
+    "synthetic_season",
+    [
+        SyntheticSeason(nteams=nteams, win_model=win_model, seed=seed)
+        for nteams in (5, 8, 11)
+        for win_model in ("uniform", "strength", "split")
+        for seed in range(2)
+    ]
+    + [
+        SyntheticSeason(nteams=7, fixture="random", nrounds=8, seed=seed)
+        for seed in range(4)
+    ],
+    ids=lambda synthetic_season: synthetic_season.name,
+)
+def test_same_first_cycle_as_dfs(synthetic_season):
+    season_results = synthetic_season.generate()
+    dfs = DFS(season_results, max_workers=0, resume=False)
+    dfs.process_season(save_output=False)
+    mitm = MeetInTheMiddle(season_results, resume=False)
+    mitm.process_season(save_output=False)
+
+    expected = dfs.traversal_output.first_hamiltonian_cycle
+    found = mitm.traversal_output.first_hamiltonian_cycle
+    if expected is None:
+        assert found is None
+        return
+    # ties can be a different cycle, just as early
+    assert found.max_date == expected.max_date
+    assert sorted(found.cycle) == season_results.team_ids
+    assert len(found.games) == season_results.nteams
+    assert max(game.date for game in found.games) == found.max_date
+
+
+class _CancelAfter:
+    def __init__(self, checks):
+        self.checks = checks
+
+    @property
+    def cancelled(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_cancelled_leaves_whole_round(tmp_path, monkeypatch):
+    checkpoint_file = tmp_path / "checkpoint.json"
+    monkeypatch.setattr(DFS, "checkpoint_file", property(lambda self: checkpoint_file))
+    monkeypatch.setattr(DFS, "STOP_CHECK_STEPS", 1)
+    season_results = SyntheticSeason(nteams=14, win_model="split").generate()
+    mitm = MeetInTheMiddle(season_results, cancel_token=_CancelAfter(5))
+    with pytest.raises(SearchCancelledError):
+        mitm.process_season(save_output=False)
+    # halves are no use until joined, so the whole round is left to do
+    checkpoint = mitm._load_checkpoint()
+    assert len(checkpoint.frontier) == 1
+    assert len(checkpoint.frontier[0]) == 1
+
+    # and a plain DFS doesn't pick up a checkpoint from another solver
+    assert DFS(season_results)._load_checkpoint() is None
+
+    mitm = MeetInTheMiddle(season_results)
+    mitm.process_season(save_output=False)
+    assert mitm.traversal_output.proven_optimal
+    assert not checkpoint_file.exists()
+
+
+def test_time_budget_rejected():
+    season_results = SyntheticSeason(nteams=8).generate()
+    with pytest.raises(ValueError):
+        MeetInTheMiddle(season_results, time_budget=10).process_season(
+            save_output=False
+        )
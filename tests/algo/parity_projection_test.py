@@ -0,0 +1,131 @@
+import pytest
+from algo import DFS, ParityProjection
+from models import ScheduledGame, SeasonResults, SyntheticSeason
+
+
+def _split_season(synthetic_season, completed_rounds):
+    """the synthetic season as if only the first few rounds had been played"""
+    season_results = synthetic_season.generate()
+    completed = SeasonResults(
+        season=season_results.season, round_results={}, teams=season_results.teams
+    )
+    fixture = []
+    for round_results in season_results:
+        for game in round_results:
+            if game.round <= completed_rounds:
+                completed.add_game_result(game)
+            else:
+                fixture.append(ScheduledGame.from_game_result(game))
+    return season_results, completed, fixture
+
+
+def _first_cycle_round(season_results):
+    dfs = DFS(season_results, max_workers=0, resume=False)
+    dfs.process_season(save_output=False)
+    first_hamiltonian_cycle = dfs.traversal_output.first_hamiltonian_cycle
+    return first_hamiltonian_cycle.max_round if first_hamiltonian_cycle else None
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_certain_results_same_as_dfs(seed):
+    synthetic_season = SyntheticSeason(
+        nteams=10, fixture="random", nrounds=14, seed=seed
+    )
+    season_results, completed, fixture = _split_season(synthetic_season, 2)
+    # every game left sure to go the way it actually did
+    results = {
+        game.id: game for round_results in season_results for game in round_results
+    }
+    home_win_probabilities = {
+        game.id: 1.0 if results[game.id].winnerteamid == game.hteamid else 0.0
+        for game in fixture
+    }
+    output = ParityProjection(
+        completed,
+        fixture,
+        samples=20,
+        max_workers=0,
+        home_win_probabilities=home_win_probabilities,
+    ).project()
+
+    first_cycle_round = _first_cycle_round(season_results)
+    assert not output.already_found
+    if first_cycle_round is None:
+        assert output.cycle_probability == 0.0
+        assert output.expected_round is None
+    else:
+        assert output.cycle_probability == 1.0
+        assert output.round_probabilities == {first_cycle_round: 1.0}
+        # every sample the same, only the first one needed searching
+        assert output.cache_hits
+
+
+def test_already_found():
+    season_results = SyntheticSeason(nteams=8, seed=1).generate()
+    first_cycle_round = _first_cycle_round(season_results)
+    assert first_cycle_round is not None
+    output = ParityProjection(season_results, [], max_workers=0).project()
+    assert output.already_found
+    assert output.cycle_probability == 1.0
+    assert output.first_cycle_round == first_cycle_round
+
+
+@pytest.mark.parametrize("win_model", ["coin", "record", "percentage"])
+def test_probabilities(win_model):
+    _, completed, fixture = _split_season(
+        SyntheticSeason(nteams=12, fixture="random", nrounds=16, seed=3), 3
+    )
+    output = ParityProjection(
+        completed, fixture, win_model=win_model, samples=200, max_workers=0
+    ).project()
+    assert 0.0 < output.cycle_probability <= 1.0
+    assert sum(output.round_probabilities.values()) == pytest.approx(
+        output.cycle_probability
+    )
+    assert 4 <= min(output.round_probabilities)
+    assert max(output.round_probabilities) <= 16
+    assert 4 <= output.expected_round <= 16
+    assert output.searches
+
+
+def test_same_across_workers():
+    _, completed, fixture = _split_season(
+        SyntheticSeason(nteams=12, fixture="random", nrounds=16, seed=5), 3
+    )
+    inline = ParityProjection(completed, fixture, samples=250, max_workers=0).project()
+    pooled = ParityProjection(completed, fixture, samples=250, max_workers=2).project()
+    assert pooled.cycle_probability == inline.cycle_probability
+    assert pooled.round_probabilities == inline.round_probabilities
+
+
+def test_win_models():
+    season_results = SyntheticSeason(nteams=6, win_model="ladder").generate()
+    fixture = [
+        ScheduledGame.from_game_result(next(iter(season_results.get_round_results(1))))
+    ]
+    game = fixture[0]
+    # the lower team id has won every game so far
+    favourite_home = game.hteamid < game.ateamid
+    for win_model in ("record", "percentage"):
+        projection = ParityProjection(season_results, fixture, win_model=win_model)
+        home_win_probability = projection.home_win_probability(
+            game, projection._team_win_ratios()
+        )
+        assert (home_win_probability > 0.5) == favourite_home
+    projection = ParityProjection(season_results, fixture, win_model="coin")
+    assert projection.home_win_probability(game, {}) == 0.5
+
+    with pytest.raises(ValueError):
+        ParityProjection(season_results, fixture, win_model="elo")
+
+
+def test_undecided_and_completed_games_left_out():
+    season_results, completed, fixture = _split_season(SyntheticSeason(nteams=6), 2)
+    undecided = fixture[-1].model_copy(
+        update={"id": 999, "hteamid": None, "ateamid": None}
+    )
+    already_played = ScheduledGame.from_game_result(
+        next(iter(completed.get_round_results(1)))
+    )
+    projection = ParityProjection(completed, fixture + [undecided, already_played])
+    assert projection.fixture == sorted(fixture, key=lambda game: game.date)
@@ -0,0 +1,66 @@
+import io
+import logging
+import time
+from datetime import datetime
+from algo.progress_reporter import ProgressReporter
+
+
+def test_progress_snapshots():
+    steps = [0]
+    snapshots = []
+    with ProgressReporter(
+        season=2025,
+        cur_round=3,
+        pairs_total=4,
+        dfs_steps=lambda: steps[0],
+        best_bound=lambda: datetime(2025, 3, 16),
+        logger=logging.getLogger("test"),
+        sample_interval=0.01,
+        listeners=[snapshots.append],
+    ) as progress:
+        steps[0] = 500
+        progress.pair_done()
+        time.sleep(0.05)
+
+    # sampled while running, and once more at the end
+    assert len(snapshots) >= 2
+    final = progress.latest
+    assert final is snapshots[-1]
+    assert final.pairs_done == 1
+    assert final.fraction_explored == 0.25
+    assert final.dfs_steps == 500
+    assert final.eta_seconds is not None
+    assert final.best_bound == datetime(2025, 3, 16)
+    assert "Explored: 1/4 (25.0%)" in str(final)
+
+
+def test_no_eta_before_first_pair():
+    with ProgressReporter(
+        season=2025,
+        cur_round=1,
+        pairs_total=2,
+        dfs_steps=lambda: 0,
+        best_bound=lambda: None,
+        logger=logging.getLogger("test"),
+    ) as progress:
+        pass
+    assert progress.latest.eta_seconds is None
+    assert "ETA: ?" in str(progress.latest)
+
+
+def test_live_display_only_on_a_terminal():
+    stream = io.StringIO()
+    with ProgressReporter(
+        season=2025,
+        cur_round=1,
+        pairs_total=1,
+        dfs_steps=lambda: 0,
+        best_bound=lambda: None,
+        logger=logging.getLogger("test"),
+        live_display=True,
+        sample_interval=0.01,
+        stream=stream,
+    ) as progress:
+        time.sleep(0.03)
+    assert progress.live_display is False
+    assert stream.getvalue() == ""
@@ -0,0 +1,105 @@
+import itertools
+import json
+import pytest
+from algo import DFS, TopCycles
+from algo.data_structures import EdgeDateIndex
+from models import SyntheticSeason
+
+
+def _every_cycle_date(season_results):
+    """max date of every hamiltonian cycle, by trying every ordering"""
+    edge_dates = EdgeDateIndex.from_season(season_results)
+    first, *others = season_results.team_ids
+    dates = []
+    for order in itertools.permutations(others):
+        cycle = [first, *order]
+        edges = list(zip(cycle, cycle[1:] + cycle[:1]))
+        if all(edge in edge_dates.first_games for edge in edges):
+            dates.append(max(edge_dates.first_games[edge].date for edge in edges))
+    return sorted(dates)
+
+
+@pytest.mark.parametrize(
+    "synthetic_season",
+    [
+        SyntheticSeason(
+            nteams=nteams,
+            fixture="random",
+            nrounds=nteams + 3,
+            win_model=win_model,
+            seed=seed,
+        )
+        for nteams in (5, 7, 8)
+        for win_model in ("uniform", "strength", "split")
+        for seed in range(2)
+    ],
+    ids=lambda synthetic_season: synthetic_season.name,
+)
+def test_same_as_every_ordering(synthetic_season):
+    season_results = synthetic_season.generate()
+    every_cycle_date = _every_cycle_date(season_results)
+    top_cycles = TopCycles.find(season_results, 10)
+    assert [cycle.max_date for cycle in top_cycles] == every_cycle_date[:10]
+
+    canonical_cycles = {tuple(cycle.cycle) for cycle in top_cycles}
+    assert len(canonical_cycles) == len(top_cycles)
+    for cycle in top_cycles:
+        assert cycle.cycle[0] == min(cycle.cycle)
+        assert sorted(cycle.cycle) == sorted(season_results.team_ids)
+        assert [game.winnerteamid for game in cycle.games] == cycle.cycle
+        assert [game.loserteamid for game in cycle.games] == (
+            cycle.cycle[1:] + cycle.cycle[:1]
+        )
+
+
+def test_canonical():
+    assert TopCycles.canonical([5, 3, 9, 1, 4]) == (1, 4, 5, 3, 9)
+    assert TopCycles.canonical([1, 2, 3]) == (1, 2, 3)
+
+
+def test_no_cycles():
+    season_results = SyntheticSeason(
+        nteams=6, fixture="round_robin", win_model="strength", seed=0
+    ).generate()
+    # a strict order of strength, the top team never loses
+    assert TopCycles.find(season_results, 5) == []
+    assert TopCycles.find(season_results, 0) == []
+
+
+def test_dfs_output(tmp_path, monkeypatch):
+    season_results = SyntheticSeason(
+        nteams=8, fixture="random", nrounds=12, win_model="uniform", seed=1
+    ).generate()
+    monkeypatch.setattr(DFS, "output_file", tmp_path / "output.json")
+
+    dfs = DFS(season_results, max_workers=0, resume=False, top_cycles=3)
+    dfs.process_season()
+    first_cycle = dfs.traversal_output.first_hamiltonian_cycle
+    top_cycles = dfs.traversal_output.top_hamiltonian_cycles
+    assert first_cycle and len(top_cycles) == 3
+    assert top_cycles[0].max_date == first_cycle.max_date
+    assert top_cycles[0].max_date <= top_cycles[1].max_date <= top_cycles[2].max_date
+
+    data = json.loads((tmp_path / "output.json").read_text())
+    assert [cycle["cycle"] for cycle in data["top_hamiltonian_cycles"]] == [
+        cycle.cycle for cycle in top_cycles
+    ]
+
+    # not asked for, not in the output
+    DFS(season_results, max_workers=0, resume=False).process_season()
+    data = json.loads((tmp_path / "output.json").read_text())
+    assert "top_hamiltonian_cycles" not in data
+
+
+def test_skipped_when_not_proven():
+    season_results = SyntheticSeason(
+        nteams=8, fixture="random", nrounds=12, win_model="uniform", seed=1
+    ).generate()
+    dfs = DFS(season_results, max_workers=0, resume=False, top_cycles=3)
+    dfs.process_season(save_output=False)
+    assert dfs.traversal_output.top_hamiltonian_cycles
+
+    # out of time, the first cycle found may not be the first there is
+    dfs.traversal_output.proven_optimal = False
+    dfs._record_top_cycles()
+    assert dfs.traversal_output.top_hamiltonian_cycles == []
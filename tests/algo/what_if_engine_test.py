@@ -0,0 +1,126 @@
+import itertools
+import pytest
+from algo import WhatIfEngine
+from algo.data_structures import GameTimeline
+from models import ScheduledGame, SeasonResults, SyntheticSeason
+
+
+def _season_upto(season_results, games):
+    played = SeasonResults(
+        season=season_results.season, round_results={}, teams=season_results.teams
+    )
+    for game in games:
+        played.add_game_result(game)
+    return played
+
+
+def _has_cycle(team_ids, edges):
+    """every ordering of the teams, only for the small seasons"""
+    first, *others = team_ids
+    for order in itertools.permutations(others):
+        cycle = [first, *order]
+        if all((a, b) in edges for a, b in zip(cycle, cycle[1:] + cycle[:1])):
+            return True
+    return False
+
+
+def test_completing_game():
+    season_results = SyntheticSeason(nteams=8, seed=1).generate()
+    games = list(GameTimeline.from_season(season_results))
+    engine = WhatIfEngine(season_results)
+    assert engine.complete
+    completing_index = games.index(engine.first_cycle_game)
+
+    # as things stood just before the game that completed parity
+    engine = WhatIfEngine(_season_upto(season_results, games[:completing_index]))
+    assert not engine.complete
+    game = games[completing_index]
+    result = engine.what_if(game.winnerteamid, game.loserteamid)
+    assert result.completes_parity
+    assert result.new_edge
+    assert sorted(result.cycle) == season_results.team_ids
+    assert result.cycle[:2] == [game.winnerteamid, game.loserteamid]
+    assert result.cycle_names[0] == season_results.get_team(game.winnerteamid).name
+    # asked again, same answer without searching again
+    searches = engine.sweep.searches
+    assert engine.what_if(game.winnerteamid, game.loserteamid) is result
+    assert engine.sweep.searches == searches
+
+    # and once it has actually happened
+    assert engine.add_result(game)
+    assert engine.complete
+    assert engine.what_if(game.loserteamid, game.winnerteamid).already_complete
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_same_as_every_ordering(seed):
+    season_results = SyntheticSeason(
+        nteams=7, fixture="random", nrounds=10, seed=seed
+    ).generate()
+    games = list(GameTimeline.from_season(season_results))
+    for upto in range(len(games)):
+        engine = WhatIfEngine(_season_upto(season_results, games[:upto]))
+        if engine.complete:
+            break
+        edges = {(game.winnerteamid, game.loserteamid) for game in games[:upto]}
+        for winner, loser in itertools.permutations(season_results.team_ids, 2):
+            result = engine.what_if(winner, loser)
+            assert result.new_edge == ((winner, loser) not in edges)
+            assert result.completes_parity == _has_cycle(
+                season_results.team_ids, edges | {(winner, loser)}
+            )
+
+
+def test_what_if_game():
+    season_results = SyntheticSeason(nteams=6, seed=2).generate()
+    games = list(GameTimeline.from_season(season_results))
+    engine = WhatIfEngine(_season_upto(season_results, games[:8]))
+    game = ScheduledGame.from_game_result(games[8])
+    home_win, away_win = engine.what_if_game(game)
+    assert (home_win.winner, home_win.loser) == (game.hteamid, game.ateamid)
+    assert (away_win.winner, away_win.loser) == (game.ateamid, game.hteamid)
+
+    with pytest.raises(ValueError):
+        engine.what_if_game(game.model_copy(update={"ateamid": None}))
+    with pytest.raises(ValueError):
+        engine.what_if(game.hteamid, 99)
+    with pytest.raises(ValueError):
+        engine.what_if(game.hteamid, game.hteamid)
+
+
+def test_add_result_forgets_answers():
+    season_results = SyntheticSeason(nteams=6, seed=2).generate()
+    games = list(GameTimeline.from_season(season_results))
+    engine = WhatIfEngine(_season_upto(season_results, games[:8]))
+    engine.what_if(games[8].winnerteamid, games[8].loserteamid)
+    assert engine.answers
+    engine.add_result(games[8])
+    assert not engine.answers
+    assert not engine.what_if(games[8].winnerteamid, games[8].loserteamid).new_edge
+
+
+def test_teams_yet_to_play_from_fixture():
+    season_results = SyntheticSeason(nteams=6, seed=2).generate()
+    games = list(GameTimeline.from_season(season_results))
+    fixture = [ScheduledGame.from_game_result(game) for game in games]
+
+    # before a game is played, every team is only in the fixture
+    played = _season_upto(season_results, [])
+    played.remove_unused_teams()
+    engine = WhatIfEngine(played, fixture)
+    assert engine.team_ids == season_results.team_ids
+    home_win, _ = engine.what_if_game(fixture[0])
+    assert home_win.winner_name == fixture[0].hteamname
+
+    # part way through the opening round, the teams yet to play are kept warm too
+    played = _season_upto(season_results, games[:1])
+    played.remove_unused_teams()
+    assert played.nteams == 2
+    engine = WhatIfEngine(played, fixture[1:])
+    assert engine.team_ids == season_results.team_ids
+    assert len(engine.what_if_game(fixture[1])) == 2
+    for game in games[1:]:
+        if engine.add_result(game):
+            break
+    assert engine.complete
+    assert engine.first_cycle_game == WhatIfEngine(season_results).first_cycle_game
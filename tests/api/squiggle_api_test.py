@@ -0,0 +1,93 @@
+import json
+from datetime import datetime
+from api.squiggle_api import SquiggleAPI
+
+
+def _game_record(**overrides):
+    record = {
+        "id": 35809,
+        "round": 13,
+        "roundname": "Round 13",
+        "hteamid": 17,
+        "ateamid": 12,
+        "hscore": 65,
+        "ascore": 74,
+        "hteam": "West Coast",
+        "ateam": "North Melbourne",
+        "winnerteamid": 12,
+        "winner": "North Melbourne",
+        "date": "2024-06-08 16:35:00",
+        "venue": "Perth Stadium",
+        "complete": 100,
+    }
+    record.update(overrides)
+    return record
+
+
+def test_parse_season_results():
+    body = json.dumps({"games": [_game_record()]}).encode()
+    games = SquiggleAPI.parse_season_results(body)
+    assert len(games) == 1
+    game = games[0]
+    assert game.id == 35809
+    assert game.hteamname == "West Coast"
+    assert game.ateamname == "North Melbourne"
+    assert game.wteamname == "North Melbourne"
+    assert game.winnerteamid == 12
+    assert game.loserteamid == 17
+    assert game.date == datetime(2024, 6, 8, 16, 35)
+
+
+def test_parse_season_results_draw():
+    body = json.dumps(
+        {"games": [_game_record(winnerteamid=0, winner=None, hscore=70, ascore=70)]}
+    ).encode()
+    game = SquiggleAPI.parse_season_results(body)[0]
+    assert game.winnerteamid is None
+    assert game.wteamname is None
+    assert game.loserteamid is None
+
+
+def test_parse_teams():
+    team_data = {
+        "teams": [
+            {"id": 1, "name": "Adelaide", "abbrev": "ADE", "logo": "/images/ade.png"}
+        ]
+    }
+    teams = SquiggleAPI.parse_teams(team_data)
+    assert len(teams) == 1
+    assert teams[0].id == 1
+    assert teams[0].logo_url == "https://squiggle.com.au/images/ade.png"
+    assert teams[0].logo_filename == "ade.png"
+
+
+def test_parse_fixture():
+    upcoming = _game_record(
+        id=36000,
+        hscore=None,
+        ascore=None,
+        winnerteamid=None,
+        winner=None,
+        complete=0,
+        date="2024-07-06 13:45:00",
+    )
+    # finals are fixtured before the teams in them are known
+    final = _game_record(
+        id=36001,
+        round=25,
+        roundname="Grand Final",
+        hteamid=None,
+        ateamid=None,
+        hteam=None,
+        ateam=None,
+        complete=0,
+        date="2024-09-28 14:30:00",
+    )
+    body = json.dumps({"games": [upcoming, final]}).encode()
+    games = SquiggleAPI.parse_fixture(body)
+    assert [game.id for game in games] == [36000, 36001]
+    assert games[0].hteamname == "West Coast"
+    assert games[0].teams_decided
+    assert games[0].date == datetime(2024, 7, 6, 13, 45)
+    assert games[1].hteamid is None
+    assert not games[1].teams_decided
@@ -0,0 +1,54 @@
+import pytest
+import run_benchmarks
+from unittest.mock import patch
+from run_benchmarks import load_fixtures, benchmark_season, compare_to_baseline
+from models import SeasonResults
+
+
+@pytest.fixture
+def season_results(make_team, make_game):
+    season_results = SeasonResults(season=2025, round_results={}, teams={})
+    for teamid in range(1, 5):
+        season_results.add_team(make_team(teamid))
+    for gameid, (rnd, winner, loser, day) in enumerate(
+        [(1, 1, 2, 1), (1, 3, 4, 2), (2, 2, 3, 8), (2, 4, 1, 9)], start=1
+    ):
+        season_results.add_game_result(make_game(gameid, rnd, winner, loser, day))
+    return season_results
+
+
+def test_fixture_round_trip_and_benchmark(tmp_path, season_results):
+    (tmp_path / "2025.json").write_text(season_results.model_dump_json(indent=1))
+    fixtures = load_fixtures(tmp_path)
+    assert list(fixtures) == ["2025"]
+
+    result = benchmark_season(fixtures["2025"], repeat=1)
+    assert result["season"] == 2025
+    assert result["cycle_date"] == "2025-03-09 00:00:00"
+    assert result["dfs_steps"] > 0
+    assert result["peak_memory_bytes"] > 0
+
+
+def test_compare_to_baseline():
+    baseline = {"2025": {"cycle_date": "2025-03-09", "dfs_steps": 10, "wall_time": 1.0}}
+    assert compare_to_baseline(baseline, baseline) == []
+
+    slower = {"2025": {"cycle_date": "2025-03-09", "dfs_steps": 12, "wall_time": 2.0}}
+    regressions = compare_to_baseline(slower, baseline)
+    assert len(regressions) == 2
+
+    different = {
+        "2025": {"cycle_date": "2025-03-16", "dfs_steps": 10, "wall_time": 1.0}
+    }
+    assert "cycle date" in compare_to_baseline(different, baseline)[0]
+
+
+def test_no_fixtures_falls_back_to_synthetic(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(run_benchmarks, "FALLBACK_SYNTHETIC_NTEAMS", [6])
+    monkeypatch.setattr(run_benchmarks, "FALLBACK_SYNTHETIC_MODELS", ["uniform"])
+    baseline_file = tmp_path / "baseline.json"
+    argv = ["run_benchmarks.py", "--fixtures-dir", str(tmp_path), "--repeat", "1"]
+    with patch("sys.argv", argv + ["--save-baseline", str(baseline_file)]):
+        assert run_benchmarks.main() == 0
+    assert "benchmarking generated seasons instead" in capsys.readouterr().out
+    assert "synthetic_6_round_robin_uniform_s0" in baseline_file.read_text()
@@ -0,0 +1,40 @@
+import pytest
+from datetime import datetime
+from models import GameResult, Team
+
+
+def _team(teamid):
+    return Team(
+        id=teamid,
+        name=f"Team {teamid}",
+        abbrev=f"T{teamid}",
+        logo_url=f"http://example.com/{teamid}.png",
+    )
+
+
+def _game(gameid, rnd, winner, loser, day):
+    """the home team wins, on that day of march 2025"""
+    return GameResult(
+        id=gameid,
+        round=rnd,
+        roundname=f"Round {rnd}",
+        hteamid=winner,
+        ateamid=loser,
+        hscore=100,
+        ascore=90,
+        winnerteamid=winner,
+        hteamname=f"Team {winner}",
+        ateamname=f"Team {loser}",
+        wteamname=f"Team {winner}",
+        date=datetime(2025, 3, day),
+    )
+
+
+@pytest.fixture
+def make_team():
+    return _team
+
+
+@pytest.fixture
+def make_game():
+    return _game
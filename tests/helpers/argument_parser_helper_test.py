@@ -64,3 +64,177 @@ def test_validate_season():
     helper.args.season = "invalid"
     with pytest.raises(SystemExit):
         helper.validate_season(helper.args.season)
+
+
+def test_argument_parser_watch_helper():
+    test_args = ["run_pytest_script.py", "--season", "2025", "--watch"]
+    with patch("sys.argv", test_args):
+        helper = ArgumentParserHelper()
+        assert helper.args.watch is True
+        assert helper.args.poll_interval == 300
+
+    test_args = ["run_pytest_script.py", "--season", "all", "--watch"]
+    with patch("sys.argv", test_args):
+        with pytest.raises(SystemExit):
+            ArgumentParserHelper()
+
+
+def test_argument_parser_force_helper():
+    test_args = ["run_pytest_script.py", "--force"]
+    with patch("sys.argv", test_args):
+        helper = ArgumentParserHelper()
+        assert helper.args.force is True
+
+
+def test_argument_parser_status_helper():
+    test_args = ["run_pytest_script.py", "--season", "2024", "--status"]
+    with patch("sys.argv", test_args):
+        helper = ArgumentParserHelper()
+        assert helper.args.status is True
+
+    test_args = ["run_pytest_script.py", "--season", "all", "--status"]
+    with patch("sys.argv", test_args):
+        with pytest.raises(SystemExit):
+            ArgumentParserHelper()
+
+
+def test_argument_parser_profile_helper():
+    with patch("sys.argv", ["run_pytest_script.py"]):
+        assert ArgumentParserHelper().args.profile is None
+
+    with patch("sys.argv", ["run_pytest_script.py", "--profile"]):
+        assert ArgumentParserHelper().args.profile == "cprofile"
+
+    test_args = [
+        "run_pytest_script.py",
+        "--profile",
+        "sampling",
+        "--profile-interval",
+        "2",
+    ]
+    with patch("sys.argv", test_args):
+        helper = ArgumentParserHelper()
+        assert helper.args.profile == "sampling"
+        assert helper.args.profile_interval == 2.0
+
+    with patch("sys.argv", ["run_pytest_script.py", "--profile", "--watch"]):
+        with pytest.raises(SystemExit):
+            ArgumentParserHelper()
+
+
+def test_argument_parser_time_budget_helper():
+    with patch("sys.argv", ["run_pytest_script.py", "--time-budget", "90"]):
+        assert ArgumentParserHelper().args.time_budget == 90.0
+
+    for test_args in (
+        ["run_pytest_script.py", "--time-budget", "0"],
+        ["run_pytest_script.py", "--time-budget", "90", "--watch"],
+        ["run_pytest_script.py", "--time-budget", "90", "--solver", "mitm"],
+        ["run_pytest_script.py", "--time-budget", "90", "--solver", "sweep"],
+    ):
+        with patch("sys.argv", test_args):
+            with pytest.raises(SystemExit):
+                ArgumentParserHelper()
+
+
+def test_argument_parser_solver_helper():
+    with patch("sys.argv", ["run_pytest_script.py"]):
+        args = ArgumentParserHelper().args
+        assert args.solver == "dfs"
+        assert args.output_options["solver"] == "dfs"
+
+    with patch("sys.argv", ["run_pytest_script.py", "--solver", "mitm"]):
+        assert ArgumentParserHelper().args.solver == "mitm"
+
+    with patch("sys.argv", ["run_pytest_script.py", "--solver", "sweep"]):
+        assert ArgumentParserHelper().args.solver == "sweep"
+
+    with patch("sys.argv", ["run_pytest_script.py", "--solver", "bfs"]):
+        with pytest.raises(SystemExit):
+            ArgumentParserHelper()
+
+
+def test_argument_parser_compact_output_helper():
+    with patch("sys.argv", ["run_pytest_script.py"]):
+        assert ArgumentParserHelper().args.compact_output is False
+
+    with patch("sys.argv", ["run_pytest_script.py", "--compact-output"]):
+        args = ArgumentParserHelper().args
+        assert args.compact_output is True
+        assert args.output_options["compact_output"] is True
+
+
+def test_argument_parser_project_helper():
+    with patch("sys.argv", ["run_pytest_script.py", "--season", "2025", "--project"]):
+        args = ArgumentParserHelper().args
+        assert args.project is True
+        assert args.samples == 1000
+        assert args.win_model == "record"
+        assert args.seed == 0
+
+    test_args = [
+        "run_pytest_script.py",
+        "--project",
+        "--samples",
+        "50",
+        "--win-model",
+        "coin",
+        "--seed",
+        "7",
+    ]
+    with patch("sys.argv", test_args):
+        args = ArgumentParserHelper().args
+        assert (args.samples, args.win_model, args.seed) == (50, "coin", 7)
+
+    for test_args in (
+        ["run_pytest_script.py", "--season", "all", "--project"],
+        ["run_pytest_script.py", "--project", "--watch"],
+        ["run_pytest_script.py", "--project", "--samples", "0"],
+        ["run_pytest_script.py", "--project", "--win-model", "elo"],
+    ):
+        with patch("sys.argv", test_args):
+            with pytest.raises(SystemExit):
+                ArgumentParserHelper()
+
+
+def test_argument_parser_what_if_helper():
+    with patch("sys.argv", ["run_pytest_script.py"]):
+        assert ArgumentParserHelper().args.what_if is False
+
+    with patch("sys.argv", ["run_pytest_script.py", "--season", "2025", "--what-if"]):
+        assert ArgumentParserHelper().args.what_if is True
+
+    for test_args in (
+        ["run_pytest_script.py", "--season", "all", "--what-if"],
+        ["run_pytest_script.py", "--what-if", "--watch"],
+        ["run_pytest_script.py", "--what-if", "--project"],
+    ):
+        with patch("sys.argv", test_args):
+            with pytest.raises(SystemExit):
+                ArgumentParserHelper()
+
+
+def test_argument_parser_count_cycles_helper():
+    with patch("sys.argv", ["run_pytest_script.py"]):
+        assert ArgumentParserHelper().args.count_cycles is False
+
+    with patch("sys.argv", ["run_pytest_script.py", "-s", "all", "--count-cycles"]):
+        assert ArgumentParserHelper().args.count_cycles is True
+
+    with patch("sys.argv", ["run_pytest_script.py", "--count-cycles", "--watch"]):
+        with pytest.raises(SystemExit):
+            ArgumentParserHelper()
+
+
+def test_argument_parser_top_cycles_helper():
+    with patch("sys.argv", ["run_pytest_script.py"]):
+        assert ArgumentParserHelper().args.top_cycles == 0
+
+    with patch("sys.argv", ["run_pytest_script.py", "--top-cycles", "5"]):
+        args = ArgumentParserHelper().args
+        assert args.top_cycles == 5
+        assert args.output_options["top_cycles"] == 5
+
+    with patch("sys.argv", ["run_pytest_script.py", "--top-cycles", "-1"]):
+        with pytest.raises(SystemExit):
+            ArgumentParserHelper()
@@ -0,0 +1,51 @@
+import json
+import pytest
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from helpers import DatabaseHelper, OutputHelper
+
+OUTPUT_DIR = Path(__file__).parents[2] / "output"
+
+
+def _season_output(season):
+    with open(OUTPUT_DIR / str(season) / f"{season}_dfs_traversal_output.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def database(tmp_path):
+    return DatabaseHelper(tmp_path / "results.sqlite")
+
+
+def test_save_season(database):
+    database.save_season(2024, _season_output(2024))
+    database.save_season(1897, _season_output(1897))
+    assert database.seasons() == [1897, 2024]
+    # north melbourne (12) were in the 2024 cycle
+    assert database.seasons_with_team_in_first_cycle(12) == [2024]
+    assert database.seasons_by_cycle_date() == [(2024, 13, "2024-06-08 16:35:00")]
+
+
+def test_save_season_replaces(database):
+    database.save_season(2024, _season_output(2024))
+    database.save_season(2024, _season_output(2024))
+    assert database.seasons() == [2024]
+    assert database.seasons_with_team_in_first_cycle(12) == [2024]
+
+
+def test_rows_need_a_season(database):
+    database.save_season(2024, _season_output(2024))
+    with closing(database._connect()) as conn:
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute(
+                "INSERT INTO cycles (season, position, teamid) VALUES (1900, 0, 1)"
+            )
+
+
+def test_update_database(database, monkeypatch):
+    monkeypatch.setattr(OutputHelper, "_output_dir", staticmethod(lambda: OUTPUT_DIR))
+    OutputHelper.update_database(database, [2023, 2024])
+    assert database.seasons() == [2023, 2024]
+    by_date = database.seasons_by_cycle_date()
+    assert [season for season, _, _ in by_date] == [2023, 2024]
@@ -0,0 +1,86 @@
+import logging
+import pytest
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler
+from helpers import LoggerHelper
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(LoggerHelper, "LOG_DIR", tmp_path)
+    yield tmp_path
+    LoggerHelper.shutdown()
+
+
+def _log_lines(log_dir):
+    LoggerHelper.shutdown()
+    return [
+        line
+        for log_file in sorted(log_dir.rglob("*.log*"))
+        for line in log_file.read_text().splitlines()
+    ]
+
+
+def test_setup_is_idempotent(log_dir):
+    for _ in range(3):
+        logger = LoggerHelper.setup(datetime(2025, 3, 1), "test_idempotent")
+    assert sum(isinstance(h, QueueHandler) for h in logger.handlers) == 1
+    logger.info("only once")
+
+    lines = _log_lines(log_dir)
+    assert len([line for line in lines if "only once" in line]) == 1
+    # one file for the whole execution
+    assert [path.name for path in log_dir.rglob("*.log")] == [
+        "20250301_000000_main.log"
+    ]
+
+
+def test_debug_only_when_asked(log_dir):
+    logger = LoggerHelper.setup(datetime(2025, 3, 1), "test_debug")
+    assert not logger.isEnabledFor(logging.DEBUG)
+    logger.debug("not wanted")
+    logger = LoggerHelper.setup(datetime(2025, 3, 1), "test_debug", True)
+    logger.debug("wanted")
+    lines = _log_lines(log_dir)
+    assert not [line for line in lines if "not wanted" in line]
+    assert [line for line in lines if "wanted" in line]
+
+
+def test_context_and_threads(log_dir):
+    logger = LoggerHelper.setup(datetime(2025, 3, 1), "test_context")
+
+    def log_from_thread(pair):
+        thread_logger = LoggerHelper.context(logger, f"R1 {pair}")
+        for step in range(50):
+            thread_logger.info(f"step {step}")
+
+    threads = [threading.Thread(target=log_from_thread, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = _log_lines(log_dir)
+    assert len(lines) == 200
+    assert len([line for line in lines if "test_context" in line]) == 200
+    assert len([line for line in lines if "[R1 2] step" in line]) == 50
+
+
+def test_rotation(log_dir, monkeypatch):
+    monkeypatch.setattr(LoggerHelper, "LOG_FILE_MAX_BYTES", 2000)
+    monkeypatch.setattr(LoggerHelper, "LOG_FILE_BACKUPS", 2)
+    logger = LoggerHelper.setup(datetime(2025, 3, 1), "test_rotation")
+    for line in range(200):
+        logger.info(f"line {line}")
+    LoggerHelper.shutdown()
+    assert len(list(log_dir.rglob("*.log*"))) == 3
+
+
+def test_setup_after_shutdown(log_dir):
+    logger = LoggerHelper.setup(datetime(2025, 3, 1), "test_restart")
+    LoggerHelper.shutdown()
+    logger = LoggerHelper.setup(datetime(2025, 3, 2), "test_restart")
+    assert sum(isinstance(h, QueueHandler) for h in logger.handlers) == 1
+    logger.info("after")
+    assert [line for line in _log_lines(log_dir) if "after" in line]
@@ -0,0 +1,72 @@
+import pytest
+from datetime import datetime
+from helpers import ManifestHelper
+from models import SeasonResults, GameResult, Team
+
+
+def _season_results(game_ids):
+    season_results = SeasonResults(season=2025, round_results={}, teams={})
+    for teamid in (1, 2):
+        season_results.add_team(
+            Team(
+                id=teamid,
+                name=f"Team {teamid}",
+                abbrev=f"T{teamid}",
+                logo_url=f"http://example.com/{teamid}.png",
+            )
+        )
+    for gameid in game_ids:
+        season_results.add_game_result(
+            GameResult(
+                id=gameid,
+                round=gameid,
+                roundname=f"Round {gameid}",
+                hteamid=1,
+                ateamid=2,
+                hscore=100,
+                ascore=90,
+                winnerteamid=1,
+                hteamname="Team 1",
+                ateamname="Team 2",
+                wteamname="Team 1",
+                date=datetime(2025, 3, gameid),
+            )
+        )
+    return season_results
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ManifestHelper, "_output_dir", staticmethod(lambda: tmp_path))
+    return tmp_path
+
+
+def test_compute_input_hash_order_independent():
+    assert ManifestHelper.compute_input_hash(
+        _season_results([1, 2])
+    ) == ManifestHelper.compute_input_hash(_season_results([2, 1]))
+
+
+def test_compute_input_hash_changes_with_games():
+    assert ManifestHelper.compute_input_hash(
+        _season_results([1, 2])
+    ) != ManifestHelper.compute_input_hash(_season_results([1, 2, 3]))
+
+
+def test_is_up_to_date(output_dir):
+    input_hash = ManifestHelper.compute_input_hash(_season_results([1]))
+    output_file = output_dir / "2025" / "2025_dfs_traversal_output.json"
+    output_file.parent.mkdir(parents=True)
+    output_file.write_text("{}")
+
+    assert not ManifestHelper.is_up_to_date(2025, input_hash, "1", {})
+
+    ManifestHelper.write_manifest(2025, input_hash, "1", {}, [output_file])
+    assert ManifestHelper.is_up_to_date(2025, input_hash, "1", {})
+    # any of the inputs changing means it needs to be done again
+    assert not ManifestHelper.is_up_to_date(2025, "different", "1", {})
+    assert not ManifestHelper.is_up_to_date(2025, input_hash, "2", {})
+    assert not ManifestHelper.is_up_to_date(2025, input_hash, "1", {"a": 1})
+    # as does an output going missing
+    output_file.unlink()
+    assert not ManifestHelper.is_up_to_date(2025, input_hash, "1", {})
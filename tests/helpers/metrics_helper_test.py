@@ -0,0 +1,74 @@
+import json
+import pytest
+from helpers import MetricsHelper
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    MetricsHelper.reset()
+    yield
+    MetricsHelper.reset()
+
+
+def test_same_season_same_metrics():
+    assert MetricsHelper.get(2025) is MetricsHelper.get(2025)
+    assert MetricsHelper.get(2025) is not MetricsHelper.get(2024)
+
+
+def test_stages_counters_gauges():
+    metrics = MetricsHelper.get(2025)
+    with metrics.stage("solve", round=1):
+        pass
+    with metrics.stage("solve", round=2):
+        pass
+    metrics.increment("api_cache_hits")
+    metrics.increment("api_cache_hits")
+    metrics.set_counter("dfs_steps", 10)
+    metrics.set_counter("dfs_steps", 25)
+    metrics.set_gauge("season_seconds", 1.5)
+
+    snapshot = metrics.snapshot()
+    assert [stage["round"] for stage in snapshot["stages"]] == [1, 2]
+    assert snapshot["counters"] == {"api_cache_hits": 2, "dfs_steps": 25}
+    assert snapshot["gauges"] == {"season_seconds": 1.5}
+    assert set(metrics.stage_totals()) == {"solve"}
+
+
+def test_merge():
+    metrics = MetricsHelper.get(2025)
+    metrics.increment("logo_cache_hits", 2)
+    metrics.merge(
+        {
+            "stages": [{"stage": "render", "seconds": 0.5}],
+            "counters": {"logo_cache_hits": 3},
+        }
+    )
+    assert metrics.counters["logo_cache_hits"] == 5
+    assert metrics.stage_totals() == {"render": 0.5}
+
+
+def test_write_jsonl(tmp_path):
+    MetricsHelper.get(2024).record_stage("fetch_games", 0.25)
+    MetricsHelper.get(2025).record_stage("fetch_games", 0.5)
+    path = tmp_path / "metrics.jsonl"
+    MetricsHelper.write_jsonl([2025], path)
+    MetricsHelper.write_jsonl([2025], path)
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["season"] == 2025
+    assert lines[0]["stage_totals"] == {"fetch_games": 0.5}
+    assert lines[0]["peak_rss_bytes"] > 0
+
+
+def test_write_prometheus(tmp_path):
+    metrics = MetricsHelper.get(2025)
+    metrics.record_stage("solve", 2.0)
+    metrics.set_counter("dfs_steps", 100)
+    path = MetricsHelper.write_prometheus(tmp_path / "afl_parity.prom")
+
+    text = path.read_text()
+    assert 'afl_parity_stage_seconds{season="2025",stage="solve"} 2.000000' in text
+    assert "# TYPE afl_parity_dfs_steps_total counter" in text
+    assert 'afl_parity_dfs_steps_total{season="2025"} 100' in text
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,88 @@
+import json
+import pytest
+from helpers import OutputHelper
+
+
+def _write_season(output_dir, season, cycle=True):
+    season_dir = output_dir / str(season)
+    season_dir.mkdir(parents=True, exist_ok=True)
+    first_hamiltonian_cycle = (
+        {
+            "cycle": [1, 2],
+            "cycle_names": ["Team 1", "Team 2"],
+            "date": f"{season}-06-08 16:35:00",
+            "round": 13,
+            "games": [{"id": 1}],
+        }
+        if cycle
+        else None
+    )
+    with open(season_dir / f"{season}_dfs_traversal_output.json", "w") as f:
+        json.dump({"first_hamiltonian_cycle": first_hamiltonian_cycle}, f)
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(OutputHelper, "_output_dir", staticmethod(lambda: tmp_path))
+    (tmp_path / "logos").mkdir()
+    return tmp_path
+
+
+def _read_combined(output_dir):
+    with open(output_dir / "combined_outputs.json") as f:
+        return json.load(f)
+
+
+def test_combine_all_json_outputs(output_dir):
+    _write_season(output_dir, 2001)
+    _write_season(output_dir, 2000, cycle=False)
+    OutputHelper.combine_all_json_outputs()
+    combined = _read_combined(output_dir)
+    assert list(combined) == ["2000", "2001"]
+    assert combined["2000"]["first_hamiltonian_cycle"] is None
+    assert "games" not in combined["2001"]["first_hamiltonian_cycle"]
+
+
+def test_update_combined_outputs(output_dir):
+    _write_season(output_dir, 2000, cycle=False)
+    # no combined file yet, so it is built in full
+    OutputHelper.update_combined_outputs([2000])
+    assert list(_read_combined(output_dir)) == ["2000"]
+
+    # seasons not in the update are left as they are, even when their output changes
+    _write_season(output_dir, 2000)
+    _write_season(output_dir, 1999)
+    OutputHelper.update_combined_outputs([1999])
+    combined = _read_combined(output_dir)
+    assert list(combined) == ["1999", "2000"]
+    assert combined["2000"]["first_hamiltonian_cycle"] is None
+
+
+def test_update_combined_outputs_jsonl(output_dir):
+    _write_season(output_dir, 2000, cycle=False)
+    OutputHelper.update_combined_outputs([2000], jsonl=True)
+    _write_season(output_dir, 2000)
+    OutputHelper.update_combined_outputs([2000], jsonl=True)
+    combined = OutputHelper.read_combined_jsonl()
+    assert list(combined) == ["2000"]
+    assert combined["2000"]["first_hamiltonian_cycle"]["round"] == 13
+    assert combined == _read_combined(output_dir)
+
+
+def test_season_status(output_dir):
+    assert OutputHelper.season_status(2000) == "2000: not yet searched"
+    _write_season(output_dir, 2000, cycle=False)
+    assert OutputHelper.season_status(2000) == "2000: no hamiltonian cycle found"
+    _write_season(output_dir, 2000)
+    assert OutputHelper.season_status(2000).startswith(
+        "2000: hamiltonian cycle found in round 13"
+    )
+
+
+def test_season_status_unproven(output_dir):
+    _write_season(output_dir, 2000)
+    json_file = output_dir / "2000" / "2000_dfs_traversal_output.json"
+    data = json.loads(json_file.read_text())
+    data["proven_optimal"] = False
+    json_file.write_text(json.dumps(data))
+    assert OutputHelper.season_status(2000).endswith("not proven optimal)")
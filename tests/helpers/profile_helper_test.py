@@ -0,0 +1,74 @@
+import cProfile
+import logging
+import pstats
+import threading
+import time
+import pytest
+from helpers import ProfileHelper
+from helpers.profile_helper import SamplingProfiler
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        ProfileHelper, "_output_dir", staticmethod(lambda season: tmp_path)
+    )
+    return tmp_path
+
+
+def test_no_profile_does_nothing(output_dir):
+    with ProfileHelper.profile(2025, "solve", None, logging.getLogger("test")):
+        _busy(0.01)
+    assert list(output_dir.iterdir()) == []
+
+
+def test_cprofile(output_dir):
+    with ProfileHelper.profile(2025, "solve", "cprofile", logging.getLogger("test")):
+        _busy(0.05)
+
+    assert (output_dir / "2025_solve_profile.prof").exists()
+    collapsed = (output_dir / "2025_solve_profile.collapsed").read_text().splitlines()
+    assert any("profile_helper_test.py:_busy" in line for line in collapsed)
+    # stacks are "a;b;c value"
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+
+
+def test_collapsed_accounts_for_all_time():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _busy(0.05)
+    profiler.disable()
+    stats = pstats.Stats(profiler)
+    stacks = ProfileHelper.collapsed_from_stats(stats)
+    assert sum(stacks.values()) / 1e6 == pytest.approx(stats.total_tt, rel=0.05)
+
+
+def test_sampling_sees_other_threads(output_dir):
+    thread = threading.Thread(target=_busy, args=(0.2,))
+    with ProfileHelper.profile(
+        2025, "solve", "sampling", logging.getLogger("test"), interval=0.002
+    ):
+        thread.start()
+        thread.join()
+
+    collapsed = (output_dir / "2025_solve_profile.collapsed").read_text()
+    assert "profile_helper_test.py:_busy" in collapsed
+    assert not (output_dir / "2025_solve_profile.prof").exists()
+
+
+def test_top_functions_from_samples():
+    with SamplingProfiler(interval=0.002) as sampler:
+        thread = threading.Thread(target=_busy, args=(0.1,))
+        thread.start()
+        thread.join()
+    summary = ProfileHelper.top_functions_from_samples(sampler.samples, n=3)
+    assert summary.splitlines()[0].endswith("samples")
+    assert len(summary.splitlines()) <= 4
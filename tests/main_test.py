@@ -0,0 +1,31 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parents[1] / "src"
+HEAVY_MODULES = ["aiohttp", "pydantic", "matplotlib", "numpy"]
+
+
+def test_main_import_is_lightweight():
+    code = (
+        "import sys, main; "
+        f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]; "
+        "assert not loaded, loaded"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=SRC_DIR)
+
+
+def test_status_startup_time():
+    # best of a few runs, keeps this from being flaky on a busy machine
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "main.py", "--status", "--season", "2024"],
+            check=True,
+            cwd=SRC_DIR,
+            capture_output=True,
+        )
+        timings.append(time.perf_counter() - start)
+    assert min(timings) < 1.0
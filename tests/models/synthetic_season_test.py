@@ -0,0 +1,69 @@
+import pytest
+from pydantic import ValidationError
+from algo import DFS
+from models import SyntheticSeason
+
+
+def test_same_seed_same_season():
+    assert (
+        SyntheticSeason(
+            nteams=8, fixture="random", win_model="strength", seed=7
+        ).generate()
+        == SyntheticSeason(
+            nteams=8, fixture="random", win_model="strength", seed=7
+        ).generate()
+    )
+    assert (
+        SyntheticSeason(nteams=8, fixture="random", seed=7).generate()
+        != SyntheticSeason(nteams=8, fixture="random", seed=8).generate()
+    )
+
+
+@pytest.mark.parametrize("nteams", [6, 7, 20])
+def test_round_robin_everyone_plays_everyone_once(nteams):
+    season_results = SyntheticSeason(nteams=nteams).generate()
+    matchups = [
+        frozenset((game.hteamid, game.ateamid))
+        for round_results in season_results
+        for game in round_results
+    ]
+    assert season_results.nteams == nteams
+    assert len(matchups) == len(set(matchups)) == nteams * (nteams - 1) // 2
+
+
+def test_results_consistent():
+    season_results = SyntheticSeason(
+        nteams=10, nrounds=30, draw_probability=0.1
+    ).generate()
+    games = [game for round_results in season_results for game in round_results]
+    assert season_results.nrounds == 30
+    assert any(game.winnerteamid is None for game in games)
+    for game in games:
+        if game.winnerteamid:
+            assert game.wscore > game.lscore
+        else:
+            assert game.hscore == game.ascore
+
+
+@pytest.mark.parametrize("win_model", ["ladder", "split"])
+def test_no_cycle_models(win_model, monkeypatch):
+    dfs = DFS(SyntheticSeason(nteams=8, win_model=win_model).generate())
+    monkeypatch.setattr(dfs, "_save_output_to_file", lambda: None)
+    dfs.process_season()
+    assert dfs.traversal_output.first_hamiltonian_cycle is None
+    if win_model == "ladder":
+        # someone never won, ruled out without any searching
+        assert dfs.dfs_steps == 0
+
+
+def test_uniform_finds_cycle(monkeypatch):
+    dfs = DFS(SyntheticSeason(nteams=8).generate())
+    monkeypatch.setattr(dfs, "_save_output_to_file", lambda: None)
+    dfs.process_season()
+    assert dfs.traversal_output.first_hamiltonian_cycle is not None
+    assert len(dfs.traversal_output.first_hamiltonian_cycle.cycle) == 8
+
+
+def test_too_few_teams():
+    with pytest.raises(ValidationError):
+        SyntheticSeason(nteams=2)
@@ -0,0 +1,38 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from algo.data_structures import DFSTraversalOutput
+from models import SeasonResults
+from render import RenderPool, render_infographic
+from render.infographic import load_logo, preload_logos, _LOGO_CACHE
+
+
+def test_render_infographic_nothing_to_draw():
+    season_results = SeasonResults(season=2025, round_results={}, teams={})
+    assert render_infographic(season_results, DFSTraversalOutput()) is None
+
+
+def test_render_pool_nothing_to_draw():
+    season_results = SeasonResults(season=2025, round_results={}, teams={})
+    with RenderPool(max_workers=1) as render_pool:
+        future = render_pool.submit(season_results, DFSTraversalOutput())
+    assert future.result() is None
+
+
+def test_logo_cache(tmp_path):
+    logo_filepath = tmp_path / "logo.png"
+    plt.imsave(logo_filepath, np.zeros((4, 4, 3)))
+    preload_logos(tmp_path)
+    assert logo_filepath in _LOGO_CACHE
+    # the cached decode is handed back, not read from disk again
+    logo_filepath.unlink()
+    assert load_logo(logo_filepath) is _LOGO_CACHE[logo_filepath]
+
+
+def test_render_pool_metrics_make_it_back():
+    from helpers import MetricsHelper
+
+    MetricsHelper.reset(2025)
+    season_results = SeasonResults(season=2025, round_results={}, teams={})
+    with RenderPool(max_workers=1) as render_pool:
+        render_pool.submit(season_results, DFSTraversalOutput(), renderer="svg")
+    assert "render" in MetricsHelper.get(2025).stage_totals()
@@ -0,0 +1,80 @@
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+from datetime import datetime
+from algo.data_structures import DFSTraversalOutput, HamiltonianCycle
+from models import SeasonResults, GameResult, Team
+from render import BaseInfographic, SvgInfographic
+
+
+def _season_results_and_traversal_output():
+    season_results = SeasonResults(season=2025, round_results={}, teams={})
+    for teamid in (1, 2, 3):
+        season_results.add_team(
+            Team(
+                id=teamid,
+                name=f"Team {teamid}",
+                abbrev=f"T{teamid}",
+                logo_url=f"http://example.com/{teamid}.png",
+            )
+        )
+    hamiltonian_cycle = HamiltonianCycle(cycle=[1, 2, 3])
+    for gameid, (winner, loser) in enumerate([(1, 2), (2, 3), (3, 1)], start=1):
+        game = GameResult(
+            id=gameid,
+            round=gameid,
+            roundname=f"Round {gameid}",
+            hteamid=winner,
+            ateamid=loser,
+            hscore=100,
+            ascore=90,
+            winnerteamid=winner,
+            hteamname=f"Team {winner}",
+            ateamname=f"Team {loser}",
+            wteamname=f"Team {winner}",
+            date=datetime(2025, 3, gameid),
+        )
+        season_results.add_game_result(game)
+        hamiltonian_cycle.games.append(game)
+    traversal_output = DFSTraversalOutput()
+    traversal_output.update_first_hamiltonian_cycle(hamiltonian_cycle)
+    return season_results, traversal_output
+
+
+def test_build_svg():
+    season_results, traversal_output = _season_results_and_traversal_output()
+    svg = SvgInfographic(season_results, traversal_output).build_svg()
+    assert svg.startswith("<svg")
+    assert "Season 2025" in svg
+    assert "Round 3" in svg
+    assert svg.count("<image") == 3
+    assert svg.count("<line") == 3
+    assert 'href="../logos/1.png"' in svg
+    assert "100-90" in svg
+
+
+def test_build_svg_deterministic():
+    season_results, traversal_output = _season_results_and_traversal_output()
+    assert (
+        SvgInfographic(season_results, traversal_output).build_svg()
+        == SvgInfographic(season_results, traversal_output).build_svg()
+    )
+
+
+def test_build_svg_nothing_to_draw():
+    season_results, _ = _season_results_and_traversal_output()
+    assert SvgInfographic(season_results, DFSTraversalOutput()).build_svg() == ""
+
+
+def test_svg_does_not_import_matplotlib():
+    code = "import sys; import render; assert 'matplotlib' not in sys.modules"
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2] / "src"
+    )
+
+
+def test_base_infographic_is_abstract():
+    season_results, traversal_output = _season_results_and_traversal_output()
+    with pytest.raises(TypeError):
+        BaseInfographic(season_results, traversal_output)